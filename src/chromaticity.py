@@ -0,0 +1,414 @@
+##############################################################################
+#
+# Module: chromaticity.py
+#
+# Description:
+#     Incrementally maintained CIE 1931 xy and CIE 1976 u'v'
+#     chromaticity density grids for the stream plot, plus a live
+#     heat-map view window.
+#
+# Author:
+#     Vinay N, MCCI Corporation October 2026
+#
+# Revision history:
+#     V2.2.0 Mon Oct 2026 19:10:2026   Vinay N
+#       Module created
+#
+##############################################################################
+# Built-in imports
+import os
+import threading
+
+# Third-party imports
+import wx
+import numpy as np
+
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_wxagg import FigureCanvasWxAgg as FigureCanvas
+
+# Local application imports
+from uiGlobal import *
+from visibility import is_window_visible
+
+#======================================================================
+# COMPONENTS
+#======================================================================
+
+# Linear RGB -> CIE XYZ (sRGB primaries, D65 white). The sensor
+# counts are treated as linear RGB; chromaticity does not depend
+# on their absolute scale.
+RGB_TO_XYZ = np.array([
+    [0.4124, 0.3576, 0.1805],
+    [0.2126, 0.7152, 0.0722],
+    [0.0193, 0.1192, 0.9505],
+])
+
+CHROMA_XY = "xy"
+CHROMA_UV = "uv"
+CHROMA_SPACES = {CHROMA_XY: "CIE 1931 xy", CHROMA_UV: "CIE 1976 u'v'"}
+# (x_lo, x_hi, y_lo, y_hi) plotted for each space
+CHROMA_RANGES = {
+    CHROMA_XY: (0.0, 0.8, 0.0, 0.9),
+    CHROMA_UV: (0.0, 0.65, 0.0, 0.65),
+}
+CHROMA_LABELS = {CHROMA_XY: ("x", "y"), CHROMA_UV: ("u'", "v'")}
+CHROMA_BINS = 256
+
+# Half-lives offered for fading old samples; None keeps them all
+CHROMA_HALF_LIVES = {"All samples": None, "Last ~10 s": 10.0, "Last ~60 s": 60.0}
+# Rescale the weights before they overflow float64
+CHROMA_MAX_WEIGHT = 1e150
+CHROMA_REFRESH_MS = 500
+
+# sRGB primaries and D65 white point in xy, drawn for reference
+SRGB_PRIMARIES_XY = np.array([[0.64, 0.33], [0.30, 0.60], [0.15, 0.06]])
+D65_XY = (0.3127, 0.3290)
+
+
+def xy_to_uv(x, y):
+    """
+    Convert CIE 1931 xy to CIE 1976 u'v'.
+
+    Args:
+        x, y (numpy.ndarray):
+            Chromaticity coordinates.
+
+    Returns:
+        tuple:
+            (u, v) arrays.
+    """
+    d = -2.0 * x + 12.0 * y + 3.0
+    return 4.0 * x / d, 9.0 * y / d
+
+
+def rgb_to_chromaticity(r, g, b):
+    """
+    Convert RGB samples to xy and u'v' chromaticity.
+
+    Samples whose X + Y + Z is zero have no chromaticity and are
+    dropped.
+
+    Args:
+        r, g, b (array-like):
+            Equal-length RGB columns.
+
+    Returns:
+        dict:
+            "keep" (boolean mask over the input) and "x", "y",
+            "u", "v" arrays for the kept samples.
+    """
+    rgb = np.vstack((r, g, b)).astype(np.float64)
+    X, Y, Z = RGB_TO_XYZ @ rgb
+    total = X + Y + Z
+    keep = total > 0
+    X, Y, total = X[keep], Y[keep], total[keep]
+    x = X / total
+    y = Y / total
+    u, v = xy_to_uv(x, y)
+    return {"keep": keep, "x": x, "y": y, "u": u, "v": v}
+
+
+class ChromaticityGrid:
+    """
+    Fixed-size 2D density grid over one chromaticity space.
+
+    Like ChannelHistogram, the bin layout is fixed up front, so an
+    update is one vectorized bin computation plus np.bincount and
+    reading the grid back costs O(bins**2) regardless of the
+    number of samples.
+
+    With a half-life, each sample is weighted by
+    2 ** ((t - t_ref) / half_life) as it arrives instead of
+    decaying the whole grid on every batch; newer samples simply
+    count more. The grid is rescaled before the weights overflow.
+
+    Args:
+        space (str):
+            CHROMA_XY or CHROMA_UV.
+        bins (int):
+            Grid cells per axis.
+        half_life (float | None):
+            Seconds for a sample's weight to halve, or None to
+            weight all samples equally.
+    """
+    def __init__(self, space, bins=CHROMA_BINS, half_life=None):
+        self.space = space
+        self.bins = bins
+        self.half_life = half_life
+        self.range = CHROMA_RANGES[space]
+        self.counts = np.zeros((bins, bins))
+        self.t_ref = None
+        self.total = 0
+
+    def update(self, t, a, b):
+        """
+        Add a batch of chromaticity points.
+
+        Args:
+            t (numpy.ndarray):
+                Sample times, used for the half-life weighting.
+            a, b (numpy.ndarray):
+                Horizontal and vertical coordinates (x/y or u'/v').
+
+        Returns:
+            None
+        """
+        if not len(a):
+            return
+        x_lo, x_hi, y_lo, y_hi = self.range
+        col = np.floor((a - x_lo) * (self.bins / (x_hi - x_lo))).astype(np.int64)
+        row = np.floor((b - y_lo) * (self.bins / (y_hi - y_lo))).astype(np.int64)
+        inside = (col >= 0) & (col < self.bins) & (row >= 0) & (row < self.bins)
+        flat = row[inside] * self.bins + col[inside]
+        weights = None
+        if self.half_life is not None:
+            if self.t_ref is None:
+                self.t_ref = float(t[0])
+            weights = np.exp2((t[inside] - self.t_ref) / self.half_life)
+            if len(weights) and weights.max() > CHROMA_MAX_WEIGHT:
+                shift = float(t[-1]) - self.t_ref
+                self.counts *= np.exp2(-shift / self.half_life)
+                weights *= np.exp2(-shift / self.half_life)
+                self.t_ref = float(t[-1])
+        self.counts += np.bincount(flat, weights=weights,
+                                   minlength=self.bins * self.bins).reshape(self.bins, self.bins)
+        self.total += int(np.count_nonzero(inside))
+
+    def reset(self):
+        """
+        Clear the grid.
+
+        Returns:
+            None
+        """
+        self.counts[:] = 0
+        self.t_ref = None
+        self.total = 0
+
+
+class StreamChromaticity:
+    """
+    xy and u'v' density grids for the streamed RGB samples.
+
+    Updated by the reader thread once per parsed batch, read by
+    the GUI thread, guarded by a private lock like
+    StreamHistograms.
+    """
+    def __init__(self, half_life=None):
+        self.lock = threading.Lock()
+        self.grids = {space: ChromaticityGrid(space, half_life=half_life)
+                      for space in CHROMA_SPACES}
+
+    def update(self, t, r, g, b):
+        """
+        Convert and add one batch of RGB samples.
+
+        Args:
+            t, r, g, b (numpy.ndarray):
+                Times and RGB values of the batch's RGB samples.
+
+        Returns:
+            None
+        """
+        if not len(t):
+            return
+        chroma = rgb_to_chromaticity(r, g, b)
+        t = np.asarray(t, dtype=np.float64)[chroma["keep"]]
+        with self.lock:
+            self.grids[CHROMA_XY].update(t, chroma["x"], chroma["y"])
+            self.grids[CHROMA_UV].update(t, chroma["u"], chroma["v"])
+
+    def set_half_life(self, half_life):
+        """
+        Change the fading half-life, clearing the grids.
+
+        Args:
+            half_life (float | None):
+                Seconds, or None to keep all samples.
+
+        Returns:
+            None
+        """
+        with self.lock:
+            for grid in self.grids.values():
+                grid.half_life = half_life
+                grid.reset()
+
+    def reset(self):
+        """
+        Clear both grids.
+
+        Returns:
+            None
+        """
+        with self.lock:
+            for grid in self.grids.values():
+                grid.reset()
+
+    def snapshot(self, space):
+        """
+        Copy one grid.
+
+        Args:
+            space (str):
+                CHROMA_XY or CHROMA_UV.
+
+        Returns:
+            tuple:
+                (counts, total) with counts a bins x bins array,
+                row 0 at the bottom of the plot.
+        """
+        with self.lock:
+            grid = self.grids[space]
+            return grid.counts.copy(), grid.total
+
+
+class ChromaticityFrame(wx.Frame):
+    """
+    Live chromaticity heat map of the streamed RGB samples.
+
+    The grid is drawn as one image artist whose pixels are replaced
+    on each refresh, so drawing costs the same for ten samples or
+    ten million.
+
+    Args:
+        parent (wx.Window):
+            Parent window reference.
+        chromaticity (StreamChromaticity):
+            Grids maintained by the stream reader.
+    """
+    def __init__(self, parent, chromaticity):
+        super(ChromaticityFrame, self).__init__(parent, title="Chromaticity", size=(700, 700))
+        self.SetIcon(wx.Icon(os.path.join(os.path.abspath(os.path.dirname(__file__)), "icons", IMG_ICON)))
+        self.chromaticity = chromaticity
+        self.space = CHROMA_XY
+
+        self.figure = Figure(figsize=(6, 6), facecolor='black')
+        self.ax = self.figure.add_subplot(111)
+        self.ax.set_facecolor('black')
+        self.ax.tick_params(axis='x', colors='white')
+        self.ax.tick_params(axis='y', colors='white')
+        self.canvas = FigureCanvas(self, -1, self.figure)
+
+        self.spaces = list(CHROMA_SPACES)
+        self.space_box = wx.RadioBox(self, label="Space", choices=list(CHROMA_SPACES.values()),
+                                     style=wx.RA_SPECIFY_COLS)
+        self.space_box.Bind(wx.EVT_RADIOBOX, self.on_space_change)
+        self.half_lives = list(CHROMA_HALF_LIVES.values())
+        self.fade_choice = wx.Choice(self, choices=list(CHROMA_HALF_LIVES))
+        current = self.chromaticity.grids[CHROMA_XY].half_life
+        self.fade_choice.SetSelection(self.half_lives.index(current) if current in self.half_lives else 0)
+        self.fade_choice.Bind(wx.EVT_CHOICE, self.on_fade_change)
+        self.count_text = wx.StaticText(self, label="")
+
+        control_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        control_sizer.Add(self.space_box, 0, wx.ALL, 5)
+        control_sizer.Add(wx.StaticText(self, label="Show:"), 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 5)
+        control_sizer.Add(self.fade_choice, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 10)
+        control_sizer.Add(self.count_text, 0, wx.ALIGN_CENTER_VERTICAL)
+
+        sizer = wx.BoxSizer(wx.VERTICAL)
+        sizer.Add(control_sizer, 0)
+        sizer.Add(self.canvas, 1, wx.EXPAND)
+        self.SetSizer(sizer)
+
+        self._build_artists()
+        self.timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.on_timer, self.timer)
+        self.Bind(wx.EVT_CLOSE, self.on_close)
+        self.timer.Start(CHROMA_REFRESH_MS)
+
+    def _build_artists(self):
+        """
+        Create the image and reference markers for the current space.
+
+        Returns:
+            None
+        """
+        self.ax.clear()
+        x_lo, x_hi, y_lo, y_hi = CHROMA_RANGES[self.space]
+        self.image = self.ax.imshow(np.zeros((CHROMA_BINS, CHROMA_BINS)), origin='lower',
+                                    extent=(x_lo, x_hi, y_lo, y_hi), cmap='inferno',
+                                    vmin=0, vmax=1, interpolation='nearest', aspect='equal')
+        primaries = SRGB_PRIMARIES_XY
+        white = np.array([D65_XY])
+        if self.space == CHROMA_UV:
+            primaries = np.column_stack(xy_to_uv(primaries[:, 0], primaries[:, 1]))
+            white = np.column_stack(xy_to_uv(white[:, 0], white[:, 1]))
+        gamut = np.vstack((primaries, primaries[:1]))
+        self.ax.plot(gamut[:, 0], gamut[:, 1], color='white', linewidth=0.8,
+                     linestyle='--', label='sRGB gamut')
+        self.ax.plot(white[:, 0], white[:, 1], marker='+', color='cyan',
+                     linestyle='None', markersize=10, label='D65')
+        self.ax.legend(loc='upper right', fontsize='small')
+        x_label, y_label = CHROMA_LABELS[self.space]
+        self.ax.set_xlabel(x_label, color='white')
+        self.ax.set_ylabel(y_label, color='white')
+        self.ax.set_title(CHROMA_SPACES[self.space], color='white')
+        self.on_timer(None)
+
+    def on_space_change(self, event):
+        """
+        Switch between the xy and u'v' diagrams.
+
+        Args:
+            event:
+                wx.CommandEvent from the radio box.
+
+        Returns:
+            None
+        """
+        self.space = self.spaces[self.space_box.GetSelection()]
+        self._build_artists()
+
+    def on_fade_change(self, event):
+        """
+        Change how long samples stay in the heat map.
+
+        Args:
+            event:
+                wx.CommandEvent from the fade choice.
+
+        Returns:
+            None
+        """
+        self.chromaticity.set_half_life(self.half_lives[self.fade_choice.GetSelection()])
+        self.on_timer(None)
+
+    def on_timer(self, event):
+        """
+        Redraw the heat map from the latest grid.
+
+        Densities are log-scaled and normalized to the densest
+        cell so sparse and dense regions both show. Skipped while
+        the window is hidden or minimized.
+
+        Args:
+            event:
+                wx.TimerEvent, or None.
+
+        Returns:
+            None
+        """
+        if not is_window_visible(self):
+            return
+        counts, total = self.chromaticity.snapshot(self.space)
+        peak = counts.max()
+        density = np.log1p(counts / peak * 1000) / np.log1p(1000) if peak > 0 else counts
+        self.image.set_data(np.ma.masked_equal(density, 0))
+        self.count_text.SetLabel(f"{total} samples")
+        self.canvas.draw_idle()
+
+    def on_close(self, event):
+        """
+        Stop the refresh timer before the frame is destroyed.
+
+        Args:
+            event:
+                wx.CloseEvent.
+
+        Returns:
+            None
+        """
+        self.timer.Stop()
+        event.Skip()
@@ -31,11 +31,26 @@ import xlsxwriter
 # Local application imports
 from wx import FileDialog, FD_SAVE, FD_OVERWRITE_PROMPT
 from uiGlobal import *
+from memgovernor import get_governor, MEMORY_POLICIES, POLICY_DECIMATE, POLICY_SPILL
+from visibility import is_window_visible, bind_visibility
+from decimate import m4_indices
 
 #======================================================================
 # COMPONENTS
 #======================================================================
 
+# (key, axis, label, colour, marker) for each plotted series
+PLOT_SERIES = (
+    ("R", "ax", "Red", "red", "o"),
+    ("G", "ax", "Green", "green", "o"),
+    ("B", "ax", "Blue", "blue", "o"),
+    ("Light", "ax2", "Light", "orange", "x"),
+)
+# Markers are drawn only while samples are at least this many
+# pixels apart
+PLOT_MARKER_SPACING_PX = 6
+PLOT_MIN_CAPACITY = 1024
+
 class PlotPanel(wx.Panel):
     """
     A wx.Panel subclass for plotting RGB and light sensor data using matplotlib.
@@ -44,6 +59,14 @@ class PlotPanel(wx.Panel):
         - Real-time plotting of Red, Green, Blue, and Light values.
         - Checkbox controls to toggle visibility of each data series.
         - Zoom in/out functionality for better data inspection.
+        - Follows new readings incrementally: the four line
+          artists and the legend are created once and only get
+          new data, markers are dropped once samples are closer
+          than PLOT_MARKER_SPACING_PX, and long histories are
+          M4-decimated to the plot width.
+        - Redraws are skipped
+          while the window is hidden or minimized and caught up
+          in one redraw when it is shown again.
 
     Args:
         parent (wx.Window): The parent wxPython window or panel.
@@ -68,17 +91,26 @@ class PlotPanel(wx.Panel):
         self.checkbox_green.SetValue(True)
         self.checkbox_blue.SetValue(True)
 
-        self.checkbox_red.Bind(wx.EVT_CHECKBOX, self.update_plot)
-        self.checkbox_green.Bind(wx.EVT_CHECKBOX, self.update_plot)
-        self.checkbox_blue.Bind(wx.EVT_CHECKBOX, self.update_plot)
-        self.checkbox_light.Bind(wx.EVT_CHECKBOX, self.update_plot)
+        self.checkbox_red.Bind(wx.EVT_CHECKBOX, self.on_checkbox_toggle)
+        self.checkbox_green.Bind(wx.EVT_CHECKBOX, self.on_checkbox_toggle)
+        self.checkbox_blue.Bind(wx.EVT_CHECKBOX, self.on_checkbox_toggle)
+        self.checkbox_light.Bind(wx.EVT_CHECKBOX, self.on_checkbox_toggle)
+        self.checkboxes = {
+            "R": self.checkbox_red,
+            "G": self.checkbox_green,
+            "B": self.checkbox_blue,
+            "Light": self.checkbox_light,
+        }
 
         # Zoom Buttons
         self.zoom_in_btn = wx.Button(self, label="Zoom In")
         self.zoom_out_btn = wx.Button(self, label="Zoom Out")
 
+        self.live_btn = wx.Button(self, label="Live")
+
         self.zoom_in_btn.Bind(wx.EVT_BUTTON, self.on_zoom_in)
         self.zoom_out_btn.Bind(wx.EVT_BUTTON, self.on_zoom_out)
+        self.live_btn.Bind(wx.EVT_BUTTON, self.on_live)
 
         # Layout
         layout = wx.BoxSizer(wx.VERTICAL)
@@ -91,23 +123,124 @@ class PlotPanel(wx.Panel):
         
         control_sizer.Add(self.zoom_in_btn, 0, wx.ALL, 5)
         control_sizer.Add(self.zoom_out_btn, 0, wx.ALL, 5)
+        control_sizer.Add(self.live_btn, 0, wx.ALL, 5)
 
         layout.Add(control_sizer)
         layout.Add(self.canvas, 1, wx.EXPAND)
         self.SetSizer(layout)
 
+        self.stale = False
+        # Follow the newest samples until the user zooms
+        self.follow = True
+        self.count = 0
+        self.cols = {key: np.zeros(PLOT_MIN_CAPACITY) for key in self.checkboxes}
+        self.setup_axes()
+        bind_visibility(self, self.on_visible)
         self.update_plot(None)
 
+    def setup_axes(self):
+        """
+        Create the persistent line artists and axis labels.
+
+        Returns:
+            None
+        """
+        self.ax.grid(True)
+        self.ax.set_xlabel('Time')
+        self.ax.set_ylabel('RGB Value')
+        self.ax2.set_ylabel('Light Value', color='orange')
+        self.ax.set_title('RGB and Light Plot')
+        self.lines = {}
+        for key, axis, label, colour, marker in PLOT_SERIES:
+            line, = getattr(self, axis).plot([], [], label=label, color=colour, marker=marker)
+            self.lines[key] = line
+        self.update_legend()
+
+    def update_legend(self):
+        """
+        Rebuild the legend for the visible series.
+
+        Returns:
+            None
+        """
+        handles = [self.lines[key] for key in self.checkboxes
+                   if self.checkboxes[key].GetValue()]
+        if self.ax.get_legend():
+            self.ax.get_legend().remove()
+        if handles:
+            self.ax.legend(handles=handles)
+
+    def invalidate(self):
+        """
+        Drop the cached arrays after the source lists were trimmed.
+
+        Returns:
+            None
+        """
+        self.count = 0
+        self.request_refresh()
+
+    def sync_data(self):
+        """
+        Copy readings appended since the last update into the cache.
+
+        Only the new tail of each list is converted, into arrays
+        that grow by doubling, so a refresh costs O(new samples).
+
+        Returns:
+            int:
+                Number of complete samples.
+        """
+        n = min(len(self.rgb_data.get(key, [])) for key in self.cols)
+        if n < self.count:
+            self.count = 0
+        if n > len(self.cols["R"]):
+            capacity = max(PLOT_MIN_CAPACITY, 2 * n)
+            for key, col in self.cols.items():
+                grown = np.zeros(capacity)
+                grown[:self.count] = col[:self.count]
+                self.cols[key] = grown
+        if n > self.count:
+            for key, col in self.cols.items():
+                col[self.count:n] = self.rgb_data[key][self.count:n]
+            self.count = n
+        return n
+
+    def request_refresh(self):
+        """
+        Redraw for new readings, or defer while not visible.
+
+        Returns:
+            None
+        """
+        if is_window_visible(self):
+            self.update_plot(None)
+        else:
+            self.stale = True
+
+    def on_visible(self):
+        """
+        Catch up with readings that arrived while hidden.
+
+        Returns:
+            None
+        """
+        if self.stale:
+            self.update_plot(None)
+
     def update_plot(self, event):
         """
         Update the RGB and light sensor plot.
 
-        This method redraws the matplotlib graph
-        based on the current checkbox selections.
-        RGB values are plotted on the primary axis,
-        and light sensor data is plotted on the
+        This method pushes the current readings into the
+        persistent line artists based on the checkbox
+        selections. RGB values are plotted on the primary
+        axis, and light sensor data is plotted on the
         secondary axis.
 
+        Only the samples inside the visible X range are handed
+        to matplotlib, decimated to the plot width.
+
         Args:
             event:
                 wx event object triggering the update.
@@ -115,34 +248,57 @@ class PlotPanel(wx.Panel):
         Returns:
             None
         """
-        self.ax.clear()
-        self.ax2.clear()
-        self.ax.grid(True)
-        self.ax.set_xlabel('Time')
-        self.ax.set_ylabel('RGB Value')
-        self.ax2.set_ylabel('Light Value', color='orange')
-        self.ax.set_title('RGB and Light Plot')
-        
+        self.stale = False
+        n = self.sync_data()
+        if self.follow:
+            self.ax.set_xlim(0, max(n - 1, 1))
+        x_lo, x_hi = sorted(self.ax.get_xlim())
+        lo = min(n, max(0, int(np.floor(x_lo))))
+        hi = min(n, max(lo, int(np.ceil(x_hi)) + 1))
+        width = max(1, int(self.ax.bbox.width))
+        x = np.arange(lo, hi)
+        visible = [key for key in self.checkboxes if self.checkboxes[key].GetValue()]
+        idx = m4_indices(x, [self.cols[key][lo:hi] for key in visible],
+                         width, x_lo, x_hi)
+        spaced = (hi - lo) * PLOT_MARKER_SPACING_PX <= width
+        for key, _, _, _, marker in PLOT_SERIES:
+            line = self.lines[key]
+            line.set_visible(key in visible)
+            line.set_marker(marker if spaced else 'None')
+            line.set_data(x[idx], self.cols[key][lo:hi][idx])
+        if self.follow:
+            for axis in (self.ax, self.ax2):
+                axis.relim(visible_only=True)
+                axis.autoscale_view(scalex=False)
+        self.canvas.draw_idle()
+
+    def on_checkbox_toggle(self, event):
+        """
+        Show or hide a series and refresh the legend.
 
-        r = self.rgb_data.get("R", [])
-        g = self.rgb_data.get("G", [])
-        b = self.rgb_data.get("B", [])
-        light = self.rgb_data.get("Light", [])
+        Args:
+            event:
+                wx checkbox event object.
+
+        Returns:
+            None
+        """
+        self.update_legend()
+        self.update_plot(None)
 
-        min_len = min(len(r), len(g), len(b), len(light))
-        times = np.arange(min_len)
+    def on_live(self, event):
+        """
+        Resume following the newest readings after a zoom.
 
-        if self.checkbox_red.GetValue():
-            self.ax.plot(times, r[:min_len], label='Red', color='red', marker='o')
-        if self.checkbox_green.GetValue():
-            self.ax.plot(times, g[:min_len], label='Green', color='green', marker='o')
-        if self.checkbox_blue.GetValue():
-            self.ax.plot(times, b[:min_len], label='Blue', color='blue', marker='o')
-        if self.checkbox_light.GetValue():
-            self.ax2.plot(times, light[:min_len], label='Light', color='orange', marker='x')
+        Args:
+            event:
+                wx button event object.
 
-        self.ax.legend()
-        self.canvas.draw()
+        Returns:
+            None
+        """
+        self.follow = True
+        self.update_plot(None)
 
     def on_zoom_in(self, event):
         """
@@ -210,9 +366,15 @@ class PlotPanel(wx.Panel):
         y2_range = (ylim2[1] - ylim2[0]) * factor / 2
         self.ax2.set_ylim(y2_center - y2_range, y2_center + y2_range)
 
-        self.canvas.draw()
+        # Keep the zoomed range until Live is pressed
+        self.follow = False
+        self.update_plot(None)
 
-# import wx
+# Approximate bytes held per Control Mode sample: four list slots
+# pointing at int objects plus one timestamp string.
+CONTROL_SAMPLE_BYTES = 4 * (8 + 28) + (8 + 72)
+# Memory governor consumer name of the Control Mode samples
+CONTROL_MEMORY_NAME = "Control Mode"
 
 class ControlPanel(wx.Panel):
     """
@@ -238,8 +400,12 @@ class ControlPanel(wx.Panel):
         self.device = device
         self.rgb_data = {"R": [], "G": [], "B": [], "Light": []}
         self.plot_window = None
+        self.plot_panel = None
         self.timer = wx.Timer(self)
         self.Bind(wx.EVT_TIMER, self.on_timer, self.timer)
+        get_governor().register(CONTROL_MEMORY_NAME, self.memory_usage, self.release_memory,
+                                policies=tuple(MEMORY_POLICIES))
+        self.Bind(wx.EVT_WINDOW_DESTROY, self.on_destroy)
 
         self.main_sizer = wx.BoxSizer(wx.VERTICAL)
 
@@ -361,6 +527,73 @@ class ControlPanel(wx.Panel):
         self.save_csv_btn.Bind(wx.EVT_BUTTON, self.on_save_csv)
 
 
+    def memory_usage(self):
+        """
+        Estimate memory held by the collected samples.
+
+        Returns:
+            int:
+                Approximate bytes.
+        """
+        return len(self.timestamps) * CONTROL_SAMPLE_BYTES
+
+    def release_memory(self, nbytes, policy, spill_path=None):
+        """
+        Trim collected samples for the memory governor.
+
+        Args:
+            nbytes (int):
+                Bytes the governor wants released.
+            policy (str):
+                Overflow policy to apply.
+            spill_path (str | None):
+                CSV file that spilled samples are appended to.
+
+        Returns:
+            int:
+                Approximate bytes released.
+        """
+        series = [self.rgb_data[key] for key in ("Light", "R", "G", "B")] + [self.timestamps]
+        count = min(len(s) for s in series)
+        if count == 0:
+            return 0
+        if policy == POLICY_DECIMATE:
+            for s in series:
+                s[:] = s[::2]
+            if self.plot_panel:
+                self.plot_panel.invalidate()
+            return (count - len(self.timestamps)) * CONTROL_SAMPLE_BYTES
+
+        rows = min(count, -(-nbytes // CONTROL_SAMPLE_BYTES))
+        if policy == POLICY_SPILL and spill_path:
+            new_file = not os.path.exists(spill_path)
+            with open(spill_path, 'a', newline='') as csvfile:
+                writer = csv.writer(csvfile)
+                if new_file:
+                    writer.writerow(['Timestamp', 'Light', 'Red', 'Green', 'Blue'])
+                writer.writerows(zip(self.timestamps[:rows], *(s[:rows] for s in series[:4])))
+        for s in series:
+            del s[:rows]
+        if self.plot_panel:
+            self.plot_panel.invalidate()
+        return rows * CONTROL_SAMPLE_BYTES
+
+    def on_destroy(self, event):
+        """
+        Delete the spill file and leave the memory governor.
+
+        Args:
+            event:
+                wx.WindowDestroyEvent.
+
+        Returns:
+            None
+        """
+        if event.GetEventObject() is self:
+            get_governor().discard_spill(CONTROL_MEMORY_NAME)
+            get_governor().unregister(CONTROL_MEMORY_NAME)
+        event.Skip()
+
     def set_device(self, device):
         """
         Assign device instance to control panel.
@@ -543,6 +776,8 @@ class ControlPanel(wx.Panel):
 
                 self.tc_light.SetValue(str(light))
                 self.tc_color.SetValue(color)
+                if self.plot_panel:
+                    self.plot_panel.request_refresh()
 
                 # self.log_window.log_message(f"\nTimer read: Light={light}, Color={color}")
                 self.log_window.log_message(f"Ambient Light (lux) - {light} ,   Color (R:G:B) - {color}")
@@ -570,7 +805,7 @@ class ControlPanel(wx.Panel):
             
             icon_path = os.path.join(os.path.abspath(os.path.dirname(__file__)), "icons", IMG_ICON)
             self.plot_window.SetIcon(wx.Icon(icon_path))
-            panel = PlotPanel(self.plot_window, self.rgb_data)
+            self.plot_panel = PlotPanel(self.plot_window, self.rgb_data)
             self.plot_window.Show()
     
     def on_save_csv(self, event):
@@ -0,0 +1,142 @@
+##############################################################################
+#
+# Module: crosshair.py
+#
+# Description:
+#     Mouse-following crosshair for matplotlib canvases, drawn by
+#     blitting over a cached copy of the last rendered frame so it
+#     never needs a full canvas redraw.
+#
+# Author:
+#     Vinay N, MCCI Corporation October 2026
+#
+# Revision history:
+#     V2.2.0 Mon Oct 2026 19:10:2026   Vinay N
+#       Module created
+#
+##############################################################################
+# Third-party imports
+from matplotlib.lines import Line2D
+
+#======================================================================
+# COMPONENTS
+#======================================================================
+
+CROSSHAIR_STYLE = dict(color='white', linewidth=0.8, linestyle='-', alpha=0.8)
+
+
+class BlitCrosshair:
+    """
+    Crosshair spanning a stack of axes that share one X axis.
+
+    A vertical line is drawn through every axes at the cursor's X
+    and a horizontal line through the hovered axes at its Y. The
+    lines are free artists using the axes' blended transforms, so
+    they survive Axes.clear() and are never part of a full draw.
+
+    The owner calls capture() whenever a new frame has been
+    rendered into the canvas (before the crosshair is drawn on
+    it); moving the crosshair then only restores that copy, draws
+    the lines and blits.
+
+    Args:
+        canvas (FigureCanvasAgg):
+            Canvas to draw on.
+        axes (list[matplotlib.axes.Axes]):
+            Axes the vertical line runs through.
+    """
+    def __init__(self, canvas, axes):
+        self.canvas = canvas
+        self.axes = list(axes)
+        self.vlines = {}
+        self.hlines = {}
+        for ax in self.axes:
+            self.vlines[ax] = self._make_line(ax, [0, 0], [0, 1], ax.get_xaxis_transform())
+            self.hlines[ax] = self._make_line(ax, [0, 1], [0, 0], ax.get_yaxis_transform())
+        self.background = None
+        self.x = None
+        self.y = None
+        self.active_ax = None
+
+    def _make_line(self, ax, xdata, ydata, transform):
+        """
+        Create one animated line clipped to an axes.
+
+        Returns:
+            matplotlib.lines.Line2D
+        """
+        line = Line2D(xdata, ydata, transform=transform, animated=True, **CROSSHAIR_STYLE)
+        line.set_figure(self.canvas.figure)
+        line.set_clip_box(ax.bbox)
+        return line
+
+    def capture(self):
+        """
+        Remember the current canvas pixels as the crosshair background.
+
+        Returns:
+            None
+        """
+        self.background = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+
+    def draw(self):
+        """
+        Draw the crosshair lines onto the canvas renderer.
+
+        Does not blit; used while a frame is being composed.
+
+        Returns:
+            None
+        """
+        if self.x is None:
+            return
+        for ax, line in self.vlines.items():
+            line.set_xdata([self.x, self.x])
+            ax.draw_artist(line)
+        if self.active_ax is not None and self.y is not None:
+            line = self.hlines[self.active_ax]
+            line.set_ydata([self.y, self.y])
+            self.active_ax.draw_artist(line)
+
+    def update(self):
+        """
+        Restore the cached frame, draw the crosshair and blit.
+
+        Returns:
+            None
+        """
+        if self.background is None:
+            return
+        self.canvas.restore_region(self.background)
+        self.draw()
+        self.canvas.blit(self.canvas.figure.bbox)
+
+    def show(self, ax, x, y=None):
+        """
+        Move the crosshair.
+
+        Args:
+            ax (matplotlib.axes.Axes):
+                Hovered axes, which gets the horizontal line.
+            x (float):
+                Data X of the vertical line.
+            y (float | None):
+                Data Y of the horizontal line, or None for none.
+
+        Returns:
+            None
+        """
+        self.x, self.y, self.active_ax = x, y, ax
+        self.update()
+
+    def hide(self):
+        """
+        Remove the crosshair from the canvas.
+
+        Returns:
+            None
+        """
+        if self.x is None:
+            return
+        self.x = self.y = self.active_ax = None
+        self.update()
@@ -0,0 +1,74 @@
+##############################################################################
+#
+# Module: decimate.py
+#
+# Description:
+#     Pixel-aware decimation of plot data. Reduces a visible window
+#     to at most four samples per pixel column (M4: first, last, min
+#     and max) so line drawing cost depends on the canvas width and
+#     not on the number of samples, while keeping every peak.
+#
+# Author:
+#     Vinay N, MCCI Corporation October 2026
+#
+# Revision history:
+#     V2.2.0 Mon Oct 2026 19:10:2026   Vinay N
+#       Module created
+#
+##############################################################################
+# Third-party imports
+import numpy as np
+
+#======================================================================
+# COMPONENTS
+#======================================================================
+
+# Samples kept per pixel column
+M4_POINTS_PER_PIXEL = 4
+
+
+def m4_indices(x, columns, width, x_lo, x_hi):
+    """
+    Select the samples that draw identically at a given pixel width.
+
+    The X range is split into width pixel columns. In each column
+    the first and last sample are kept, plus the minimum and
+    maximum of every channel. NaN values are ignored for min/max.
+
+    Args:
+        x (numpy.ndarray):
+            Monotonic (increasing or decreasing) X values.
+        columns (list[numpy.ndarray]):
+            Channels sharing x. The kept indices are the union
+            over all channels, so the channels stay aligned.
+        width (int):
+            Plot width in pixels.
+        x_lo, x_hi (float):
+            X range mapped onto the pixel columns.
+
+    Returns:
+        numpy.ndarray:
+            Sorted sample indices to plot.
+    """
+    n = len(x)
+    if width <= 0 or n <= M4_POINTS_PER_PIXEL * width:
+        return np.arange(n)
+    span = (x_hi - x_lo) or 1.0
+    pixel = np.clip(((x - x_lo) * (width / span)).astype(np.int64), 0, width - 1)
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(pixel)) + 1))
+    counts = np.diff(np.append(starts, n))
+    bucket = np.repeat(np.arange(len(starts)), counts)
+    keep = [starts, starts + counts - 1]
+    for y in columns:
+        if y.dtype.kind == "f":
+            nan = np.isnan(y)
+            low = np.where(nan, np.inf, y)
+            high = np.where(nan, -np.inf, y)
+        else:
+            low = high = y
+        for values, extreme in ((low, np.minimum.reduceat(low, starts)),
+                                (high, np.maximum.reduceat(high, starts))):
+            hits = np.flatnonzero(values == extreme[bucket])
+            _, first = np.unique(bucket[hits], return_index=True)
+            keep.append(hits[first])
+    return np.unique(np.concatenate(keep))
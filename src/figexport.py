@@ -0,0 +1,263 @@
+##############################################################################
+#
+# Module: figexport.py
+#
+# Description:
+#     Background export of stream plots to PNG, SVG or PDF. Renders
+#     a chosen time range on a worker thread into a private Figure,
+#     so large captures export without blocking the GUI.
+#
+# Author:
+#     Vinay N, MCCI Corporation October 2026
+#
+# Revision history:
+#     V2.2.0 Mon Oct 2026 19:10:2026   Vinay N
+#       Module created
+#
+##############################################################################
+# Built-in imports
+import time
+import threading
+
+# Third-party imports
+import wx
+
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.ticker import MaxNLocator, AutoMinorLocator, ScalarFormatter
+
+# Local application imports
+from plotrender import draw_stream_axes
+
+#======================================================================
+# COMPONENTS
+#======================================================================
+
+EXPORT_FORMATS = {
+    "png": "PNG image (*.png)|*.png",
+    "svg": "SVG image (*.svg)|*.svg",
+    "pdf": "PDF document (*.pdf)|*.pdf",
+}
+EXPORT_DEFAULT_DPI = 300
+EXPORT_MIN_DPI = 50
+EXPORT_MAX_DPI = 1200
+# Exported figure size in inches
+EXPORT_SIZE = (12, 9)
+# Share of the figure width taken by the axes (matplotlib default)
+EXPORT_AXES_FRACTION = 0.775
+# The live view puts an X tick every 10 s; longer ranges switch to
+# an automatic locator with at most this many ticks
+EXPORT_MAX_XTICKS = 12
+
+EXPORT_RANGE_VIEW = "view"
+EXPORT_RANGE_ALL = "all"
+EXPORT_RANGE_CUSTOM = "custom"
+EXPORT_RANGES = {
+    EXPORT_RANGE_VIEW: "Current view",
+    EXPORT_RANGE_ALL: "Whole capture",
+    EXPORT_RANGE_CUSTOM: "Time range",
+}
+
+
+def export_pixel_width(dpi, size=EXPORT_SIZE):
+    """
+    Approximate plot width in pixels of an exported figure.
+
+    Used to decimate the data for the export resolution.
+
+    Args:
+        dpi (float):
+            Export resolution.
+        size (tuple):
+            Figure size in inches.
+
+    Returns:
+        int
+    """
+    return max(1, int(size[0] * dpi * EXPORT_AXES_FRACTION))
+
+
+def render_export(view, options, path, dpi, size=EXPORT_SIZE, subplots=None):
+    """
+    Draw a view into a new Figure and save it.
+
+    The output format follows the file extension.
+
+    Args:
+        view (dict):
+            Plot data from StreamPlotFrame.compute_view().
+        options (dict):
+            Render options from StreamPlotFrame.render_options().
+        path (str):
+            Output file path.
+        dpi (float):
+            Output resolution.
+        size (tuple):
+            Figure size in inches.
+        subplots (dict | None):
+            Keyword arguments for Figure.subplots_adjust().
+
+    Returns:
+        None
+    """
+    figure = Figure(figsize=size, facecolor='black')
+    FigureCanvasAgg(figure)
+    if subplots:
+        figure.subplots_adjust(**subplots)
+    ax_rgb = figure.add_subplot(211)
+    ax_light = figure.add_subplot(212)
+    draw_stream_axes(ax_rgb, ax_light, view, options)
+    if view["plot_window"] / 10 > EXPORT_MAX_XTICKS:
+        for ax in (ax_rgb, ax_light):
+            ax.xaxis.set_major_locator(MaxNLocator(EXPORT_MAX_XTICKS))
+            ax.xaxis.set_minor_locator(AutoMinorLocator(2))
+            ax.xaxis.set_major_formatter(ScalarFormatter())
+    figure.savefig(path, dpi=dpi, facecolor=figure.get_facecolor())
+
+
+class FigureExportJob(threading.Thread):
+    """
+    Prepare and save one export on a worker thread.
+
+    Args:
+        prepare (callable):
+            prepare() -> view dict. Runs on the worker, so the
+            range lookup and decimation are off the GUI thread
+            too. It must only read the store snapshot.
+        options (dict):
+            Render options captured on the GUI thread.
+        path (str):
+            Output file path.
+        dpi (float):
+            Output resolution.
+        on_done (callable):
+            on_done(path, error, seconds), called on the worker
+            thread with error None on success. Callers marshal it
+            to the GUI thread (wx.CallAfter).
+        subplots (dict | None):
+            Keyword arguments for Figure.subplots_adjust().
+    """
+    def __init__(self, prepare, options, path, dpi, on_done, subplots=None):
+        super(FigureExportJob, self).__init__(daemon=True)
+        self.prepare = prepare
+        self.options = options
+        self.path = path
+        self.dpi = dpi
+        self.on_done = on_done
+        self.subplots = subplots
+
+    def run(self):
+        """
+        Build the view, render it and report the result.
+
+        Returns:
+            None
+        """
+        started = time.perf_counter()
+        error = None
+        try:
+            render_export(self.prepare(), self.options, self.path, self.dpi,
+                          subplots=self.subplots)
+        except Exception as exc:
+            error = exc
+        self.on_done(self.path, error, time.perf_counter() - started)
+
+
+class ExportDialog(wx.Dialog):
+    """
+    Choose the time range and resolution of a figure export.
+
+    Args:
+        parent (wx.Window):
+            Parent window reference.
+        view_range (tuple):
+            (t0, t1) of the current view in seconds.
+        full_range (tuple):
+            (t0, t1) of the whole capture in seconds.
+    """
+    def __init__(self, parent, view_range, full_range):
+        super(ExportDialog, self).__init__(parent, title="Export Figure")
+        self.ranges = {EXPORT_RANGE_VIEW: view_range, EXPORT_RANGE_ALL: full_range}
+        self.range_keys = list(EXPORT_RANGES)
+        self.range_box = wx.RadioBox(self, label="Range", choices=list(EXPORT_RANGES.values()),
+                                     majorDimension=1, style=wx.RA_SPECIFY_COLS)
+        self.range_box.Bind(wx.EVT_RADIOBOX, self.on_range)
+
+        row = wx.BoxSizer(wx.HORIZONTAL)
+        row.Add(wx.StaticText(self, label="From (s):"), 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 5)
+        self.from_ctrl = wx.TextCtrl(self, value=f"{view_range[0]:.2f}", size=(80, -1))
+        row.Add(self.from_ctrl, 0, wx.RIGHT, 15)
+        row.Add(wx.StaticText(self, label="To (s):"), 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 5)
+        self.to_ctrl = wx.TextCtrl(self, value=f"{view_range[1]:.2f}", size=(80, -1))
+        row.Add(self.to_ctrl, 0)
+
+        dpi_row = wx.BoxSizer(wx.HORIZONTAL)
+        dpi_row.Add(wx.StaticText(self, label="DPI:"), 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 5)
+        self.dpi_ctrl = wx.SpinCtrl(self, min=EXPORT_MIN_DPI, max=EXPORT_MAX_DPI,
+                                    initial=EXPORT_DEFAULT_DPI)
+        dpi_row.Add(self.dpi_ctrl, 0)
+
+        sizer = wx.BoxSizer(wx.VERTICAL)
+        sizer.Add(self.range_box, 0, wx.EXPAND | wx.ALL, 10)
+        sizer.Add(row, 0, wx.LEFT | wx.RIGHT | wx.BOTTOM, 10)
+        sizer.Add(dpi_row, 0, wx.LEFT | wx.RIGHT | wx.BOTTOM, 10)
+        sizer.Add(self.CreateStdDialogButtonSizer(wx.OK | wx.CANCEL), 0, wx.EXPAND | wx.ALL, 10)
+        self.SetSizerAndFit(sizer)
+        self.Bind(wx.EVT_BUTTON, self.on_ok, id=wx.ID_OK)
+        self.on_range(None)
+
+    def on_range(self, event):
+        """
+        Fill in the times of a preset range.
+
+        Args:
+            event:
+                wx.CommandEvent from the range radio box, or None.
+
+        Returns:
+            None
+        """
+        key = self.range_keys[self.range_box.GetSelection()]
+        custom = key == EXPORT_RANGE_CUSTOM
+        self.from_ctrl.Enable(custom)
+        self.to_ctrl.Enable(custom)
+        if not custom:
+            t0, t1 = self.ranges[key]
+            self.from_ctrl.SetValue(f"{t0:.2f}")
+            self.to_ctrl.SetValue(f"{t1:.2f}")
+
+    def get_settings(self):
+        """
+        Read the chosen range and resolution.
+
+        Returns:
+            tuple:
+                (t0, t1, dpi).
+
+        Raises:
+            ValueError:
+                If the times are not numbers or t1 <= t0.
+        """
+        t0 = float(self.from_ctrl.GetValue())
+        t1 = float(self.to_ctrl.GetValue())
+        if t1 <= t0:
+            raise ValueError("End time must be after start time.")
+        return t0, t1, self.dpi_ctrl.GetValue()
+
+    def on_ok(self, event):
+        """
+        Validate the inputs before closing.
+
+        Args:
+            event:
+                wx.CommandEvent from the OK button.
+
+        Returns:
+            None
+        """
+        try:
+            self.get_settings()
+        except ValueError as exc:
+            wx.MessageBox(f"Invalid export setting:\n{exc}", "Error", wx.OK | wx.ICON_ERROR)
+            return
+        event.Skip()
@@ -0,0 +1,366 @@
+##############################################################################
+#
+# Module: flicker.py
+#
+# Description:
+#     Flicker analysis of the streamed light channel: an incremental
+#     short-time FFT over the resampled samples, with live spectrum,
+#     spectrogram and flicker metrics.
+#
+# Author:
+#     Vinay N, MCCI Corporation October 2026
+#
+# Revision history:
+#     V2.2.0 Mon Oct 2026 19:10:2026   Vinay N
+#       Module created
+#
+##############################################################################
+# Built-in imports
+import os
+
+# Third-party imports
+import wx
+import numpy as np
+
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_wxagg import FigureCanvasWxAgg as FigureCanvas
+
+# Local application imports
+from uiGlobal import *
+from resample import make_grid, resample
+from visibility import is_window_visible
+
+#======================================================================
+# COMPONENTS
+#======================================================================
+
+# Sample timestamps are taken on the host with 10 ms resolution, so
+# resampling faster than 100 Hz adds no information
+FLICKER_RATES = (25.0, 50.0, 100.0)
+FLICKER_DEFAULT_RATE = 100.0
+# FFT window lengths in samples; windows overlap by half
+FLICKER_WINDOWS = (64, 128, 256, 512)
+FLICKER_DEFAULT_WINDOW = 256
+# Spectrogram history in windows
+FLICKER_COLUMNS = 120
+FLICKER_REFRESH_MS = 500
+# Spectrogram colour limits in dB of percent modulation
+FLICKER_DB_RANGE = (-20.0, 40.0)
+
+
+def flicker_metrics(y):
+    """
+    Compute the IES flicker metrics of one waveform.
+
+    Args:
+        y (numpy.ndarray):
+            Uniformly sampled light values.
+
+    Returns:
+        tuple:
+            (percent_flicker, flicker_index). Both are 0 for a
+            dark or empty waveform.
+    """
+    if not len(y):
+        return 0.0, 0.0
+    hi, lo = y.max(), y.min()
+    total = y.sum()
+    if hi + lo <= 0 or total <= 0:
+        return 0.0, 0.0
+    percent = 100.0 * (hi - lo) / (hi + lo)
+    # Area above the mean over total area; on a uniform grid the
+    # sample spacing cancels
+    index = np.clip(y - y.mean(), 0, None).sum() / total
+    return float(percent), float(index)
+
+
+class FlickerAnalyzer:
+    """
+    Incremental short-time spectrum of the light channel.
+
+    Each update() resamples only the light samples that arrived
+    since the previous call onto the uniform grid, appends them to
+    a pending buffer and transforms every complete window, advancing
+    by half a window. Finished columns go into a fixed-size
+    spectrogram, so refresh cost follows the new data rather than
+    the capture length.
+
+    After a long pause (e.g. while the window was hidden) only the
+    span the spectrogram can show is processed.
+
+    Args:
+        rate (float):
+            Resample rate in Hz.
+        window (int):
+            FFT length in samples.
+        columns (int):
+            Spectrogram history in windows.
+    """
+    def __init__(self, rate=FLICKER_DEFAULT_RATE, window=FLICKER_DEFAULT_WINDOW,
+                 columns=FLICKER_COLUMNS):
+        self.rate = rate
+        self.window = window
+        self.hop = window // 2
+        self.columns = columns
+        self.taper = np.hanning(window)
+        self.freqs = np.fft.rfftfreq(window, 1.0 / rate)
+        self.reset()
+
+    @property
+    def span(self):
+        """Seconds of data covered by a full spectrogram."""
+        return (self.window + self.hop * (self.columns - 1)) / self.rate
+
+    def reset(self):
+        """
+        Drop all buffered samples and spectra.
+
+        Returns:
+            None
+        """
+        self.pending = np.empty(0)
+        self.t_next = None
+        self.total = None
+        self.spectrogram = np.full((len(self.freqs), self.columns), np.nan)
+        self.spectrum = None
+        self.last_window = None
+
+    def update(self, store):
+        """
+        Process the light samples added to a store since the last call.
+
+        Args:
+            store (StreamStore):
+                Sample store of the stream.
+
+        Returns:
+            bool:
+                True if at least one new window was transformed.
+        """
+        snap = store.snapshot()
+        t = snap["t"]
+        if self.total is not None and store.total < self.total:
+            # The store was reset
+            self.reset()
+        self.total = store.total
+        if not len(t):
+            return False
+        t_last = float(t[-1])
+        t_first = t_last - self.span
+        if self.t_next is None or self.t_next < t_first:
+            self.pending = np.empty(0)
+            self.t_next = max(float(t[0]), t_first)
+        if t_last < self.t_next:
+            return False
+        # One grid step of history lets the first new point interpolate
+        lo = np.searchsorted(t, self.t_next - 1.0 / self.rate)
+        t_new = t[lo:]
+        light = snap["light"][lo:]
+        # Dark readings are real samples; only lines without a Light
+        # value are interpolated over
+        valid = snap["has_light"][lo:]
+        grid = make_grid(self.t_next, t_last, self.rate)
+        values = resample(t_new[valid], light[valid], grid)
+        # Points past the newest light sample are retried next time
+        defined = np.flatnonzero(~np.isnan(values))
+        if not len(defined):
+            return False
+        stop = defined[-1] + 1
+        values = values[:stop]
+        values[np.isnan(values)] = 0.0
+        self.t_next = float(grid[stop - 1]) + 1.0 / self.rate
+        self.pending = np.concatenate((self.pending, values))
+
+        added = 0
+        while len(self.pending) >= self.window:
+            frame = self.pending[:self.window]
+            self.push_window(frame)
+            self.pending = self.pending[self.hop:]
+            added += 1
+        return added > 0
+
+    def push_window(self, frame):
+        """
+        Transform one window and append it to the spectrogram.
+
+        Amplitudes are expressed as percent modulation of the
+        window's mean light level, so the spectrum reads the same at
+        any brightness.
+
+        Args:
+            frame (numpy.ndarray):
+                One window of samples.
+
+        Returns:
+            None
+        """
+        mean = frame.mean()
+        coeffs = np.fft.rfft((frame - mean) * self.taper)
+        amplitude = 2.0 * np.abs(coeffs) / self.taper.sum()
+        amplitude = 100.0 * amplitude / mean if mean > 0 else np.zeros_like(amplitude)
+        self.spectrum = amplitude
+        self.last_window = frame.copy()
+        self.spectrogram[:, :-1] = self.spectrogram[:, 1:]
+        with np.errstate(divide='ignore'):
+            self.spectrogram[:, -1] = 20.0 * np.log10(amplitude)
+
+    def metrics(self):
+        """
+        Summarize the newest window.
+
+        Returns:
+            dict | None:
+                "frequency" (dominant non-DC frequency in Hz),
+                "amplitude" (its percent modulation),
+                "percent" (percent flicker) and "index" (flicker
+                index), or None before the first window.
+        """
+        if self.spectrum is None:
+            return None
+        peak = int(np.argmax(self.spectrum[1:])) + 1
+        percent, index = flicker_metrics(self.last_window)
+        return {
+            "frequency": float(self.freqs[peak]),
+            "amplitude": float(self.spectrum[peak]),
+            "percent": percent,
+            "index": index,
+        }
+
+
+class FlickerFrame(wx.Frame):
+    """
+    Live flicker spectrum, spectrogram and metrics of one stream.
+
+    Args:
+        parent (wx.Window):
+            Parent window reference.
+        store (StreamStore):
+            Sample store of the stream.
+    """
+    def __init__(self, parent, store):
+        super(FlickerFrame, self).__init__(parent, title="Flicker", size=(800, 700))
+        self.SetIcon(wx.Icon(os.path.join(os.path.abspath(os.path.dirname(__file__)), "icons", IMG_ICON)))
+        self.store = store
+        self.analyzer = FlickerAnalyzer()
+
+        self.figure = Figure(figsize=(7, 6), facecolor='black')
+        self.ax_spectrum = self.figure.add_subplot(211)
+        self.ax_spectrogram = self.figure.add_subplot(212)
+        for ax in (self.ax_spectrum, self.ax_spectrogram):
+            ax.set_facecolor('black')
+            ax.tick_params(axis='x', colors='white')
+            ax.tick_params(axis='y', colors='white')
+        self.canvas = FigureCanvas(self, -1, self.figure)
+
+        self.rate_choice = wx.Choice(self, choices=[f"{rate:g} Hz" for rate in FLICKER_RATES])
+        self.rate_choice.SetSelection(FLICKER_RATES.index(FLICKER_DEFAULT_RATE))
+        self.rate_choice.Bind(wx.EVT_CHOICE, self.on_settings_change)
+        self.window_choice = wx.Choice(self, choices=[str(n) for n in FLICKER_WINDOWS])
+        self.window_choice.SetSelection(FLICKER_WINDOWS.index(FLICKER_DEFAULT_WINDOW))
+        self.window_choice.Bind(wx.EVT_CHOICE, self.on_settings_change)
+        self.metrics_text = wx.StaticText(self, label="Waiting for light samples")
+
+        control_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        control_sizer.Add(wx.StaticText(self, label="Rate:"), 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 5)
+        control_sizer.Add(self.rate_choice, 0, wx.RIGHT, 10)
+        control_sizer.Add(wx.StaticText(self, label="Window:"), 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 5)
+        control_sizer.Add(self.window_choice, 0, wx.RIGHT, 15)
+        control_sizer.Add(self.metrics_text, 0, wx.ALIGN_CENTER_VERTICAL)
+
+        sizer = wx.BoxSizer(wx.VERTICAL)
+        sizer.Add(control_sizer, 0, wx.ALL, 5)
+        sizer.Add(self.canvas, 1, wx.EXPAND)
+        self.SetSizer(sizer)
+
+        self._build_artists()
+        self.timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.on_timer, self.timer)
+        self.Bind(wx.EVT_CLOSE, self.on_close)
+        self.timer.Start(FLICKER_REFRESH_MS)
+
+    def _build_artists(self):
+        """
+        Create the spectrum line and spectrogram image for the
+        current analyzer settings.
+
+        Returns:
+            None
+        """
+        analyzer = self.analyzer
+        nyquist = analyzer.rate / 2
+        self.ax_spectrum.clear()
+        self.spectrum_line, = self.ax_spectrum.plot([], [], color='yellow', linewidth=1)
+        self.ax_spectrum.set_xlim(0, nyquist)
+        self.ax_spectrum.set_ylim(0, 1)
+        self.ax_spectrum.set_xlabel("Frequency (Hz)", color='white')
+        self.ax_spectrum.set_ylabel("Modulation (%)", color='white')
+        self.ax_spectrum.grid(True, linestyle='--', alpha=0.3)
+
+        self.ax_spectrogram.clear()
+        self.spectrogram_image = self.ax_spectrogram.imshow(
+            analyzer.spectrogram, origin='lower', aspect='auto', cmap='inferno',
+            extent=(-analyzer.span, 0, 0, nyquist), vmin=FLICKER_DB_RANGE[0],
+            vmax=FLICKER_DB_RANGE[1], interpolation='nearest')
+        self.ax_spectrogram.set_xlabel("Seconds before newest window", color='white')
+        self.ax_spectrogram.set_ylabel("Frequency (Hz)", color='white')
+        self.canvas.draw_idle()
+
+    def on_settings_change(self, event):
+        """
+        Restart the analysis with a new rate or window length.
+
+        Args:
+            event:
+                wx.CommandEvent from the rate or window choice.
+
+        Returns:
+            None
+        """
+        self.analyzer = FlickerAnalyzer(FLICKER_RATES[self.rate_choice.GetSelection()],
+                                        FLICKER_WINDOWS[self.window_choice.GetSelection()])
+        self.metrics_text.SetLabel("Waiting for light samples")
+        self._build_artists()
+        self.on_timer(None)
+
+    def on_timer(self, event):
+        """
+        Analyze new samples and refresh the plots and metrics.
+
+        Skipped while the window is hidden or minimized; the
+        analyzer catches up on the visible span when shown again.
+
+        Args:
+            event:
+                wx.TimerEvent, or None.
+
+        Returns:
+            None
+        """
+        if not is_window_visible(self):
+            return
+        if not self.analyzer.update(self.store):
+            return
+        analyzer = self.analyzer
+        self.spectrum_line.set_data(analyzer.freqs, analyzer.spectrum)
+        self.ax_spectrum.set_ylim(0, max(1.0, 1.1 * float(analyzer.spectrum[1:].max())))
+        self.spectrogram_image.set_data(analyzer.spectrogram)
+        stats = analyzer.metrics()
+        self.metrics_text.SetLabel(
+            f"Dominant: {stats['frequency']:.2f} Hz ({stats['amplitude']:.1f}%)   "
+            f"Percent flicker: {stats['percent']:.1f}%   "
+            f"Flicker index: {stats['index']:.3f}")
+        self.canvas.draw_idle()
+
+    def on_close(self, event):
+        """
+        Stop the refresh timer before the frame is destroyed.
+
+        Args:
+            event:
+                wx.CloseEvent.
+
+        Returns:
+            None
+        """
+        self.timer.Stop()
+        event.Skip()
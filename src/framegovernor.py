@@ -0,0 +1,127 @@
+##############################################################################
+#
+# Module: framegovernor.py
+#
+# Description:
+#     Adaptive refresh rate for the live plot windows. Measures how
+#     long each redraw takes and picks the refresh interval that
+#     keeps drawing inside a share of the CPU.
+#
+# Author:
+#     Vinay N, MCCI Corporation October 2026
+#
+# Revision history:
+#     V2.2.0 Mon Oct 2026 19:10:2026   Vinay N
+#       Module created
+#
+##############################################################################
+# Built-in imports
+import time
+from collections import deque
+
+#======================================================================
+# COMPONENTS
+#======================================================================
+
+# Fraction of wall time a window may spend drawing
+FRAME_CPU_BUDGET = 0.3
+FRAME_MAX_INTERVAL_MS = 1000
+# Delay used to merge bursts of UI interactions into one redraw
+FRAME_COALESCE_MS = 30
+# Smoothing factor for the draw time average
+FRAME_EMA_ALPHA = 0.2
+# Only retune the timer when the interval moves by this fraction
+FRAME_RETUNE_RATIO = 0.15
+FRAME_HISTORY = 60
+
+
+class FrameGovernor:
+    """
+    Choose a refresh interval from measured draw times.
+
+    The interval is the smoothed draw time divided by the CPU
+    budget, clamped to [min_ms, max_ms]. A 5 ms blit therefore
+    runs at the mode's top rate, while a 150 ms full redraw backs
+    off to about two refreshes per second.
+
+    Args:
+        min_ms (int):
+            Shortest refresh interval (fastest rate).
+        max_ms (int):
+            Longest refresh interval.
+        budget (float):
+            Fraction of wall time allowed for drawing.
+    """
+    def __init__(self, min_ms, max_ms=FRAME_MAX_INTERVAL_MS, budget=FRAME_CPU_BUDGET):
+        self.min_ms = min_ms
+        self.max_ms = max_ms
+        self.budget = budget
+        self.interval_ms = min_ms
+        self.draw_ms = None
+        self.last_draw_ms = 0.0
+        self.frames = deque(maxlen=FRAME_HISTORY)
+        self.skipped = 0
+
+    def set_min_interval(self, min_ms):
+        """
+        Change the fastest allowed refresh interval.
+
+        Args:
+            min_ms (int):
+                Shortest refresh interval in milliseconds.
+
+        Returns:
+            None
+        """
+        self.min_ms = min_ms
+        self.interval_ms = max(self.interval_ms, min_ms)
+        self.draw_ms = None
+
+    def record(self, seconds):
+        """
+        Record one redraw and retune the interval.
+
+        Args:
+            seconds (float):
+                Wall time the redraw took.
+
+        Returns:
+            bool:
+                True if interval_ms changed enough that the timer
+                should be restarted.
+        """
+        ms = seconds * 1000.0
+        self.last_draw_ms = ms
+        self.frames.append(time.perf_counter())
+        if self.draw_ms is None:
+            self.draw_ms = ms
+        else:
+            self.draw_ms += FRAME_EMA_ALPHA * (ms - self.draw_ms)
+        target = int(min(self.max_ms, max(self.min_ms, self.draw_ms / self.budget)))
+        if abs(target - self.interval_ms) > FRAME_RETUNE_RATIO * self.interval_ms:
+            self.interval_ms = target
+            return True
+        return False
+
+    def skip(self):
+        """
+        Count a refresh tick that found nothing to redraw.
+
+        Returns:
+            None
+        """
+        self.skipped += 1
+
+    def fps(self):
+        """
+        Redraws per second over the recent history.
+
+        Returns:
+            float
+        """
+        if len(self.frames) < 2:
+            return 0.0
+        span = self.frames[-1] - self.frames[0]
+        if time.perf_counter() - self.frames[-1] > self.max_ms / 1000.0:
+            return 0.0
+        return (len(self.frames) - 1) / span if span > 0 else 0.0
@@ -0,0 +1,338 @@
+##############################################################################
+#
+# Module: histogram.py
+#
+# Description:
+#     Incrementally maintained Light and R/G/B histograms for the
+#     stream plot, plus a live distribution view window.
+#
+# Author:
+#     Vinay N, MCCI Corporation October 2026
+#
+# Revision history:
+#     V2.2.0 Mon Oct 2026 19:10:2026   Vinay N
+#       Module created
+#
+##############################################################################
+# Built-in imports
+import os
+import threading
+
+# Third-party imports
+import wx
+import numpy as np
+
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_wxagg import FigureCanvasWxAgg as FigureCanvas
+
+# Local application imports
+from uiGlobal import *
+from visibility import is_window_visible
+
+#======================================================================
+# COMPONENTS
+#======================================================================
+
+HIST_CHANNELS = ("Light", "R", "G", "B")
+HIST_SCALES = ("fixed", "log")
+
+# (lo, hi, bins) per channel for the linear and logarithmic histograms
+HIST_FIXED_RANGES = {
+    "Light": (0, 3000000, 100),
+    "R": (0, 300, 60),
+    "G": (0, 300, 60),
+    "B": (0, 300, 60),
+}
+HIST_LOG_RANGES = {
+    "Light": (1, 1e7, 70),
+    "R": (1, 1e4, 40),
+    "G": (1, 1e4, 40),
+    "B": (1, 1e4, 40),
+}
+
+HIST_COLORS = {"Light": "yellow", "R": "red", "G": "green", "B": "blue"}
+
+
+class ChannelHistogram:
+    """
+    Fixed-bin or log-bin histogram updated one batch at a time.
+
+    Bin edges are fixed at construction, so each update is a single
+    vectorized bin-index computation plus np.bincount, and reading
+    the counts back costs O(bins) regardless of how many samples
+    have been accumulated.
+
+    Args:
+        lo (float):
+            Lower edge of the first bin.
+        hi (float):
+            Upper edge of the last bin.
+        bins (int):
+            Number of bins.
+        log (bool):
+            Space the bins logarithmically. lo must be > 0.
+    """
+    def __init__(self, lo, hi, bins, log=False):
+        if log and lo <= 0:
+            raise ValueError("Log histogram needs a positive lower edge.")
+        self.lo = lo
+        self.hi = hi
+        self.bins = bins
+        self.log = log
+        if log:
+            self.edges = np.logspace(np.log10(lo), np.log10(hi), bins + 1)
+            self._origin = np.log10(lo)
+            self._scale = bins / (np.log10(hi) - np.log10(lo))
+        else:
+            self.edges = np.linspace(lo, hi, bins + 1)
+            self._origin = float(lo)
+            self._scale = bins / float(hi - lo)
+        self.counts = np.zeros(bins, dtype=np.int64)
+        self.underflow = 0
+        self.overflow = 0
+        self.total = 0
+
+    def update(self, values):
+        """
+        Add a batch of samples to the histogram.
+
+        Args:
+            values (array-like):
+                New samples for this channel.
+
+        Returns:
+            None
+        """
+        v = np.asarray(values, dtype=np.float64)
+        if v.size == 0:
+            return
+        self.total += v.size
+        if self.log:
+            # Zero readings have no place on a log axis
+            positive = v > 0
+            self.underflow += int(v.size - np.count_nonzero(positive))
+            v = np.log10(v[positive])
+        idx = np.floor((v - self._origin) * self._scale).astype(np.int64)
+        under = idx < 0
+        over = idx >= self.bins
+        self.underflow += int(np.count_nonzero(under))
+        self.overflow += int(np.count_nonzero(over))
+        inside = idx[~(under | over)]
+        if inside.size:
+            self.counts += np.bincount(inside, minlength=self.bins)
+
+    def reset(self):
+        """
+        Clear all accumulated counts.
+
+        Returns:
+            None
+        """
+        self.counts[:] = 0
+        self.underflow = 0
+        self.overflow = 0
+        self.total = 0
+
+
+class StreamHistograms:
+    """
+    Fixed and log histograms for every streamed channel.
+
+    The reader thread calls update() once per parsed batch while
+    the GUI thread reads snapshots, so access is guarded by a
+    private lock independent of the sample data lock.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.hists = {"fixed": {}, "log": {}}
+        for ch in HIST_CHANNELS:
+            self.hists["fixed"][ch] = ChannelHistogram(*HIST_FIXED_RANGES[ch])
+            self.hists["log"][ch] = ChannelHistogram(*HIST_LOG_RANGES[ch], log=True)
+
+    def update(self, batch):
+        """
+        Add one parsed batch to the histograms.
+
+        Args:
+            batch (dict):
+                Channel name -> array of valid samples for that
+                channel. Missing channels are skipped.
+
+        Returns:
+            None
+        """
+        with self.lock:
+            for ch, values in batch.items():
+                if ch not in HIST_CHANNELS:
+                    continue
+                self.hists["fixed"][ch].update(values)
+                self.hists["log"][ch].update(values)
+
+    def reset(self):
+        """
+        Clear all channel histograms.
+
+        Returns:
+            None
+        """
+        with self.lock:
+            for scale in HIST_SCALES:
+                for hist in self.hists[scale].values():
+                    hist.reset()
+
+    def snapshot(self, scale):
+        """
+        Copy bin edges and counts for one scale.
+
+        Args:
+            scale (str):
+                "fixed" or "log".
+
+        Returns:
+            dict:
+                Channel name -> (edges, counts) arrays.
+        """
+        with self.lock:
+            return {ch: (h.edges, h.counts.copy())
+                    for ch, h in self.hists[scale].items()}
+
+    def export_rows(self):
+        """
+        Flatten every histogram into rows for CSV/XLSX export.
+
+        Underflow and overflow counts are emitted as open-ended
+        bins so the totals match the number of samples seen.
+
+        Returns:
+            list[list]:
+                Rows of [channel, scale, bin_low, bin_high, count].
+        """
+        rows = []
+        with self.lock:
+            for scale in HIST_SCALES:
+                for ch in HIST_CHANNELS:
+                    h = self.hists[scale][ch]
+                    rows.append([ch, scale, "", h.edges[0], h.underflow])
+                    for lo, hi, count in zip(h.edges[:-1], h.edges[1:], h.counts):
+                        rows.append([ch, scale, float(lo), float(hi), int(count)])
+                    rows.append([ch, scale, h.edges[-1], "", h.overflow])
+        return rows
+
+
+class HistogramFrame(wx.Frame):
+    """
+    Live distribution view of the streamed channels.
+
+    One stairs artist per channel is created up front and only its
+    values are replaced on each refresh, so a redraw costs O(bins)
+    no matter how long the capture has been running.
+
+    Args:
+        parent (wx.Window):
+            Parent window reference.
+        histograms (StreamHistograms):
+            Histogram set maintained by the stream reader.
+    """
+    def __init__(self, parent, histograms):
+        super(HistogramFrame, self).__init__(parent, title="Stream Histogram", size=(800, 600))
+        self.SetIcon(wx.Icon(os.path.join(os.path.abspath(os.path.dirname(__file__)), "icons", IMG_ICON)))
+        self.histograms = histograms
+        self.scale = "fixed"
+
+        self.figure = Figure(figsize=(6, 6), facecolor='black')
+        self.figure.subplots_adjust(hspace=0.5, wspace=0.3)
+        self.canvas = FigureCanvas(self, -1, self.figure)
+        self.axes = {}
+        self.artists = {}
+        for pos, ch in enumerate(HIST_CHANNELS, start=1):
+            ax = self.figure.add_subplot(2, 2, pos)
+            ax.set_facecolor('black')
+            ax.tick_params(axis='x', colors='white')
+            ax.tick_params(axis='y', colors='white')
+            ax.set_title(ch, color='white')
+            ax.grid(True, color='gray', linestyle='--', linewidth=0.5)
+            self.axes[ch] = ax
+
+        self.scale_box = wx.RadioBox(self, label="Bins", choices=["Fixed", "Log"],
+                                     style=wx.RA_SPECIFY_COLS)
+        self.scale_box.Bind(wx.EVT_RADIOBOX, self.on_scale_change)
+
+        sizer = wx.BoxSizer(wx.VERTICAL)
+        sizer.Add(self.scale_box, 0, wx.ALL, 5)
+        sizer.Add(self.canvas, 1, wx.EXPAND)
+        self.SetSizer(sizer)
+
+        self._build_artists()
+        self.timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.on_timer, self.timer)
+        self.Bind(wx.EVT_CLOSE, self.on_close)
+        self.timer.Start(1000)
+
+    def _build_artists(self):
+        """
+        Create one stairs artist per channel for the current scale.
+
+        Returns:
+            None
+        """
+        snap = self.histograms.snapshot(self.scale)
+        for ch, ax in self.axes.items():
+            if ch in self.artists:
+                self.artists[ch].remove()
+            edges, counts = snap[ch]
+            self.artists[ch] = ax.stairs(counts, edges, color=HIST_COLORS[ch], fill=True)
+            ax.set_xscale("log" if self.scale == "log" else "linear")
+            ax.set_xlim(edges[0], edges[-1])
+            ax.set_ylim(0, max(1, int(counts.max())) * 1.1)
+        self.canvas.draw()
+
+    def on_scale_change(self, event):
+        """
+        Switch between fixed and log bins.
+
+        Args:
+            event:
+                wx.CommandEvent from the radio box.
+
+        Returns:
+            None
+        """
+        self.scale = HIST_SCALES[self.scale_box.GetSelection()]
+        self._build_artists()
+
+    def on_timer(self, event):
+        """
+        Refresh the bar heights from the latest counts.
+
+        Skipped while the window is hidden or minimized; the
+        counts keep accumulating and the next visible tick shows
+        them.
+
+        Args:
+            event:
+                wx.TimerEvent.
+
+        Returns:
+            None
+        """
+        if not is_window_visible(self):
+            return
+        snap = self.histograms.snapshot(self.scale)
+        for ch, (edges, counts) in snap.items():
+            self.artists[ch].set_data(values=counts)
+            self.axes[ch].set_ylim(0, max(1, int(counts.max())) * 1.1)
+        self.canvas.draw_idle()
+
+    def on_close(self, event):
+        """
+        Stop the refresh timer before the frame is destroyed.
+
+        Args:
+            event:
+                wx.CloseEvent.
+
+        Returns:
+            None
+        """
+        self.timer.Stop()
+        event.Skip()
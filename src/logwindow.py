@@ -21,12 +21,20 @@ from datetime import datetime
 # Third-party imports
 import wx
 
+# Local application imports
+from memgovernor import get_governor, POLICY_DROP_OLDEST, POLICY_SPILL
+
 
 __author__ = "Vinay N"
 __copyright__ = "Copyright 2025, MCCI Corporation"
 __version__ = "2.0.0"
 __status__ = "Development"
 
+# Approximate bytes held per character of log text
+LOG_CHAR_BYTES = 4
+# Memory governor consumer name of the log window
+LOG_MEMORY_NAME = "Log Window"
+
 
 class LogWindow(wx.Window):
     """
@@ -90,6 +98,14 @@ class LogWindow(wx.Window):
         self._create_layout()
         self._bind_events()
 
+        get_governor().register(
+            LOG_MEMORY_NAME,
+            self.memory_usage,
+            self.release_memory,
+            policies=(POLICY_DROP_OLDEST, POLICY_SPILL),
+            spill_ext=".txt"
+        )
+
     def _create_layout(self):
         """
         Create and arrange UI layout.
@@ -124,6 +140,7 @@ class LogWindow(wx.Window):
                             self.clear_log_window)
         self.btn_save.Bind(wx.EVT_BUTTON,
                            self.save_log_window)
+        self.Bind(wx.EVT_WINDOW_DESTROY, self.on_destroy)
 
     def log_message(self, message):
         """
@@ -170,9 +187,56 @@ class LogWindow(wx.Window):
         except Exception as exc:
             print(f"Log inline error: {exc}")
 
+    def memory_usage(self):
+        """
+        Estimate memory held by the log text.
+
+        Returns:
+            int:
+                Approximate bytes.
+        """
+        return self.scb.GetLastPosition() * LOG_CHAR_BYTES
+
+    def release_memory(self, nbytes, policy, spill_path=None):
+        """
+        Remove the oldest log lines for the memory governor.
+
+        Whole lines are removed; with the spill policy they are
+        appended to spill_path first.
+
+        Args:
+            nbytes (int):
+                Bytes the governor wants released.
+            policy (str):
+                Overflow policy to apply.
+            spill_path (str | None):
+                Text file that removed lines are appended to.
+
+        Returns:
+            int:
+                Approximate bytes released.
+        """
+        last = self.scb.GetLastPosition()
+        chars = min(last, nbytes // LOG_CHAR_BYTES + 1)
+        _, _, line = self.scb.PositionToXY(chars)
+        cut = self.scb.XYToPosition(0, line + 1)
+        if cut < 0:
+            cut = last
+        if cut == 0:
+            return 0
+        if policy == POLICY_SPILL and spill_path:
+            try:
+                with open(spill_path, "a") as file:
+                    file.write(self.scb.GetRange(0, cut))
+            except OSError as exc:
+                print(f"Log spill error: {exc}")
+        self.scb.Remove(0, cut)
+        return cut * LOG_CHAR_BYTES
+
     def clear_log_window(self, event):
         """
-        Clear all log messages from the window.
+        Clear all log messages from the window, including lines
+        already spilled to disk.
 
         Args:
             event:
@@ -182,6 +246,23 @@ class LogWindow(wx.Window):
             None
         """
         self.scb.SetValue("")
+        get_governor().discard_spill(LOG_MEMORY_NAME)
+
+    def on_destroy(self, event):
+        """
+        Delete the spill file and leave the memory governor.
+
+        Args:
+            event:
+                wx.WindowDestroyEvent.
+
+        Returns:
+            None
+        """
+        if event.GetEventObject() is self:
+            get_governor().discard_spill(LOG_MEMORY_NAME)
+            get_governor().unregister(LOG_MEMORY_NAME)
+        event.Skip()
 
     def save_log_window(self, event):
         """
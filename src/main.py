@@ -27,10 +27,12 @@ from firmwarewindow import FirmwarePanel
 import logwindow
 from comdialog import ComDialog
 from streamplot import StreamPlotFrame
+from sessioncompare import SessionCompareFrame
 from blockframe import Blockframe
 from uiGlobal import *
 from aboutDialog import AboutDialog
 from colorset import ColorSet
+from memgovernor import get_governor, MEMORY_POLICIES, MEMORY_CHECK_INTERVAL_MS
 
 
 __author__ = "Vinay N"
@@ -83,6 +85,10 @@ class MainFrame(wx.Frame):
         self._create_menu_bar()
         self._create_main_layout()
 
+        self.mem_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.on_memory_timer, self.mem_timer)
+        self.mem_timer.Start(MEMORY_CHECK_INTERVAL_MS)
+
         self.Centre()
 
     def _create_status_bar(self):
@@ -92,11 +98,12 @@ class MainFrame(wx.Frame):
         Returns:
             None
         """
-        self.CreateStatusBar(3)
-        self.SetStatusWidths([150, 150, 150])
+        self.CreateStatusBar(4)
+        self.SetStatusWidths([150, 150, 150, -1])
         self.SetStatusText("No COM", 0)
         self.SetStatusText("Disconnected", 1)
         self.SetStatusText("SN", 2)
+        self.SetStatusText(get_governor().status_text(), 3)
 
     def _create_menu_bar(self):
         """
@@ -136,6 +143,13 @@ class MainFrame(wx.Frame):
                   self.on_stream_plot,
                   self.stream_plot_item)
 
+        self.compare_item = self.config_menu.Append(
+            wx.ID_ANY, "Compare Sessions"
+        )
+        self.Bind(wx.EVT_MENU,
+                  self.on_compare_sessions,
+                  self.compare_item)
+
         self.color_set = self.config_menu.Append(
             wx.ID_ANY, "Calibration"
         )
@@ -150,6 +164,23 @@ class MainFrame(wx.Frame):
                   self.on_set_blockframe,
                   self.block_frame)
 
+        self.config_menu.AppendSeparator()
+        self.memory_budget = self.config_menu.Append(
+            wx.ID_ANY, "Memory Budget..."
+        )
+        self.Bind(wx.EVT_MENU,
+                  self.on_memory_budget,
+                  self.memory_budget)
+
+        self.policy_menu = wx.Menu()
+        self.policy_items = {}
+        for policy, label in MEMORY_POLICIES.items():
+            item = self.policy_menu.AppendRadioItem(wx.ID_ANY, label)
+            item.Check(policy == get_governor().policy)
+            self.policy_items[item.GetId()] = policy
+            self.Bind(wx.EVT_MENU, self.on_memory_policy, item)
+        self.config_menu.AppendSubMenu(self.policy_menu, "Memory Overflow Policy")
+
         # Help menu
         self.model_about = self.help_menu.Append(
             wx.ID_ANY, "About"
@@ -265,6 +296,20 @@ class MainFrame(wx.Frame):
                                 device=device)
         frame.Show()
 
+    def on_compare_sessions(self, event):
+        """
+        Launch the saved session comparison window.
+
+        Args:
+            event:
+                wx menu event object.
+
+        Returns:
+            None
+        """
+        frame = SessionCompareFrame(parent=None)
+        frame.Show()
+
     def on_set_color(self, event):
         """
         Launch color calibration window.
@@ -299,6 +344,62 @@ class MainFrame(wx.Frame):
                            device=device)
         frame.Show()
 
+    def on_memory_timer(self, event):
+        """
+        Enforce the memory budget and refresh the status bar.
+
+        Args:
+            event:
+                wx timer event object.
+
+        Returns:
+            None
+        """
+        governor = get_governor()
+        governor.enforce()
+        self.SetStatusText(governor.status_text(), 3)
+
+    def on_memory_budget(self, event):
+        """
+        Show per-consumer memory usage and edit the budget.
+
+        Args:
+            event:
+                wx menu event object.
+
+        Returns:
+            None
+        """
+        governor = get_governor()
+        mb = 1024 * 1024
+        lines = [f"{name}: {used / mb:.1f} MB"
+                 for name, used in sorted(governor.usage().items())]
+        budget = wx.GetNumberFromUser(
+            "\n".join(lines) or "No sample buffers open.",
+            "Budget (MB):",
+            "Memory Budget",
+            int(governor.budget // mb),
+            16,
+            65536,
+            self
+        )
+        if budget > 0:
+            governor.set_budget_mb(budget)
+            self.SetStatusText(governor.status_text(), 3)
+
+    def on_memory_policy(self, event):
+        """
+        Select the overflow policy applied when over budget.
+
+        Args:
+            event:
+                wx menu event object.
+
+        Returns:
+            None
+        """
+        get_governor().set_policy(self.policy_items[event.GetId()])
+
     def on_close_app(self, event):
         """
         Close the application.
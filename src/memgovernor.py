@@ -0,0 +1,308 @@
+##############################################################################
+#
+# Module: memgovernor.py
+#
+# Description:
+#     Application wide memory budget for the sample buffers and log
+#     text held by the open acquisition windows.
+#
+# Author:
+#     Vinay N, MCCI Corporation October 2026
+#
+# Revision history:
+#     V2.2.0 Mon Oct 2026 19:10:2026   Vinay N
+#       Module created
+#
+##############################################################################
+# Built-in imports
+import os
+import tempfile
+import threading
+
+#======================================================================
+# COMPONENTS
+#======================================================================
+
+POLICY_DROP_OLDEST = "drop_oldest"
+POLICY_DECIMATE = "decimate"
+POLICY_SPILL = "spill"
+
+MEMORY_POLICIES = {
+    POLICY_DROP_OLDEST: "Drop Oldest",
+    POLICY_DECIMATE: "Decimate",
+    POLICY_SPILL: "Spill to Disk",
+}
+
+DEFAULT_MEMORY_BUDGET_MB = 512
+MEMORY_CHECK_INTERVAL_MS = 1000
+
+# Trim down to this fraction of the budget so the governor does not
+# fire again on the very next sample.
+MEMORY_LOW_WATERMARK = 0.9
+
+MEMORY_SPILL_DIR = os.path.join(tempfile.gettempdir(), "model2450-spill")
+
+
+class MemoryConsumer:
+    """
+    Registration record for one memory consumer.
+
+    Args:
+        name (str):
+            Unique name shown in usage reports.
+        usage (callable):
+            usage() -> bytes currently held.
+        release (callable):
+            release(nbytes, policy, spill_path) -> bytes freed.
+        policies (tuple):
+            Policies the consumer implements. Any other policy
+            falls back to POLICY_DROP_OLDEST.
+        spill_ext (str):
+            File extension used for the consumer's spill file.
+    """
+    def __init__(self, name, usage, release, policies, spill_ext):
+        self.name = name
+        self.usage = usage
+        self.release = release
+        self.policies = policies
+        self.spill_ext = spill_ext
+        self.policy = None
+        self.released = 0
+
+
+class MemoryGovernor:
+    """
+    Track memory held by registered consumers against one budget.
+
+    Consumers register a usage callback and a release callback.
+    enforce() is called periodically from the GUI thread. When the
+    total exceeds the budget, it asks the largest consumers to
+    release memory according to their overflow policy, until the
+    total is back under the low watermark.
+    """
+    def __init__(self, budget_mb=DEFAULT_MEMORY_BUDGET_MB, policy=POLICY_DROP_OLDEST):
+        self.lock = threading.Lock()
+        self.budget = budget_mb * 1024 * 1024
+        self.policy = policy
+        self.consumers = {}
+
+    def register(self, name, usage, release, policies=(POLICY_DROP_OLDEST,), spill_ext=".csv"):
+        """
+        Add a memory consumer.
+
+        Args:
+            name (str):
+                Unique consumer name.
+            usage (callable):
+                usage() -> bytes currently held.
+            release (callable):
+                release(nbytes, policy, spill_path) -> bytes freed.
+            policies (tuple):
+                Supported overflow policies.
+            spill_ext (str):
+                Extension for the consumer's spill file.
+
+        Returns:
+            MemoryConsumer
+        """
+        consumer = MemoryConsumer(name, usage, release, policies, spill_ext)
+        with self.lock:
+            self.consumers[name] = consumer
+        return consumer
+
+    def unregister(self, name):
+        """
+        Remove a memory consumer.
+
+        Args:
+            name (str):
+                Consumer name passed to register().
+
+        Returns:
+            None
+        """
+        with self.lock:
+            self.consumers.pop(name, None)
+
+    def set_budget_mb(self, budget_mb):
+        """
+        Change the application memory budget.
+
+        Args:
+            budget_mb (int):
+                New budget in megabytes.
+
+        Returns:
+            None
+        """
+        self.budget = int(budget_mb) * 1024 * 1024
+
+    def set_policy(self, policy, name=None):
+        """
+        Set the overflow policy globally or for one consumer.
+
+        Args:
+            policy (str):
+                One of MEMORY_POLICIES.
+            name (str | None):
+                Consumer to override, or None for the default
+                used by every consumer without an override.
+
+        Returns:
+            None
+        """
+        if policy not in MEMORY_POLICIES:
+            raise ValueError(f"Unknown memory policy: {policy}")
+        if name is None:
+            self.policy = policy
+        else:
+            with self.lock:
+                if name in self.consumers:
+                    self.consumers[name].policy = policy
+
+    def policy_for(self, consumer):
+        """
+        Resolve the policy applied to a consumer.
+
+        Args:
+            consumer (MemoryConsumer):
+                Registered consumer.
+
+        Returns:
+            str
+        """
+        policy = consumer.policy or self.policy
+        if policy not in consumer.policies:
+            policy = POLICY_DROP_OLDEST
+        return policy
+
+    def spill_path(self, consumer):
+        """
+        Build the spill file path for a consumer.
+
+        The process id is part of the name, so every run spills to
+        fresh files and never appends to an earlier run's.
+
+        Args:
+            consumer (MemoryConsumer):
+                Registered consumer.
+
+        Returns:
+            str
+        """
+        os.makedirs(MEMORY_SPILL_DIR, exist_ok=True)
+        safe = "".join(c if c.isalnum() else "_" for c in consumer.name)
+        return os.path.join(MEMORY_SPILL_DIR, f"{safe}-{os.getpid()}{consumer.spill_ext}")
+
+    def discard_spill(self, name):
+        """
+        Delete a consumer's spill file.
+
+        Consumers that spill synchronously on the GUI thread call
+        this when their data is cleared or their window closes.
+
+        Args:
+            name (str):
+                Consumer name passed to register().
+
+        Returns:
+            None
+        """
+        with self.lock:
+            consumer = self.consumers.get(name)
+        if consumer is None:
+            return
+        path = self.spill_path(consumer)
+        try:
+            if os.path.exists(path):
+                os.remove(path)
+        except OSError as exc:
+            print(f"[Memory] spill cleanup error in {name}: {exc}")
+
+    def usage(self):
+        """
+        Report bytes held by each consumer.
+
+        Returns:
+            dict:
+                Consumer name -> bytes.
+        """
+        with self.lock:
+            consumers = list(self.consumers.values())
+        report = {}
+        for consumer in consumers:
+            try:
+                report[consumer.name] = int(consumer.usage())
+            except Exception as exc:
+                print(f"[Memory] usage error in {consumer.name}: {exc}")
+        return report
+
+    def total(self):
+        """
+        Total bytes held by all consumers.
+
+        Returns:
+            int
+        """
+        return sum(self.usage().values())
+
+    def enforce(self):
+        """
+        Bring total usage back under the budget if it is exceeded.
+
+        Consumers are trimmed largest first, each according to
+        its overflow policy.
+
+        Returns:
+            int:
+                Bytes released.
+        """
+        report = self.usage()
+        total = sum(report.values())
+        if total <= self.budget:
+            return 0
+        excess = total - int(self.budget * MEMORY_LOW_WATERMARK)
+        freed = 0
+        with self.lock:
+            consumers = sorted(self.consumers.values(),
+                               key=lambda c: report.get(c.name, 0), reverse=True)
+        for consumer in consumers:
+            if excess <= 0:
+                break
+            held = report.get(consumer.name, 0)
+            if held <= 0:
+                continue
+            policy = self.policy_for(consumer)
+            path = self.spill_path(consumer) if policy == POLICY_SPILL else None
+            try:
+                released = consumer.release(min(excess, held), policy, path)
+            except Exception as exc:
+                print(f"[Memory] release error in {consumer.name}: {exc}")
+                continue
+            consumer.released += released
+            freed += released
+            excess -= released
+        return freed
+
+    def status_text(self):
+        """
+        Short usage summary for the status bar.
+
+        Returns:
+            str
+        """
+        mb = 1024 * 1024
+        return f"Mem {self.total() / mb:.1f}/{self.budget / mb:.0f} MB"
+
+
+governor = MemoryGovernor()
+
+
+def get_governor():
+    """
+    Return the application wide memory governor.
+
+    Returns:
+        MemoryGovernor
+    """
+    return governor
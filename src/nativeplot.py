@@ -0,0 +1,256 @@
+##############################################################################
+#
+# Module: nativeplot.py
+#
+# Description:
+#     Lightweight stream plot panel drawn directly with
+#     wx.GraphicsContext. Draws the same two-panel RGB / Light view
+#     as the matplotlib renderers with plain polylines, axes and a
+#     grid, for fast live display.
+#
+# Author:
+#     Vinay N, MCCI Corporation October 2026
+#
+# Revision history:
+#     V2.2.0 Mon Oct 2026 19:10:2026   Vinay N
+#       Module created
+#
+##############################################################################
+# Third-party imports
+import wx
+import numpy as np
+
+#======================================================================
+# COMPONENTS
+#======================================================================
+
+# Plot margins in pixels: left, top, right, bottom
+NATIVE_MARGINS = (80, 30, 20, 40)
+# Vertical gap between the two panels
+NATIVE_PANEL_GAP = 50
+NATIVE_GRID_TARGET = 6
+
+NATIVE_TRACES = (
+    ("r", "rgb", "red", 1.2),
+    ("g", "rgb", "green", 1.2),
+    ("b", "rgb", "blue", 1.2),
+    ("light", "light", "yellow", 1.0),
+)
+
+
+def nice_step(span, target=NATIVE_GRID_TARGET):
+    """
+    Pick a 1/2/5 x 10**n grid step giving about target lines.
+
+    Args:
+        span (float):
+            Axis range.
+        target (int):
+            Desired number of grid intervals.
+
+    Returns:
+        float
+    """
+    if span <= 0:
+        return 1.0
+    raw = span / target
+    base = 10 ** np.floor(np.log10(raw))
+    for mult in (1, 2, 5, 10):
+        if raw <= mult * base:
+            return mult * base
+    return 10 * base
+
+
+class NativePlotPanel(wx.Panel):
+    """
+    Two-panel RGB / Light time series drawn with wx.GraphicsContext.
+
+    Data comes from StreamPlotFrame.prepare_view(), which is
+    already decimated to the pixel width, so each paint converts a
+    few thousand points to device coordinates with NumPy and
+    strokes them as polylines.
+
+    Args:
+        parent (wx.Window):
+            Parent window reference.
+        on_hover (callable | None):
+            on_hover(panel, x) with panel "rgb" or "light" and x
+            in seconds before the right edge, or panel None when
+            the pointer leaves the plots.
+        on_wheel (callable | None):
+            on_wheel(steps, ctrl) for mouse wheel pan / zoom.
+    """
+    def __init__(self, parent, on_hover=None, on_wheel=None):
+        super(NativePlotPanel, self).__init__(parent, style=wx.FULL_REPAINT_ON_RESIZE)
+        self.SetBackgroundStyle(wx.BG_STYLE_PAINT)
+        self.on_hover = on_hover
+        self.on_wheel = on_wheel
+        self.view = None
+        self.options = None
+        self.Bind(wx.EVT_PAINT, self.on_paint)
+        self.Bind(wx.EVT_MOTION, self.on_motion)
+        self.Bind(wx.EVT_MOUSEWHEEL, self.on_mouse_wheel)
+
+    def set_view(self, view, options):
+        """
+        Replace the displayed data and repaint immediately.
+
+        Args:
+            view (dict):
+                Visible data from prepare_view().
+            options (dict):
+                Render options from render_options().
+
+        Returns:
+            None
+        """
+        self.view = view
+        self.options = options
+        self.Refresh(eraseBackground=False)
+        self.Update()
+
+    def panel_rects(self):
+        """
+        Plot rectangles for the RGB and Light panels.
+
+        Returns:
+            dict:
+                "rgb" / "light" -> (x, y, width, height).
+        """
+        width, height = self.GetClientSize()
+        left, top, right, bottom = NATIVE_MARGINS
+        plot_w = max(1, width - left - right)
+        plot_h = max(1, (height - top - bottom - NATIVE_PANEL_GAP) // 2)
+        return {
+            "rgb": (left, top, plot_w, plot_h),
+            "light": (left, top + plot_h + NATIVE_PANEL_GAP, plot_w, plot_h),
+        }
+
+    def on_motion(self, event):
+        """
+        Report the hovered panel and time to the owner.
+
+        Args:
+            event:
+                wx.MouseEvent.
+
+        Returns:
+            None
+        """
+        event.Skip()
+        if self.on_hover is None or self.view is None:
+            return
+        px, py = event.GetPosition()
+        window = self.view["plot_window"]
+        for name, (x, y, w, h) in self.panel_rects().items():
+            if x <= px <= x + w and y <= py <= y + h:
+                self.on_hover(name, window * (1.0 - (px - x) / w))
+                return
+        self.on_hover(None, None)
+
+    def on_mouse_wheel(self, event):
+        """
+        Forward wheel steps to the owner.
+
+        Args:
+            event:
+                wx.MouseEvent.
+
+        Returns:
+            None
+        """
+        if self.on_wheel is not None:
+            steps = event.GetWheelRotation() / (event.GetWheelDelta() or 1)
+            self.on_wheel(steps, event.ControlDown())
+
+    def on_paint(self, event):
+        """
+        Draw background, grid, labels and traces.
+
+        Args:
+            event:
+                wx.PaintEvent.
+
+        Returns:
+            None
+        """
+        dc = wx.AutoBufferedPaintDC(self)
+        dc.SetBackground(wx.BLACK_BRUSH)
+        dc.Clear()
+        if self.view is None:
+            return
+        gc = wx.GraphicsContext.Create(dc)
+        rects = self.panel_rects()
+        window = self.view["plot_window"]
+        ylims = {"rgb": self.options["rgb_ylim"], "light": self.options["light_ylim"]}
+        titles = {"rgb": ("Color Intensity", "R : G : B"), "light": ("Light Intensity", "Lux")}
+        for name, rect in rects.items():
+            self.draw_axes(gc, rect, window, ylims[name], *titles[name])
+        visible = self.options["visible"]
+        for channel, panel, colour, width in NATIVE_TRACES:
+            if not visible[channel]:
+                continue
+            x_key = "x_light" if panel == "light" else "x_rgb"
+            self.draw_trace(gc, rects[panel], window, ylims[panel],
+                            self.view[x_key], self.view[channel], colour, width)
+
+    def draw_axes(self, gc, rect, window, ylim, title, ylabel):
+        """
+        Draw one panel's frame, grid and tick labels.
+
+        The X axis runs from window seconds on the left to 0 on the
+        right, like the matplotlib view.
+
+        Returns:
+            None
+        """
+        x, y, w, h = rect
+        font = self.GetFont()
+        gc.SetFont(font, wx.WHITE)
+        gc.SetPen(wx.Pen(wx.Colour(128, 128, 128), 1, wx.PENSTYLE_SHORT_DASH))
+        step = nice_step(window)
+        for tick in np.arange(0, window + step * 0.5, step):
+            px = x + w * (1.0 - tick / window)
+            gc.StrokeLine(px, y, px, y + h)
+            label = f"{tick:g}"
+            tw, _ = gc.GetTextExtent(label)
+            gc.DrawText(label, px - tw / 2, y + h + 4)
+        lo, hi = ylim
+        span = (hi - lo) or 1.0
+        step = nice_step(span)
+        for tick in np.arange(np.ceil(lo / step) * step, hi + step * 0.5, step):
+            py = y + h * (1.0 - (tick - lo) / span)
+            gc.StrokeLine(x, py, x + w, py)
+            label = f"{tick:.0f}"
+            tw, th = gc.GetTextExtent(label)
+            gc.DrawText(label, x - tw - 6, py - th / 2)
+        gc.SetPen(wx.Pen(wx.WHITE, 1))
+        gc.SetBrush(wx.TRANSPARENT_BRUSH)
+        gc.DrawRectangle(x, y, w, h)
+        tw, th = gc.GetTextExtent(title)
+        gc.DrawText(title, x + (w - tw) / 2, y - th - 6)
+        tw, _ = gc.GetTextExtent(ylabel)
+        gc.DrawRotatedText(ylabel, x - 70, y + (h + tw) / 2, np.pi / 2)
+
+    def draw_trace(self, gc, rect, window, ylim, xs, ys, colour, width):
+        """
+        Stroke one channel as polylines, breaking at NaN gaps.
+
+        Returns:
+            None
+        """
+        if not len(xs):
+            return
+        x, y, w, h = rect
+        lo, hi = ylim
+        span = (hi - lo) or 1.0
+        px = x + w * (1.0 - np.asarray(xs, dtype=np.float64) / window)
+        py = y + h * (1.0 - (np.asarray(ys, dtype=np.float64) - lo) / span)
+        gc.Clip(x, y, w, h)
+        gc.SetPen(wx.Pen(wx.Colour(colour), max(1, int(round(width)))))
+        gaps = np.flatnonzero(np.isnan(py))
+        bounds = np.concatenate(([-1], gaps, [len(py)]))
+        for start, end in zip(bounds[:-1] + 1, bounds[1:]):
+            if end - start >= 2:
+                gc.StrokeLines(list(zip(px[start:end].tolist(), py[start:end].tolist())))
+        gc.ResetClip()
@@ -0,0 +1,173 @@
+##############################################################################
+#
+# Module: perfhud.py
+#
+# Description:
+#     Performance counters for the stream plot window. Turns the
+#     hub, store and frame governor counters into a once-a-second
+#     summary for the on-screen HUD and an optional CSV log.
+#
+# Author:
+#     Vinay N, MCCI Corporation October 2026
+#
+# Revision history:
+#     V2.2.0 Mon Oct 2026 19:10:2026   Vinay N
+#       Module created
+#
+##############################################################################
+# Built-in imports
+import csv
+import time
+
+#======================================================================
+# COMPONENTS
+#======================================================================
+
+PERF_HUD_INTERVAL_MS = 1000
+
+PERF_LOG_HEADERS = ['Time', 'Ingest (samples/s)', 'Queue (bytes)', 'Dropped', 'Gaps',
+                    'Decode Errors', 'Prep (ms)', 'Draw (ms)', 'FPS', 'Store (MB)']
+
+
+class PerfMonitor:
+    """
+    Periodic performance summary for one stream plot window.
+
+    Nothing is measured per sample: the hub and store already keep
+    running totals, and the window times each frame for the frame
+    governor. sample() only reads those counters and differences
+    them against the previous call, so it costs the same whether
+    the stream delivers ten or ten thousand samples per second.
+
+    Args:
+        hub (StreamHub):
+            Hub feeding the window.
+        governor (FrameGovernor):
+            The window's frame governor.
+    """
+    def __init__(self, hub, governor):
+        self.hub = hub
+        self.governor = governor
+        self.last_count = None
+        self.last_time = None
+        self.prep_ms = 0.0
+        self.draw_ms = 0.0
+        self.log_file = None
+        self.log_writer = None
+
+    def record_frame(self, prep_seconds, draw_seconds):
+        """
+        Remember the split of the latest frame's time.
+
+        Args:
+            prep_seconds (float):
+                Time spent selecting and decimating the data.
+            draw_seconds (float):
+                Time spent drawing it.
+
+        Returns:
+            None
+        """
+        self.prep_ms = prep_seconds * 1000.0
+        self.draw_ms = draw_seconds * 1000.0
+
+    def queue_bytes(self):
+        """
+        Bytes waiting in the serial driver's receive buffer.
+
+        Returns:
+            int | None:
+                None when no port is open.
+        """
+        ser = self.hub.ser
+        if ser is None:
+            return None
+        try:
+            return ser.in_waiting
+        except Exception:
+            return None
+
+    def sample(self):
+        """
+        Collect one summary and append it to the log if open.
+
+        Returns:
+            dict:
+                "ingest", "queue", "dropped", "gaps",
+                "decode_errors", "prep_ms", "draw_ms", "fps" and
+                "store_mb".
+        """
+        now = time.perf_counter()
+        count = self.hub.ingested
+        ingest = 0.0
+        if self.last_time is not None and count >= self.last_count and now > self.last_time:
+            ingest = (count - self.last_count) / (now - self.last_time)
+        self.last_count, self.last_time = count, now
+        stats = {
+            "ingest": ingest,
+            "queue": self.queue_bytes(),
+            "dropped": self.hub.store.dropped,
+            "gaps": self.hub.gaps,
+            "decode_errors": self.hub.decode_errors,
+            "prep_ms": self.prep_ms,
+            "draw_ms": self.draw_ms,
+            "fps": self.governor.fps(),
+            "store_mb": self.hub.store.nbytes() / (1024 * 1024),
+        }
+        if self.log_writer is not None:
+            self.log_writer.writerow([
+                time.strftime("%Y-%m-%d %H:%M:%S"), f"{ingest:.1f}",
+                "" if stats["queue"] is None else stats["queue"],
+                stats["dropped"], stats["gaps"], stats["decode_errors"],
+                f"{self.prep_ms:.2f}", f"{self.draw_ms:.2f}",
+                f"{stats['fps']:.1f}", f"{stats['store_mb']:.2f}",
+            ])
+            self.log_file.flush()
+        return stats
+
+    def start_log(self, path):
+        """
+        Start appending one CSV row per sample() call.
+
+        Args:
+            path (str):
+                Output CSV file path.
+
+        Returns:
+            None
+        """
+        self.stop_log()
+        self.log_file = open(path, 'w', newline='')
+        self.log_writer = csv.writer(self.log_file)
+        self.log_writer.writerow(PERF_LOG_HEADERS)
+
+    def stop_log(self):
+        """
+        Close the CSV log, if one is open.
+
+        Returns:
+            None
+        """
+        if self.log_file is not None:
+            self.log_file.close()
+        self.log_file = None
+        self.log_writer = None
+
+
+def format_perf(stats):
+    """
+    Render a sample() summary as one HUD line.
+
+    Args:
+        stats (dict):
+            Summary from PerfMonitor.sample().
+
+    Returns:
+        str
+    """
+    queue = "-" if stats["queue"] is None else f"{stats['queue']} B"
+    return (f"Ingest {stats['ingest']:.0f}/s  Queue {queue}  "
+            f"Dropped {stats['dropped']}  Gaps {stats['gaps']}  "
+            f"Errors {stats['decode_errors']}  |  "
+            f"Prep {stats['prep_ms']:.1f} ms  Draw {stats['draw_ms']:.1f} ms  "
+            f"{stats['fps']:.1f} fps  |  Store {stats['store_mb']:.1f} MB")
@@ -0,0 +1,219 @@
+##############################################################################
+#
+# Module: plotrender.py
+#
+# Description:
+#     Renderers for the stream plot. Holds the shared axis drawing
+#     code and a worker thread that rasterizes the plot into an
+#     off-screen buffer so heavy redraws do not block the GUI.
+#
+# Author:
+#     Vinay N, MCCI Corporation October 2026
+#
+# Revision history:
+#     V2.2.0 Mon Oct 2026 19:10:2026   Vinay N
+#       Module created
+#
+##############################################################################
+# Built-in imports
+import time
+import threading
+
+# Third-party imports
+import numpy as np
+
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.ticker import (
+    MultipleLocator,
+    AutoMinorLocator,
+    ScalarFormatter
+)
+
+#======================================================================
+# COMPONENTS
+#======================================================================
+
+
+def draw_stream_axes(ax_rgb, ax_light, view, options):
+    """
+    Rebuild the RGB and Light axes with the visible data.
+
+    Args:
+        ax_rgb, ax_light (matplotlib.axes.Axes):
+            Target axes.
+        view (dict):
+            Visible data from StreamPlotFrame.prepare_view().
+        options (dict):
+            "visible" (channel -> bool), "rgb_ylim",
+            "light_ylim" and "zoom_fit" from
+            StreamPlotFrame.render_options().
+
+    Returns:
+        None
+    """
+    plot_window = view["plot_window"]
+    x_rgb, x_light, y_light = view["x_rgb"], view["x_light"], view["light"]
+    visible = options["visible"]
+
+    ax_rgb.clear()
+    ax_light.clear()
+
+    for ax in [ax_rgb, ax_light]:
+        ax.set_facecolor('black')
+        ax.tick_params(axis='x', colors='white')
+        ax.tick_params(axis='y', colors='white')
+
+    if options["zoom_fit"]:
+        # RGB Plot (Zoom Fit)
+        ax_rgb.set_xlim(plot_window, 0)
+        ax_rgb.xaxis.set_major_locator(MultipleLocator(10))
+        ax_rgb.xaxis.set_minor_locator(AutoMinorLocator(2))
+
+        ax_light.set_xlim(plot_window, 0)
+        ax_light.set_xticks([plot_window, 0])
+        ax_light.set_xticklabels([f"{plot_window:.0f}", "0"])
+        ax_light.set_autoscale_on(False)
+    else:
+        ax_rgb.set_xlim(plot_window, 0)
+        ax_rgb.set_xticks([plot_window, 0])
+        ax_rgb.set_xticklabels([str(int(plot_window)), "0"])
+
+        ax_light.set_xlim(plot_window, 0)
+        ax_light.set_xticks([plot_window, 0])
+        ax_light.set_xticklabels([str(int(plot_window)), "0"])
+
+    if visible["r"] or visible["g"] or visible["b"]:
+        if len(x_rgb):
+            if visible["r"]:
+                ax_rgb.plot(x_rgb, view["r"], color='red', linewidth=1.2)
+            if visible["g"]:
+                ax_rgb.plot(x_rgb, view["g"], color='green', linewidth=1.2)
+            if visible["b"]:
+                ax_rgb.plot(x_rgb, view["b"], color= 'blue', linewidth=1.2)
+
+        ax_rgb.set_ylim(options["rgb_ylim"])
+        ax_rgb.set_title("Color Intensity", color='white')
+        ax_rgb.set_ylabel("R : G : B", color='white')
+        ax_rgb.set_xlabel("Time (s)", color='white')
+
+        # Add locators to force both vertical and horizontal grid lines
+        ax_rgb.xaxis.set_major_locator(MultipleLocator(10))      # vertical lines
+        ax_rgb.xaxis.set_minor_locator(AutoMinorLocator(2))      # vertical minor
+        ax_rgb.yaxis.set_minor_locator(AutoMinorLocator(2))      # horizontal minor
+
+        # Grid lines: both major and minor
+        ax_rgb.grid(True, which='major', axis='both', color='gray', linestyle='--', linewidth=0.7)
+        ax_rgb.grid(True, which='minor', axis='both', color='gray', linestyle=':', linewidth=0.5)
+
+    if visible["light"]:
+        if len(x_light) > 0:
+            ax_light.plot(x_light, y_light, color='yellow', linewidth=0.5)
+            ax_light.set_ylim(options["light_ylim"])
+            ax_light.yaxis.set_major_formatter(ScalarFormatter(useMathText=False))
+            ax_light.ticklabel_format(style='plain', axis='y')
+            ax_light.xaxis.set_major_locator(MultipleLocator(10))
+            ax_light.xaxis.set_minor_locator(AutoMinorLocator(2))
+            ax_light.yaxis.set_major_locator(MultipleLocator(500000))
+            ax_light.yaxis.set_minor_locator(AutoMinorLocator(2))
+            ax_light.grid(True, which='major', axis='both', color='gray', linestyle='--', linewidth=0.7)
+            ax_light.grid(True, which='minor', axis='both', color='gray', linestyle=':', linewidth=0.5)
+
+    ax_light.set_title("Light Intensity", color='white')
+    ax_light.set_ylabel("Lux", color='white')
+    ax_light.set_xlabel("Time (s)", color='white')
+
+
+class RasterRenderer:
+    """
+    Rasterize stream plots on a worker thread.
+
+    The worker owns a private Agg figure laid out like the
+    window's figure, so nothing it touches is shared with the GUI
+    thread. Only the latest submitted frame is kept; frames that
+    arrive while a render is running replace each other, so a slow
+    render never builds up a backlog.
+
+    Args:
+        on_ready (callable):
+            on_ready(rgba, width, height, seconds, token), called
+            on the worker thread with the finished RGBA buffer.
+            Callers marshal it to the GUI thread (wx.CallAfter).
+        subplots (dict):
+            Keyword arguments for Figure.subplots_adjust().
+    """
+    def __init__(self, on_ready, subplots=None):
+        self.on_ready = on_ready
+        self.figure = Figure(facecolor='black')
+        if subplots:
+            self.figure.subplots_adjust(**subplots)
+        self.ax_rgb = self.figure.add_subplot(211)
+        self.ax_light = self.figure.add_subplot(212)
+        self.canvas = FigureCanvasAgg(self.figure)
+        self.cond = threading.Condition()
+        self.pending = None
+        self.keep_running = True
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def submit(self, view, options, width, height, dpi, token=None):
+        """
+        Queue a frame, replacing any frame not yet started.
+
+        Args:
+            view (dict):
+                Visible data from prepare_view().
+            options (dict):
+                Render options for draw_stream_axes().
+            width, height (int):
+                Output size in pixels.
+            dpi (float):
+                Figure resolution.
+            token:
+                Opaque value passed back to on_ready.
+
+        Returns:
+            None
+        """
+        with self.cond:
+            self.pending = (view, options, width, height, dpi, token)
+            self.cond.notify()
+
+    def stop(self):
+        """
+        Stop the worker thread after the current frame.
+
+        Returns:
+            None
+        """
+        with self.cond:
+            self.keep_running = False
+            self.cond.notify()
+
+    def run(self):
+        """
+        Worker loop: render the latest pending frame.
+
+        Returns:
+            None
+        """
+        while True:
+            with self.cond:
+                while self.keep_running and self.pending is None:
+                    self.cond.wait()
+                if not self.keep_running:
+                    return
+                job, self.pending = self.pending, None
+            view, options, width, height, dpi, token = job
+            started = time.perf_counter()
+            try:
+                self.figure.set_dpi(dpi)
+                self.figure.set_size_inches(width / dpi, height / dpi)
+                draw_stream_axes(self.ax_rgb, self.ax_light, view, options)
+                self.canvas.draw()
+                rgba = np.asarray(self.canvas.buffer_rgba()).copy()
+            except Exception as exc:
+                print(f"[Render] raster error: {exc}")
+                continue
+            self.on_ready(rgba, rgba.shape[1], rgba.shape[0],
+                          time.perf_counter() - started, token)
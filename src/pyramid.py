@@ -0,0 +1,440 @@
+##############################################################################
+#
+# Module: pyramid.py
+#
+# Description:
+#     Multi-resolution min/max/mean summaries of the stream store.
+#     Each level summarises blocks of PYRAMID_BASE * 2**level samples
+#     and is updated incrementally as batches arrive, so any zoom
+#     level can be drawn from about one block per pixel column, and
+#     statistics of any sample range combine O(log n) blocks.
+#
+# Author:
+#     Vinay N, MCCI Corporation October 2026
+#
+# Revision history:
+#     V2.2.0 Mon Oct 2026 19:10:2026   Vinay N
+#       Module created
+#
+##############################################################################
+# Third-party imports
+import numpy as np
+
+# Local application imports
+from resample import light_mask
+
+#======================================================================
+# COMPONENTS
+#======================================================================
+
+# Samples per block on the finest level
+PYRAMID_BASE = 64
+PYRAMID_MIN_CAPACITY = 64
+
+PYRAMID_CHANNELS = ("r", "g", "b", "light")
+
+# Block fields and how two adjacent blocks combine. light_area is
+# the Light integral in lux*s: each valid Light sample contributes
+# its value times the time since the previous valid Light sample.
+PYRAMID_FIELDS = [("t0", "first"), ("t1", "last"), ("n_rgb", "add"), ("n_light", "add"),
+                  ("light_area", "add")]
+for _ch in PYRAMID_CHANNELS:
+    PYRAMID_FIELDS += [(_ch + "_min", "min"), (_ch + "_max", "max"), (_ch + "_sum", "add"),
+                       (_ch + "_sq", "add")]
+
+
+def _reduce(rows, starts):
+    """
+    Combine consecutive runs of rows into blocks.
+
+    Args:
+        rows (dict):
+            Field name -> array, one entry per row.
+        starts (numpy.ndarray):
+            Index of the first row of every block.
+
+    Returns:
+        dict:
+            Field name -> array, one entry per block.
+    """
+    ends = np.append(starts[1:], len(rows["t0"])) - 1
+    out = {}
+    for name, how in PYRAMID_FIELDS:
+        col = rows[name]
+        if how == "first":
+            out[name] = col[starts]
+        elif how == "last":
+            out[name] = col[ends]
+        elif how == "min":
+            out[name] = np.minimum.reduceat(col, starts)
+        elif how == "max":
+            out[name] = np.maximum.reduceat(col, starts)
+        else:
+            out[name] = np.add.reduceat(col, starts)
+    return out
+
+
+def sample_rows(columns, prev_light_t=None):
+    """
+    Turn raw store columns into one pyramid row per sample.
+
+    An all-zero R/G/B triple means the RGB channels were not on
+    that line, and light_mask() tells which samples carry Light;
+    other values count as missing.
+
+    Args:
+        columns (dict):
+            "t", "r", "g", "b", "light" (and optionally
+            "has_light") arrays.
+        prev_light_t (float | None):
+            Time of the last valid Light sample before these
+            columns, for the first sample's light_area.
+
+    Returns:
+        dict:
+            Field name -> array.
+    """
+    rgb_valid = (columns["r"] != 0) | (columns["g"] != 0) | (columns["b"] != 0)
+    light_valid = light_mask(columns)
+    t = np.asarray(columns["t"], dtype=np.float64)
+    rows = {"t0": t, "t1": t,
+            "n_rgb": rgb_valid.astype(np.int64), "n_light": light_valid.astype(np.int64)}
+    for ch in PYRAMID_CHANNELS:
+        valid = light_valid if ch == "light" else rgb_valid
+        values = np.asarray(columns[ch], dtype=np.float64)
+        rows[ch + "_min"] = np.where(valid, values, np.inf)
+        rows[ch + "_max"] = np.where(valid, values, -np.inf)
+        rows[ch + "_sum"] = np.where(valid, values, 0.0)
+        rows[ch + "_sq"] = np.where(valid, values * values, 0.0)
+    light_t = t[light_valid]
+    area = np.zeros(len(t))
+    if len(light_t):
+        first = light_t[0] if prev_light_t is None else prev_light_t
+        area[light_valid] = rows["light_sum"][light_valid] * np.diff(light_t, prepend=first)
+    rows["light_area"] = area
+    return rows
+
+
+def block_stats(row):
+    """
+    Per-channel statistics from one combined block row.
+
+    Args:
+        row (dict):
+            Field name -> length-1 array, from _reduce().
+
+    Returns:
+        dict:
+            Channel -> {"count", "mean", "min", "max", "std"},
+            plus "light_integral" in lux*s. Empty channels have
+            count 0 and NaN statistics.
+    """
+    stats = {}
+    for ch in PYRAMID_CHANNELS:
+        n = int(row["n_light" if ch == "light" else "n_rgb"][0])
+        if n == 0:
+            stats[ch] = {"count": 0, "mean": np.nan, "min": np.nan, "max": np.nan, "std": np.nan}
+            continue
+        mean = row[ch + "_sum"][0] / n
+        var = max(0.0, row[ch + "_sq"][0] / n - mean * mean)
+        stats[ch] = {"count": n, "mean": mean, "min": row[ch + "_min"][0],
+                     "max": row[ch + "_max"][0], "std": float(np.sqrt(var))}
+    stats["light_integral"] = float(row["light_area"][0])
+    return stats
+
+
+class PyramidLevel:
+    """
+    Growable block table for one pyramid level.
+
+    Blocks are addressed by absolute block id. Rows before the
+    retained range are dropped by advancing a start offset, the
+    same way StreamStore retires old samples.
+
+    Args:
+        block (int):
+            Samples per block.
+    """
+    def __init__(self, block):
+        self.block = block
+        self.first_id = 0
+        self._cols = {name: np.empty(PYRAMID_MIN_CAPACITY) for name, _ in PYRAMID_FIELDS}
+        self._capacity = PYRAMID_MIN_CAPACITY
+        self._start = 0
+        self._end = 0
+
+    def __len__(self):
+        return self._end - self._start
+
+    @property
+    def last_id(self):
+        return self.first_id + len(self) - 1
+
+    def rows(self, lo_id=None, hi_id=None):
+        """
+        Views of the blocks with ids in [lo_id, hi_id].
+
+        Returns:
+            dict:
+                Field name -> array view.
+        """
+        lo = self._start if lo_id is None else self._start + max(0, lo_id - self.first_id)
+        hi = self._end if hi_id is None else min(self._end, self._start + hi_id - self.first_id + 1)
+        return {name: col[lo:hi] for name, col in self._cols.items()}
+
+    def write(self, first_id, rows):
+        """
+        Store blocks starting at first_id, replacing any blocks
+        from first_id onwards.
+
+        Args:
+            first_id (int):
+                Absolute id of rows[...][0].
+            rows (dict):
+                Field name -> array of blocks.
+
+        Returns:
+            None
+        """
+        n = len(rows["t0"])
+        if not len(self):
+            self.first_id = first_id
+        keep = max(0, first_id - self.first_id)
+        skip = max(0, self.first_id - first_id)
+        self._end = self._start + min(keep, len(self))
+        n -= skip
+        if n <= 0:
+            return
+        if self._end + n > self._capacity:
+            capacity = max(PYRAMID_MIN_CAPACITY, 2 * (len(self) + n))
+            cols = {}
+            for name, col in self._cols.items():
+                cols[name] = np.empty(capacity)
+                cols[name][:len(self)] = col[self._start:self._end]
+            self._end -= self._start
+            self._start = 0
+            self._cols = cols
+            self._capacity = capacity
+        for name, col in self._cols.items():
+            col[self._end:self._end + n] = rows[name][skip:]
+        self._end += n
+
+    def trim(self, first_id):
+        """
+        Drop blocks before first_id.
+
+        Args:
+            first_id (int):
+                Oldest block id to keep.
+
+        Returns:
+            None
+        """
+        drop = min(len(self), first_id - self.first_id)
+        if drop > 0:
+            self._start += drop
+            self.first_id += drop
+
+
+class SummaryPyramid:
+    """
+    Min/max/mean summaries of a sample stream at power-of-two scales.
+
+    Level 0 holds blocks of PYRAMID_BASE samples, level k blocks of
+    PYRAMID_BASE * 2**k samples. Samples are addressed by their
+    absolute index in the stream. New levels are added as the
+    stream grows, so the coarsest level always has a few blocks.
+
+    The block that straddles the retention boundary keeps the
+    statistics of samples that were already dropped; this only
+    affects the oldest block of each level.
+    """
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """
+        Discard all summaries.
+
+        Returns:
+            None
+        """
+        self.levels = [PyramidLevel(PYRAMID_BASE)]
+        self.last_light_t = None
+
+    def append(self, start, columns):
+        """
+        Add a batch of samples.
+
+        Args:
+            start (int):
+                Absolute index of the first sample in the batch.
+            columns (dict):
+                "t", "r", "g", "b", "light" arrays.
+
+        Returns:
+            None
+        """
+        n = len(columns["t"])
+        if n == 0:
+            return
+        ids = (start + np.arange(n)) // PYRAMID_BASE
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(ids)) + 1))
+        blocks = _reduce(sample_rows(columns, self.last_light_t), starts)
+        light_t = columns["t"][light_mask(columns)]
+        if len(light_t):
+            self.last_light_t = float(light_t[-1])
+        first_id = int(ids[0])
+        level = self.levels[0]
+        if len(level) and first_id == level.last_id:
+            # Merge into the partly filled last block
+            last = level.rows(first_id, first_id)
+            merged = {name: np.concatenate((last[name], blocks[name][:1])) for name in blocks}
+            merged = _reduce(merged, np.array([0]))
+            blocks = {name: np.concatenate((merged[name], blocks[name][1:])) for name in blocks}
+        level.write(first_id, blocks)
+        self._propagate(first_id)
+
+    def _propagate(self, changed_id):
+        """
+        Recompute the parents of level-0 blocks from changed_id on.
+
+        Args:
+            changed_id (int):
+                First level-0 block id that changed.
+
+        Returns:
+            None
+        """
+        index = 1
+        while True:
+            child = self.levels[index - 1]
+            if index == len(self.levels):
+                if len(child) < 2:
+                    return
+                self.levels.append(PyramidLevel(child.block * 2))
+                changed_id = child.first_id
+            parent_id = max(changed_id, child.first_id) // 2
+            rows = child.rows(parent_id * 2)
+            count = len(rows["t0"])
+            if count == 0:
+                return
+            first_child = max(parent_id * 2, child.first_id)
+            ids = (first_child + np.arange(count)) // 2
+            starts = np.concatenate(([0], np.flatnonzero(np.diff(ids)) + 1))
+            self.levels[index].write(int(ids[0]), _reduce(rows, starts))
+            changed_id = int(ids[0])
+            index += 1
+
+    def trim(self, first_sample):
+        """
+        Drop blocks that lie entirely before first_sample.
+
+        Args:
+            first_sample (int):
+                Absolute index of the oldest retained sample.
+
+        Returns:
+            None
+        """
+        for level in self.levels:
+            level.trim(first_sample // level.block)
+
+    def rebuild(self, start, columns):
+        """
+        Recompute every level from the retained samples.
+
+        Args:
+            start (int):
+                Absolute index of the first sample.
+            columns (dict):
+                "t", "r", "g", "b", "light" arrays.
+
+        Returns:
+            None
+        """
+        self.reset()
+        self.append(start, columns)
+
+    def range_stats(self, lo, hi, fetch):
+        """
+        Statistics of absolute samples [lo, hi).
+
+        The range is split into a raw head and tail shorter than
+        one level-0 block and at most two aligned blocks per level
+        in between, so the cost is O(log n) regardless of length.
+
+        Args:
+            lo, hi (int):
+                Absolute sample range.
+            fetch (callable):
+                fetch(a, b) -> sample_rows() for absolute [a, b).
+
+        Returns:
+            dict | None:
+                See block_stats(). None for an empty range.
+        """
+        if hi <= lo:
+            return None
+        parts = []
+        head_end = min(hi, -(-lo // PYRAMID_BASE) * PYRAMID_BASE)
+        tail_start = max(head_end, hi // PYRAMID_BASE * PYRAMID_BASE)
+        if lo < head_end:
+            parts.append(fetch(lo, head_end))
+        pos = head_end
+        while pos < tail_start:
+            index = 0
+            while (index + 1 < len(self.levels)
+                   and pos % self.levels[index + 1].block == 0
+                   and pos + self.levels[index + 1].block <= tail_start):
+                index += 1
+            level = self.levels[index]
+            block_id = pos // level.block
+            if not level.first_id <= block_id <= level.last_id:
+                # Summaries not available; fall back to the samples
+                parts.append(fetch(pos, pos + level.block))
+            else:
+                parts.append(level.rows(block_id, block_id))
+            pos += level.block
+        if tail_start < hi:
+            parts.append(fetch(tail_start, hi))
+        merged = {name: np.concatenate([part[name] for part in parts]) for name, _ in PYRAMID_FIELDS}
+        return block_stats(_reduce(merged, np.array([0])))
+
+    def query(self, lo, hi, width):
+        """
+        Summaries for absolute samples [lo, hi) at about width blocks.
+
+        Uses the coarsest level that still has at least width
+        blocks in the range.
+
+        Args:
+            lo, hi (int):
+                Absolute sample range.
+            width (int):
+                Target number of blocks (plot width in pixels).
+
+        Returns:
+            dict | None:
+                Copies of "t0", "t1" and, per channel, "min",
+                "max" and "mean" arrays (NaN where the block has
+                no valid sample). None when the range is too short
+                for level 0 to help.
+        """
+        count = hi - lo
+        if width <= 0 or count < PYRAMID_BASE * width:
+            return None
+        index = 0
+        while index + 1 < len(self.levels) and count // self.levels[index + 1].block >= width:
+            index += 1
+        level = self.levels[index]
+        rows = level.rows(lo // level.block, (hi - 1) // level.block)
+        out = {"t0": rows["t0"].copy(), "t1": rows["t1"].copy()}
+        for ch in PYRAMID_CHANNELS:
+            n = rows["n_light" if ch == "light" else "n_rgb"]
+            empty = n == 0
+            with np.errstate(invalid="ignore", divide="ignore"):
+                out[ch + "_mean"] = np.where(empty, np.nan, rows[ch + "_sum"] / n)
+            out[ch + "_min"] = np.where(empty, np.nan, rows[ch + "_min"])
+            out[ch + "_max"] = np.where(empty, np.nan, rows[ch + "_max"])
+        return out
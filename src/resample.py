@@ -0,0 +1,178 @@
+##############################################################################
+#
+# Module: resample.py
+#
+# Description:
+#     Vectorized resampling of irregularly timed stream samples onto a
+#     uniform time grid, for live display, analysis and export.
+#
+# Author:
+#     Vinay N, MCCI Corporation October 2026
+#
+# Revision history:
+#     V2.2.0 Mon Oct 2026 19:10:2026   Vinay N
+#       Module created
+#
+##############################################################################
+# Third-party imports
+import numpy as np
+
+#======================================================================
+# COMPONENTS
+#======================================================================
+
+RESAMPLE_LINEAR = "linear"
+RESAMPLE_PREVIOUS = "previous"
+RESAMPLE_MEAN = "mean"
+
+RESAMPLE_MODES = {
+    RESAMPLE_LINEAR: "Linear",
+    RESAMPLE_PREVIOUS: "Previous Value",
+    RESAMPLE_MEAN: "Mean per Bin",
+}
+
+# Refuse grids larger than this many points
+RESAMPLE_MAX_POINTS = 50000000
+
+
+def light_mask(columns):
+    """
+    Mask of the samples that carry a Light reading.
+
+    Uses the store's "has_light" flag when present, so dark (zero)
+    readings count as samples. Without it, a zero Light value is
+    taken to mean the line had no Light value.
+
+    Args:
+        columns (dict):
+            "light" array and optionally a "has_light" array.
+
+    Returns:
+        numpy.ndarray:
+            Boolean mask.
+    """
+    has_light = columns.get("has_light")
+    if has_light is None:
+        return np.asarray(columns["light"]) != 0
+    return np.asarray(has_light, dtype=bool)
+
+
+def make_grid(t0, t1, rate):
+    """
+    Build a uniform time grid covering [t0, t1].
+
+    Args:
+        t0 (float):
+            First grid time in seconds.
+        t1 (float):
+            Last time that must be covered.
+        rate (float):
+            Samples per second.
+
+    Returns:
+        numpy.ndarray:
+            Grid times t0 + k / rate.
+
+    Raises:
+        ValueError:
+            If rate is not positive or the grid is too large.
+    """
+    if rate <= 0:
+        raise ValueError("Resample rate must be positive.")
+    count = int(np.floor((t1 - t0) * rate)) + 1
+    if count > RESAMPLE_MAX_POINTS:
+        raise ValueError(f"Resampled grid too large ({count} points).")
+    return t0 + np.arange(max(count, 0)) / rate
+
+
+def resample(t, y, grid, mode=RESAMPLE_LINEAR):
+    """
+    Resample one channel onto a uniform grid.
+
+    Modes:
+        • linear   → straight line between neighbouring samples
+        • previous → last sample at or before each grid time
+        • mean     → mean of the samples in [grid_k, grid_k+1)
+
+    Grid points that no sample can define (before the first
+    sample, after the last for linear, or empty bins for mean)
+    are NaN.
+
+    Args:
+        t (numpy.ndarray):
+            Non-decreasing sample times.
+        y (numpy.ndarray):
+            Sample values.
+        grid (numpy.ndarray):
+            Uniform grid from make_grid().
+        mode (str):
+            RESAMPLE_LINEAR, RESAMPLE_PREVIOUS or RESAMPLE_MEAN.
+
+    Returns:
+        numpy.ndarray:
+            float64 values on the grid.
+    """
+    out = np.full(len(grid), np.nan)
+    if not len(t) or not len(grid):
+        return out
+    y = np.asarray(y, dtype=np.float64)
+    if mode == RESAMPLE_LINEAR:
+        return np.interp(grid, t, y, left=np.nan, right=np.nan)
+    if mode == RESAMPLE_PREVIOUS:
+        idx = np.searchsorted(t, grid, side="right") - 1
+        defined = idx >= 0
+        out[defined] = y[idx[defined]]
+        return out
+    if mode == RESAMPLE_MEAN:
+        period = grid[1] - grid[0] if len(grid) > 1 else 1.0
+        bins = np.floor((t - grid[0]) / period).astype(np.int64)
+        inside = (bins >= 0) & (bins < len(grid))
+        bins = bins[inside]
+        counts = np.bincount(bins, minlength=len(grid))
+        sums = np.bincount(bins, weights=y[inside], minlength=len(grid))
+        filled = counts > 0
+        out[filled] = sums[filled] / counts[filled]
+        return out
+    raise ValueError(f"Unknown resample mode: {mode}")
+
+
+def resample_columns(columns, rate, mode=RESAMPLE_LINEAR, t0=None, t1=None):
+    """
+    Resample stream store columns onto one shared grid.
+
+    An all-zero R/G/B triple means the RGB channels were not
+    present on that line, and light_mask() tells which samples
+    carry Light, so each channel is resampled from its own valid
+    samples only.
+
+    Args:
+        columns (dict):
+            "t", "r", "g", "b", "light" (and optionally
+            "has_light") arrays, e.g. from StreamStore.snapshot().
+        rate (float):
+            Output samples per second.
+        mode (str):
+            One of RESAMPLE_MODES.
+        t0 (float | None):
+            Grid start; defaults to the first sample time.
+        t1 (float | None):
+            Grid end; defaults to the last sample time.
+
+    Returns:
+        dict:
+            "t" grid plus float64 "r", "g", "b", "light" arrays.
+    """
+    t = columns["t"]
+    if t0 is None:
+        t0 = t[0] if len(t) else 0.0
+    if t1 is None:
+        t1 = t[-1] if len(t) else t0
+    grid = make_grid(t0, t1, rate)
+    rgb_valid = (columns["r"] != 0) | (columns["g"] != 0) | (columns["b"] != 0)
+    light_valid = light_mask(columns)
+    t_rgb = t[rgb_valid]
+    out = {"t": grid}
+    for ch in ("r", "g", "b"):
+        out[ch] = resample(t_rgb, columns[ch][rgb_valid], grid, mode)
+    out["light"] = resample(t[light_valid], columns["light"][light_valid], grid, mode)
+    return out
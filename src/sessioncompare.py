@@ -0,0 +1,555 @@
+##############################################################################
+#
+# Module: sessioncompare.py
+#
+# Description:
+#     Overlay comparison of saved stream sessions. Loads two or more
+#     saved captures into one plot, aligned at their start or at a
+#     detected event, for regression testing against a reference
+#     capture.
+#
+# Author:
+#     Vinay N, MCCI Corporation October 2026
+#
+# Revision history:
+#     V2.2.0 Mon Oct 2026 19:10:2026   Vinay N
+#       Module created
+#
+##############################################################################
+# Built-in imports
+import io
+import os
+from collections import OrderedDict
+
+# Third-party imports
+import wx
+import numpy as np
+
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_wxagg import FigureCanvasWxAgg as FigureCanvas
+
+# Local application imports
+from uiGlobal import *
+from streamstore import StreamStore, STREAM_MIN_CAPACITY
+from decimate import m4_indices
+from framegovernor import FRAME_COALESCE_MS
+from trigger import Trigger, TRIGGER_EDGE, TRIGGER_DIRECTIONS
+
+#======================================================================
+# COMPONENTS
+#======================================================================
+
+SESSION_COLUMNS = {"time": "t", "light": "light", "r": "r", "g": "g", "b": "b"}
+SESSION_CHANNELS = {"light": "Light", "r": "Red", "g": "Green", "b": "Blue"}
+SESSION_COLOURS = ("yellow", "cyan", "magenta", "lime", "orange", "white", "red", "dodgerblue")
+
+ALIGN_START = "start"
+ALIGN_EVENT = "event"
+ALIGN_MODES = {ALIGN_START: "Session start", ALIGN_EVENT: "First event"}
+
+# Prepared views kept per session
+SESSION_VIEW_CACHE_SIZE = 16
+COMPARE_WHEEL_ZOOM = 1.25
+
+
+def load_session(path):
+    """
+    Load a saved stream capture.
+
+    Reads CSV files written by the stream plot's Save File (raw or
+    resampled) and stream spill files. A Time column is required;
+    'null' and NaN entries are read as 0, the store's marker for a
+    missing reading.
+
+    Args:
+        path (str):
+            CSV file path.
+
+    Returns:
+        StreamStore:
+            Store holding the whole capture, with its summary
+            pyramid built.
+
+    Raises:
+        ValueError:
+            If the file has no Time column or no samples.
+    """
+    with open(path, newline='') as csvfile:
+        header = csvfile.readline()
+        text = csvfile.read().replace("null", "0")
+    names = [name.strip().lower() for name in header.split(",")]
+    if "time" not in names:
+        raise ValueError(f"{os.path.basename(path)} has no Time column. "
+                         "Save the capture again to include sample times.")
+    table = np.loadtxt(io.StringIO(text), delimiter=",", ndmin=2)
+    if not len(table):
+        raise ValueError(f"{os.path.basename(path)} contains no samples.")
+    table = table[np.argsort(table[:, names.index("time")], kind="stable")]
+    cols = {}
+    for name, key in SESSION_COLUMNS.items():
+        if name in names:
+            values = table[:, names.index(name)]
+            cols[key] = values if key == "t" else np.rint(np.nan_to_num(values)).astype(np.int32)
+        else:
+            cols[key] = np.zeros(len(table), dtype=np.int32)
+    store = StreamStore(maxlen=max(len(table), STREAM_MIN_CAPACITY))
+    store.append(cols["t"], cols["r"], cols["g"], cols["b"], cols["light"])
+    return store
+
+
+class Session:
+    """
+    One loaded capture in the comparison view.
+
+    Each session keeps its own StreamStore, whose summary pyramid
+    serves wide ranges, and a small LRU cache of prepared views so
+    zooming back to a previous range or switching channels reuses
+    earlier work.
+
+    Args:
+        path (str):
+            Source file path.
+        store (StreamStore):
+            Loaded samples.
+        colour (str):
+            Matplotlib colour of the session's trace.
+    """
+    def __init__(self, path, store, colour):
+        self.path = path
+        self.name = os.path.basename(path)
+        self.store = store
+        self.colour = colour
+        t = store.snapshot()["t"]
+        self.start = float(t[0])
+        self.end = float(t[-1])
+        self.offset = self.start
+        self.cache = OrderedDict()
+
+    def event_time(self, channel, threshold, direction):
+        """
+        Time of the first edge crossing of a threshold.
+
+        Args:
+            channel (str):
+                Key of SESSION_CHANNELS.
+            threshold (float):
+                Crossing level.
+            direction (str):
+                One of TRIGGER_DIRECTIONS.
+
+        Returns:
+            float | None:
+                Session time of the first crossing, or None.
+        """
+        snap = self.store.snapshot()
+        values = snap[channel]
+        if channel == "light":
+            valid = np.flatnonzero(snap["has_light"])
+        else:
+            valid = np.flatnonzero(snap["r"] | snap["g"] | snap["b"])
+        if len(valid) < 2:
+            return None
+        hits = Trigger(TRIGGER_EDGE, channel, threshold, direction).evaluate(values[valid], None)
+        if not hits.any():
+            return None
+        return float(snap["t"][valid[np.argmax(hits)]])
+
+    def view(self, channel, x_lo, x_hi, width):
+        """
+        Plot data of one channel for an aligned time range.
+
+        Args:
+            channel (str):
+                Key of SESSION_CHANNELS.
+            x_lo, x_hi (float):
+                Range in seconds relative to the alignment point.
+            width (int):
+                Plot width in pixels.
+
+        Returns:
+            tuple:
+                (x, y) arrays in aligned seconds, at most a few
+                points per pixel. Missing Light readings are NaN;
+                rows without RGB are left out.
+        """
+        key = (channel, float(x_lo), float(x_hi), width, self.offset)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.cache.move_to_end(key)
+            return cached
+        t_lo, t_hi = x_lo + self.offset, x_hi + self.offset
+        summary = self.store.summary(t_lo, t_hi, width)
+        if summary is not None:
+            x = np.column_stack((summary["t0"], summary["t1"])).ravel()
+            y = np.column_stack((summary[channel + "_min"], summary[channel + "_max"])).ravel()
+        else:
+            snap = self.store.snapshot()
+            t = snap["t"]
+            lo = int(np.searchsorted(t, t_lo, side="left"))
+            hi = int(np.searchsorted(t, t_hi, side="right"))
+            # One sample of margin on each side so the line reaches
+            # the plot edges
+            lo, hi = max(0, lo - 1), min(len(t), hi + 1)
+            x = t[lo:hi]
+            y = snap[channel][lo:hi].astype(np.float32)
+            missing = ~snap["has_light"][lo:hi] if channel == "light" else y == 0
+            y[missing] = np.nan
+            keep = m4_indices(x, [y], width, t_lo, t_hi)
+            x, y = x[keep], y[keep]
+        if channel != "light":
+            # RGB-less rows are skipped rather than drawn as gaps, as
+            # in the live plot
+            valid = ~np.isnan(y)
+            x, y = x[valid], y[valid]
+        result = (x - self.offset, y)
+        self.cache[key] = result
+        if len(self.cache) > SESSION_VIEW_CACHE_SIZE:
+            self.cache.popitem(last=False)
+        return result
+
+
+class SessionCompareFrame(wx.Frame):
+    """
+    Overlay saved stream sessions on one time axis.
+
+    Functional Behavior:
+        • Add Session loads saved CSV captures; each gets its own
+          colour and can be shown, hidden or removed.
+        • Sessions are aligned at their first sample or at the
+          first crossing of an event threshold on the plotted
+          channel, so X is seconds since the alignment point.
+        • Mouse wheel zooms around the pointer, dragging pans,
+          and Fit shows every session in full.
+        • Every redraw asks each session only for the visible
+          range at the plot's pixel width, served from its
+          summary pyramid or an M4-decimated slice, so panning
+          across multi-million-sample sessions stays
+          interactive.
+
+    Args:
+        parent (wx.Window):
+            Parent window reference.
+    """
+    def __init__(self, parent=None):
+        super(SessionCompareFrame, self).__init__(parent, title="Compare Sessions", size=(1000, 700))
+        self.SetIcon(wx.Icon(os.path.join(os.path.abspath(os.path.dirname(__file__)), "icons", IMG_ICON)))
+        self.sessions = []
+        self.lines = []
+        self.drag_start = None
+
+        self.figure = Figure(figsize=(6, 4), facecolor='black')
+        self.ax = self.figure.add_subplot(111)
+        self.ax.set_facecolor('black')
+        self.ax.tick_params(axis='x', colors='white')
+        self.ax.tick_params(axis='y', colors='white')
+        self.ax.grid(True, color='gray', linestyle='--', linewidth=0.5)
+        self.ax.set_xlabel("Time since alignment (s)", color='white')
+        self.canvas = FigureCanvas(self, -1, self.figure)
+
+        self.session_list = wx.CheckListBox(self, size=(220, -1))
+        self.session_list.Bind(wx.EVT_CHECKLISTBOX, lambda evt: self.request_redraw())
+        add_btn = wx.Button(self, label="Add Session...")
+        add_btn.Bind(wx.EVT_BUTTON, self.on_add_session)
+        remove_btn = wx.Button(self, label="Remove")
+        remove_btn.Bind(wx.EVT_BUTTON, self.on_remove_session)
+
+        self.channel_keys = list(SESSION_CHANNELS)
+        self.channel_choice = wx.Choice(self, choices=list(SESSION_CHANNELS.values()))
+        self.channel_choice.SetSelection(0)
+        self.channel_choice.Bind(wx.EVT_CHOICE, self.on_align_change)
+        self.align_keys = list(ALIGN_MODES)
+        self.align_choice = wx.Choice(self, choices=list(ALIGN_MODES.values()))
+        self.align_choice.SetSelection(0)
+        self.align_choice.Bind(wx.EVT_CHOICE, self.on_align_change)
+        self.threshold_ctrl = wx.TextCtrl(self, value="1000", size=(80, -1),
+                                          style=wx.TE_PROCESS_ENTER)
+        self.threshold_ctrl.Bind(wx.EVT_TEXT_ENTER, self.on_align_change)
+        self.direction_choice = wx.Choice(self, choices=[d.capitalize() for d in TRIGGER_DIRECTIONS])
+        self.direction_choice.SetSelection(0)
+        self.direction_choice.Bind(wx.EVT_CHOICE, self.on_align_change)
+        fit_btn = wx.Button(self, label="Fit")
+        fit_btn.Bind(wx.EVT_BUTTON, self.on_fit)
+        self.status_text = wx.StaticText(self, label="Add two or more saved sessions to compare.")
+
+        side_sizer = wx.BoxSizer(wx.VERTICAL)
+        side_sizer.Add(self.session_list, 1, wx.EXPAND | wx.BOTTOM, 5)
+        side_sizer.Add(add_btn, 0, wx.EXPAND | wx.BOTTOM, 5)
+        side_sizer.Add(remove_btn, 0, wx.EXPAND)
+
+        control_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        for label, ctrl in (("Channel:", self.channel_choice), ("Align:", self.align_choice),
+                            ("Event level:", self.threshold_ctrl), ("Edge:", self.direction_choice)):
+            control_sizer.Add(wx.StaticText(self, label=label), 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 5)
+            control_sizer.Add(ctrl, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 10)
+        control_sizer.Add(fit_btn, 0, wx.ALIGN_CENTER_VERTICAL)
+
+        plot_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        plot_sizer.Add(self.canvas, 1, wx.EXPAND)
+        plot_sizer.Add(side_sizer, 0, wx.EXPAND | wx.ALL, 5)
+
+        main_sizer = wx.BoxSizer(wx.VERTICAL)
+        main_sizer.Add(plot_sizer, 1, wx.EXPAND)
+        main_sizer.Add(control_sizer, 0, wx.ALL, 5)
+        main_sizer.Add(self.status_text, 0, wx.LEFT | wx.BOTTOM, 5)
+        self.SetSizer(main_sizer)
+
+        self.redraw_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, lambda evt: self.update_plot(), self.redraw_timer)
+        self.canvas.mpl_connect("scroll_event", self.on_scroll)
+        self.canvas.mpl_connect("button_press_event", self.on_press)
+        self.canvas.mpl_connect("motion_notify_event", self.on_drag)
+        self.canvas.mpl_connect("button_release_event", self.on_release)
+        self.canvas.mpl_connect("resize_event", lambda evt: self.request_redraw())
+        self.Bind(wx.EVT_CLOSE, self.on_close)
+
+    def on_close(self, event):
+        """
+        Stop the redraw timer and close the window.
+
+        Args:
+            event:
+                wx.CloseEvent.
+
+        Returns:
+            None
+        """
+        self.redraw_timer.Stop()
+        event.Skip()
+
+    def on_add_session(self, event):
+        """
+        Load one or more saved captures.
+
+        Args:
+            event:
+                wx.ButtonEvent from Add Session.
+
+        Returns:
+            None
+        """
+        with wx.FileDialog(self, "Add Session", wildcard="CSV files (*.csv)|*.csv",
+                           style=wx.FD_OPEN | wx.FD_FILE_MUST_EXIST | wx.FD_MULTIPLE) as dialog:
+            if dialog.ShowModal() == wx.ID_CANCEL:
+                return
+            paths = dialog.GetPaths()
+        errors = []
+        with wx.BusyCursor():
+            for path in paths:
+                try:
+                    store = load_session(path)
+                except (OSError, ValueError) as exc:
+                    errors.append(f"{os.path.basename(path)}: {exc}")
+                    continue
+                colour = SESSION_COLOURS[len(self.sessions) % len(SESSION_COLOURS)]
+                session = Session(path, store, colour)
+                self.sessions.append(session)
+                line, = self.ax.plot([], [], color=colour, linewidth=0.8, label=session.name)
+                self.lines.append(line)
+                self.session_list.Append(session.name)
+                self.session_list.Check(len(self.sessions) - 1)
+        if errors:
+            wx.MessageBox("Could not load:\n" + "\n".join(errors), "Error", wx.OK | wx.ICON_ERROR)
+        self.align_sessions()
+        self.fit()
+
+    def on_remove_session(self, event):
+        """
+        Remove the selected session from the comparison.
+
+        Args:
+            event:
+                wx.ButtonEvent from Remove.
+
+        Returns:
+            None
+        """
+        index = self.session_list.GetSelection()
+        if index == wx.NOT_FOUND:
+            return
+        self.session_list.Delete(index)
+        del self.sessions[index]
+        self.lines.pop(index).remove()
+        self.update_legend()
+        self.request_redraw()
+
+    def update_legend(self):
+        """
+        Rebuild the legend for the loaded sessions.
+
+        Returns:
+            None
+        """
+        if self.ax.get_legend():
+            self.ax.get_legend().remove()
+        if self.lines:
+            self.ax.legend(handles=self.lines, loc='upper right', fontsize='small')
+
+    def on_align_change(self, event):
+        """
+        Re-align the sessions after a channel or alignment change.
+
+        Args:
+            event:
+                wx event from the alignment controls.
+
+        Returns:
+            None
+        """
+        self.align_sessions()
+        self.request_redraw()
+
+    def align_sessions(self):
+        """
+        Set each session's offset for the chosen alignment.
+
+        Sessions without a matching event stay aligned at their
+        start and are listed in the status line.
+
+        Returns:
+            None
+        """
+        channel = self.channel_keys[self.channel_choice.GetSelection()]
+        self.ax.set_ylabel(SESSION_CHANNELS[channel], color='white')
+        self.update_legend()
+        if self.align_keys[self.align_choice.GetSelection()] == ALIGN_START:
+            for session in self.sessions:
+                session.offset = session.start
+            self.status_text.SetLabel(f"{len(self.sessions)} sessions aligned at start")
+            return
+        try:
+            threshold = float(self.threshold_ctrl.GetValue())
+        except ValueError:
+            self.status_text.SetLabel("Event level must be a number")
+            return
+        direction = TRIGGER_DIRECTIONS[self.direction_choice.GetSelection()]
+        missing = []
+        for session in self.sessions:
+            event_t = session.event_time(channel, threshold, direction)
+            if event_t is None:
+                missing.append(session.name)
+                event_t = session.start
+            session.offset = event_t
+        label = f"{len(self.sessions)} sessions aligned at first {direction} crossing of {threshold:g}"
+        if missing:
+            label += "; no event in " + ", ".join(missing)
+        self.status_text.SetLabel(label)
+
+    def on_fit(self, event):
+        """
+        Show every session in full.
+
+        Args:
+            event:
+                wx.ButtonEvent from Fit.
+
+        Returns:
+            None
+        """
+        self.fit()
+
+    def fit(self):
+        """
+        Set the X range to cover all aligned sessions.
+
+        Returns:
+            None
+        """
+        if not self.sessions:
+            return
+        lo = min(s.start - s.offset for s in self.sessions)
+        hi = max(s.end - s.offset for s in self.sessions)
+        self.ax.set_xlim(lo, hi if hi > lo else lo + 1.0)
+        self.request_redraw()
+
+    def on_scroll(self, event):
+        """
+        Zoom the X axis around the pointer.
+
+        Args:
+            event:
+                Matplotlib scroll_event.
+
+        Returns:
+            None
+        """
+        if event.xdata is None:
+            return
+        factor = 1 / COMPARE_WHEEL_ZOOM if event.step > 0 else COMPARE_WHEEL_ZOOM
+        lo, hi = self.ax.get_xlim()
+        self.ax.set_xlim(event.xdata - (event.xdata - lo) * factor,
+                         event.xdata + (hi - event.xdata) * factor)
+        self.request_redraw()
+
+    def on_press(self, event):
+        """
+        Start a pan drag.
+
+        Args:
+            event:
+                Matplotlib button_press_event.
+
+        Returns:
+            None
+        """
+        if event.inaxes == self.ax and event.button == 1:
+            self.drag_start = (event.x, self.ax.get_xlim())
+
+    def on_drag(self, event):
+        """
+        Pan the X axis while dragging.
+
+        Args:
+            event:
+                Matplotlib motion_notify_event.
+
+        Returns:
+            None
+        """
+        if self.drag_start is None:
+            return
+        x0, (lo, hi) = self.drag_start
+        shift = (event.x - x0) * (hi - lo) / max(1.0, self.ax.bbox.width)
+        self.ax.set_xlim(lo - shift, hi - shift)
+        self.request_redraw()
+
+    def on_release(self, event):
+        """
+        End a pan drag.
+
+        Args:
+            event:
+                Matplotlib button_release_event.
+
+        Returns:
+            None
+        """
+        self.drag_start = None
+
+    def request_redraw(self):
+        """
+        Schedule a redraw, merging bursts of pan and zoom events.
+
+        Returns:
+            None
+        """
+        if not self.redraw_timer.IsRunning():
+            self.redraw_timer.StartOnce(FRAME_COALESCE_MS)
+
+    def update_plot(self):
+        """
+        Fetch the visible range of each shown session and redraw.
+
+        Returns:
+            None
+        """
+        channel = self.channel_keys[self.channel_choice.GetSelection()]
+        x_lo, x_hi = self.ax.get_xlim()
+        width = max(1, int(self.ax.bbox.width))
+        for index, (session, line) in enumerate(zip(self.sessions, self.lines)):
+            shown = self.session_list.IsChecked(index)
+            line.set_visible(shown)
+            if shown:
+                line.set_data(*session.view(channel, x_lo, x_hi, width))
+        self.ax.relim(visible_only=True)
+        self.ax.autoscale_view(scalex=False)
+        self.canvas.draw_idle()
@@ -0,0 +1,418 @@
+##############################################################################
+#
+# Module: streamhub.py
+#
+# Description:
+#     Per-device stream hub. Owns the single serial reader thread and
+#     the sample store for a Model2450, and fans the stream out to
+#     every Stream Plot window subscribed to that device.
+#
+# Author:
+#     Vinay N, MCCI Corporation October 2026
+#
+# Revision history:
+#     V2.2.0 Mon Oct 2026 19:10:2026   Vinay N
+#       Module created
+#
+##############################################################################
+# Built-in imports
+import time
+import threading
+
+# Third-party imports
+import numpy as np
+
+# Local application imports
+from histogram import StreamHistograms
+from chromaticity import StreamChromaticity
+from streamstore import StreamStore
+from memgovernor import get_governor, MEMORY_POLICIES
+from trigger import TriggerEngine
+
+#======================================================================
+# COMPONENTS
+#======================================================================
+
+# A pause longer than this between samples of a running stream is
+# counted as a gap
+STREAM_GAP_SECONDS = 0.5
+
+# === Packet Decoding ===
+def decode_packet(packet_bytes):
+    """
+    Decode a raw binary packet received from the device.
+
+    Extracts header fields and payload data based on
+    Model2450 streaming protocol structure.
+
+    Args:
+        packet_bytes (bytes):
+            Raw packet bytes read from serial stream.
+
+    Returns:
+        dict:
+            Decoded packet fields:
+                - start_bit
+                - end_bit
+                - reserved
+                - command
+                - sequence
+                - length
+                - payload
+
+    Raises:
+        ValueError:
+            If packet is too short or length mismatch occurs.
+    """
+    if len(packet_bytes) < 2:
+        raise ValueError("Packet too short to decode header.")
+    header_byte_0 = packet_bytes[0]
+    header_byte_1 = packet_bytes[1]
+    start_bit = (header_byte_0 >> 7) & 0x01
+    end_bit = (header_byte_0 >> 6) & 0x01
+    reserved = (header_byte_0 >> 5) & 0x01
+    command = header_byte_0 & 0x1F
+    sequence = (header_byte_1 >> 5) & 0x07
+    length = header_byte_1 & 0x1F
+    if len(packet_bytes) < length:
+        raise ValueError(f"Packet length mismatch. Expected {length}, got {len(packet_bytes)}")
+    payload = packet_bytes[2:length]
+    return {
+        "start_bit": start_bit,
+        "end_bit": end_bit,
+        "reserved": reserved,
+        "command": command,
+        "sequence": sequence,
+        "length": length,
+        "payload": payload
+    }
+
+def read_packet_from_serial(ser):
+    """
+    Read one complete packet from serial stream.
+
+    The function first reads header bytes to determine
+    payload length, then reads remaining payload.
+
+    Args:
+        ser (serial.Serial):
+            Active serial connection object.
+
+    Returns:
+        bytes | None:
+            Complete packet bytes if successful,
+            otherwise None if timeout/incomplete read.
+    """
+    header = ser.read(2)
+    if len(header) < 2:
+        return None
+    length = header[1] & 0x1F
+    remaining = length - 2
+    payload = b""
+    while len(payload) < remaining:
+        more = ser.read(remaining - len(payload))
+        if not more:
+            return None
+        payload += more
+    return header + payload
+
+def parse_stream_line(line):
+    """
+    Parse one CRLF-terminated line of the stream payload.
+
+    Supported line formats:
+        • "R:G:B"           → color sample
+        • "R,G,B,Light"     → color and light sample
+        • "Light"           → light sample
+
+    Args:
+        line (bytes):
+            Line bytes without the CRLF terminator.
+
+    Returns:
+        tuple | None:
+            (r, g, b, light, has_rgb, has_light), or None if
+            the line is not a sample line. Channels absent from
+            the line are reported as 0.
+    """
+    full_line = line.decode("utf-8", errors="ignore").strip()
+    r = g = b = light = 0
+    has_rgb = has_light = False
+    if ':' in full_line:
+        parts = full_line.split(":")
+        if len(parts) == 3 and all(p.strip().isdigit() for p in parts):
+            r, g, b = map(int, parts)
+            has_rgb = True
+    elif ',' in full_line:
+        parts = full_line.split(',')
+        if len(parts) == 4 and all(p.strip().isdigit() for p in parts):
+            r, g, b, light = map(int, parts)
+            has_rgb = has_light = True
+    elif full_line.isdigit():
+        light = int(full_line)
+        has_light = True
+    else:
+        return None
+    return r, g, b, light, has_rgb, has_light
+
+
+class StreamHub:
+    """
+    Shared stream pipeline for one Model2450 device.
+
+    Every Stream Plot window for a device subscribes to the same
+    hub. The hub sends "stream 3" when the first subscriber starts
+    and "stream 0" when the last one stops. In between, one reader
+    thread decodes packets into the shared StreamStore and
+    histograms. Windows only read from the store, so N windows cost
+    one ingest pipeline plus N renderers.
+
+    Args:
+        device:
+            Connected Model2450 device instance, or None.
+    """
+    def __init__(self, device):
+        self.device = device
+        self.ser = None
+        self.store = StreamStore()
+        self.histograms = StreamHistograms()
+        self.chromaticity = StreamChromaticity()
+        self.trigger = TriggerEngine()
+        self.start_time = time.time()
+        self.keep_running = False
+        self.subscribers = set()
+        self.active = set()
+        self.lock = threading.Lock()
+        self._generation = 0
+        # Running totals for the performance HUD
+        self.ingested = 0
+        self.gaps = 0
+        self.decode_errors = 0
+        self.last_ts = None
+        port = getattr(device, "port", None)
+        self.mem_name = f"Stream {port}" if port else "Stream"
+        get_governor().register(self.mem_name, self.store.nbytes, self.store.release,
+                                policies=tuple(MEMORY_POLICIES))
+
+    def subscribe(self, subscriber):
+        """
+        Attach a window to the hub.
+
+        Args:
+            subscriber:
+                Window that reads from the hub's store.
+
+        Returns:
+            None
+        """
+        with self.lock:
+            self.subscribers.add(subscriber)
+
+    def unsubscribe(self, subscriber):
+        """
+        Detach a window, closing the hub after the last one.
+
+        Args:
+            subscriber:
+                Window previously passed to subscribe().
+
+        Returns:
+            None
+        """
+        self.stop(subscriber)
+        with self.lock:
+            self.subscribers.discard(subscriber)
+            last = not self.subscribers
+        if last:
+            self.close()
+
+    def start(self, subscriber):
+        """
+        Mark a subscriber live, starting the device stream if needed.
+
+        Args:
+            subscriber:
+                Window requesting live data.
+
+        Returns:
+            None
+        """
+        with self.lock:
+            self.active.add(subscriber)
+            if self.keep_running:
+                return
+            self.ser = self.device.ser
+            self.ser.write(b"stream 3\r\n")
+            self.keep_running = True
+            self.last_ts = None
+            self._generation += 1
+            # Don't reset start_time to preserve continuity
+            threading.Thread(target=self.read_serial, args=(self._generation,),
+                             daemon=True).start()
+
+    def stop(self, subscriber):
+        """
+        Mark a subscriber idle, stopping the stream after the last one.
+
+        Args:
+            subscriber:
+                Window that no longer needs live data.
+
+        Returns:
+            None
+        """
+        with self.lock:
+            self.active.discard(subscriber)
+            if self.active or not self.keep_running:
+                return
+            self.keep_running = False
+            if self.ser:
+                self.ser.write(b"stream 0\r\n")
+
+    def reset(self):
+        """
+        Clear shared samples, histograms, chromaticity and trigger history.
+
+        Returns:
+            None
+        """
+        self.store.reset()
+        self.histograms.reset()
+        self.chromaticity.reset()
+        self.trigger.reset()
+        self.start_time = time.time()
+        self.ingested = 0
+        self.gaps = 0
+        self.decode_errors = 0
+        self.last_ts = None
+
+    def close(self):
+        """
+        Stop streaming and release the hub's resources, including
+        the store's spill file.
+
+        Returns:
+            None
+        """
+        with self.lock:
+            self.active.clear()
+            if self.keep_running:
+                self.keep_running = False
+                if self.ser:
+                    self.ser.write(b"stream 0\r\n")
+        get_governor().unregister(self.mem_name)
+        self.store.discard_spill()
+        with _hubs_lock:
+            if _hubs.get(id(self.device)) is self:
+                del _hubs[id(self.device)]
+
+    def read_serial(self, generation):
+        """
+        Read and process streaming sensor data from the device serial port.
+
+        This method runs in a background thread and continuously reads
+        packetized data from the connected Model2450 device. It decodes
+        incoming packets, extracts payload content and parses RGB and
+        Light sensor values.
+
+        All sample lines completed by one packet are parsed into a
+        batch first, so the store lock is taken once per packet and
+        the histograms are updated with one vectorized call.
+
+        Args:
+            generation (int):
+                Start generation this thread belongs to. A thread
+                left over from an earlier start exits as soon as a
+                newer one is launched.
+
+        Returns:
+            None
+        """
+        buffer = b""
+        while self.keep_running and generation == self._generation:
+            packet = read_packet_from_serial(self.ser)
+            if not packet:
+                continue
+            try:
+                decoded = decode_packet(packet)
+            except Exception as e:
+                print(f"[Decode Error] {e}")
+                self.decode_errors += 1
+                continue
+
+            payload = decoded["payload"]
+            buffer += payload
+            batch = []
+            while b'\r\n' in buffer:
+                line, buffer = buffer.split(b'\r\n', 1)
+                sample = parse_stream_line(line)
+                if sample is None:
+                    continue
+                ts = round(time.time() - self.start_time, 2)
+                batch.append(sample + (ts,))
+            if batch:
+                self.append_batch(batch)
+
+    def append_batch(self, batch):
+        """
+        Append one parsed batch to the store and histograms.
+
+        Histograms and the chromaticity grids always see every
+        sample, and so do the ingest and gap counters. When the trigger
+        engine is armed, only the samples around trigger events
+        (plus the pre-trigger samples it flushes) reach the store.
+
+        Args:
+            batch (list[tuple]):
+                Rows of (r, g, b, light, has_rgb, has_light, ts)
+                as produced by parse_stream_line() plus timestamp.
+
+        Returns:
+            None
+        """
+        r, g, b, light, has_rgb, has_light, ts = (np.array(col) for col in zip(*batch))
+        self.ingested += len(ts)
+        prev = ts[0] if self.last_ts is None else self.last_ts
+        self.gaps += int(np.count_nonzero(np.diff(ts, prepend=prev) > STREAM_GAP_SECONDS))
+        self.last_ts = ts[-1]
+        self.histograms.update({
+            "Light": light[has_light],
+            "R": r[has_rgb],
+            "G": g[has_rgb],
+            "B": b[has_rgb],
+        })
+        self.chromaticity.update(ts[has_rgb], r[has_rgb], g[has_rgb], b[has_rgb])
+        if self.trigger.armed:
+            pre_rows, keep = self.trigger.process({
+                "t": ts, "r": r, "g": g, "b": b, "light": light,
+                "has_rgb": has_rgb, "has_light": has_light,
+            })
+            if pre_rows is not None:
+                self.store.append(pre_rows["t"], pre_rows["r"], pre_rows["g"],
+                                  pre_rows["b"], pre_rows["light"], pre_rows["has_light"])
+            ts, r, g, b, light = ts[keep], r[keep], g[keep], b[keep], light[keep]
+            has_light = has_light[keep]
+        self.store.append(ts, r, g, b, light, has_light)
+
+
+_hubs = {}
+_hubs_lock = threading.Lock()
+
+
+def get_hub(device):
+    """
+    Return the stream hub for a device, creating it on first use.
+
+    Args:
+        device:
+            Connected Model2450 device instance, or None.
+
+    Returns:
+        StreamHub
+    """
+    with _hubs_lock:
+        hub = _hubs.get(id(device))
+        if hub is None:
+            hub = StreamHub(device)
+            _hubs[id(device)] = hub
+        return hub
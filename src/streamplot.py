@@ -19,6 +19,7 @@ import os
 import csv
 import time
 import threading
+from collections import OrderedDict
 
 # Third-party imports
 import wx
@@ -40,85 +41,64 @@ from matplotlib.ticker import (
 )
 # Local application imports
 from uiGlobal import *
-
-# === Packet Decoding ===
-def decode_packet(packet_bytes):
-    """
-    Decode a raw binary packet received from the device.
-
-    Extracts header fields and payload data based on
-    Model2450 streaming protocol structure.
-
-    Args:
-        packet_bytes (bytes):
-            Raw packet bytes read from serial stream.
-
-    Returns:
-        dict:
-            Decoded packet fields:
-                - start_bit
-                - end_bit
-                - reserved
-                - command
-                - sequence
-                - length
-                - payload
-
-    Raises:
-        ValueError:
-            If packet is too short or length mismatch occurs.
-    """
-    if len(packet_bytes) < 2:
-        raise ValueError("Packet too short to decode header.")
-    header_byte_0 = packet_bytes[0]
-    header_byte_1 = packet_bytes[1]
-    start_bit = (header_byte_0 >> 7) & 0x01
-    end_bit = (header_byte_0 >> 6) & 0x01
-    reserved = (header_byte_0 >> 5) & 0x01
-    command = header_byte_0 & 0x1F
-    sequence = (header_byte_1 >> 5) & 0x07
-    length = header_byte_1 & 0x1F
-    if len(packet_bytes) < length:
-        raise ValueError(f"Packet length mismatch. Expected {length}, got {len(packet_bytes)}")
-    payload = packet_bytes[2:length]
-    return {
-        "start_bit": start_bit,
-        "end_bit": end_bit,
-        "reserved": reserved,
-        "command": command,
-        "sequence": sequence,
-        "length": length,
-        "payload": payload
-    }
-
-def read_packet_from_serial(ser):
-    """
-    Read one complete packet from serial stream.
-
-    The function first reads header bytes to determine
-    payload length, then reads remaining payload.
-
-    Args:
-        ser (serial.Serial):
-            Active serial connection object.
-
-    Returns:
-        bytes | None:
-            Complete packet bytes if successful,
-            otherwise None if timeout/incomplete read.
-    """
-    header = ser.read(2)
-    if len(header) < 2:
-        return None
-    length = header[1] & 0x1F
-    remaining = length - 2
-    payload = b""
-    while len(payload) < remaining:
-        more = ser.read(remaining - len(payload))
-        if not more:
-            return None
-        payload += more
-    return header + payload
+from histogram import HistogramFrame
+from chromaticity import ChromaticityFrame
+from flicker import FlickerFrame
+from timeindex import TimeBookmarks, index_at
+from trigger import TriggerDialog
+from resample import resample_columns, RESAMPLE_MODES
+from decimate import m4_indices
+from framegovernor import FrameGovernor, FRAME_COALESCE_MS
+from plotrender import draw_stream_axes, RasterRenderer
+from nativeplot import NativePlotPanel
+from visibility import is_window_visible, bind_visibility
+from perfhud import PerfMonitor, format_perf, PERF_HUD_INTERVAL_MS
+from crosshair import BlitCrosshair
+from figexport import (
+    ExportDialog,
+    FigureExportJob,
+    export_pixel_width,
+    EXPORT_FORMATS
+)
+from streamhub import get_hub
+
+HIST_EXPORT_HEADERS = ['Channel', 'Scale', 'Bin Low', 'Bin High', 'Count']
+RAW_EXPORT_HEADERS = ['Time', 'Light', 'R', 'G', 'B']
+RESAMPLED_EXPORT_HEADERS = ['Time', 'Light', 'R', 'G', 'B']
+
+# Render modes: "classic" rebuilds both axes on every refresh,
+# "blit" keeps persistent line artists and blits them over a
+# cached background, "threaded" rasterizes on a worker thread and
+# "native" draws with wx.GraphicsContext instead of matplotlib.
+RENDER_CLASSIC = "classic"
+RENDER_BLIT = "blit"
+RENDER_THREADED = "threaded"
+RENDER_NATIVE = "native"
+RENDER_MODES = {
+    RENDER_CLASSIC: "Classic",
+    RENDER_BLIT: "Blit",
+    RENDER_THREADED: "Threaded",
+    RENDER_NATIVE: "Native (wx)",
+}
+# Fastest refresh interval per mode; the frame governor slows
+# down from here when drawing takes longer.
+RENDER_INTERVAL_MS = {
+    RENDER_CLASSIC: 100,
+    RENDER_BLIT: 33,
+    RENDER_THREADED: 100,
+    RENDER_NATIVE: 33,
+}
+# Frames timed per mode by the render benchmark
+RENDER_BENCHMARK_FRAMES = 30
+# Prepared views kept for revisiting slider/zoom positions
+VIEW_CACHE_SIZE = 32
+# Fraction of the window moved per mouse wheel step when panning
+PAN_STEP = 0.1
+# Zoom factor per Ctrl + mouse wheel step
+WHEEL_ZOOM_FACTOR = 1.25
+PLOT_SUBPLOTS = dict(hspace=0.6)
+# Playback speed multipliers offered in the speed selector
+PLAYBACK_SPEEDS = (0.5, 1, 2, 5, 10, 20, 50)
 
 def format_seconds_millis(x, _):
     """
@@ -149,6 +129,9 @@ class StreamPlotFrame(wx.Frame):
         - Span selection
         - Axis limit configuration
         - Data export (CSV / XLSX)
+        - Classic, blitted, worker-thread or native wx rendering
+        - Shared device stream: all windows on a device read one
+          StreamHub, each with its own zoom/slider view state
 
     Args:
         parent (wx.Window):
@@ -159,31 +142,56 @@ class StreamPlotFrame(wx.Frame):
     def __init__(self, parent, device=None):
         super(StreamPlotFrame, self).__init__(parent)
         self.device = device
+        self.hub = get_hub(device)
+        self.hub.subscribe(self)
         self.keep_running = False
         self.SetSize((1000, 800))
         self.SetTitle("Stream Plot")
         self.SetIcon(wx.Icon(os.path.join(os.path.abspath(os.path.dirname(__file__)), "icons", IMG_ICON)))
     
-        self.r_data = []
-        self.g_data = []
-        self.b_data = []
-        self.light_data = []
-        self.time_data_rgb = []
-        self.time_data_light = []
-        self.data_lock = threading.Lock()
+        self.store = self.hub.store
+        self.histograms = self.hub.histograms
+        self.hist_frame = None
+        self.chroma_frame = None
+        self.flicker_frame = None
         self.zoom_scale = 1.0
-        self.start_time = time.time()
+        # Seconds the view's right edge is moved back from its anchor
+        # (the newest sample while streaming, the slider otherwise)
+        self.pan_offset = 0.0
+        # Store time at the view's right edge during playback, or
+        # None outside playback
+        self.playback_time = None
+        self.playback_speed = 1.0
+        self.playback_tick = None
+        self.playing = False
+        self.bookmarks = TimeBookmarks()
         
         self.zoom_fit_mode = False
+        self.render_mode = RENDER_CLASSIC
+        self.blit_lines = None
+        self.blit_background = None
+        self.blit_key = None
+        self.raster = None
+        self.raster_token = 0
+        self.prep_seconds = 0.0
+        self.view_cache = OrderedDict()
+        self.last_view = None
+        self.view_cache_version = None
+        self.frame_governor = FrameGovernor(RENDER_INTERVAL_MS[self.render_mode])
+        self.drawn_version = None
+        self.dirty = False
+        self.perf = PerfMonitor(self.hub, self.frame_governor)
 
         self.rgb_ylim = [0, 300]
         self.light_ylim = [0, 3000000]
         self.figure = Figure(figsize=(6, 6), facecolor='black')
-        self.figure.subplots_adjust(hspace=0.6)  #
+        self.figure.subplots_adjust(**PLOT_SUBPLOTS)  #
         self.ax_rgb = self.figure.add_subplot(211)
         # self.figure.subplots_adjust(hspace=0.4)  #
         self.ax_light = self.figure.add_subplot(212)
         self.canvas = FigureCanvas(self, -1, self.figure)
+        self.native_panel = NativePlotPanel(self, on_hover=self.show_hover, on_wheel=self.on_wheel)
+        self.native_panel.Hide()
         # Add this block to make grid appear on first load 
         # Add minor locators
         self.ax_rgb.xaxis.set_minor_locator(AutoMinorLocator(2))
@@ -208,6 +216,7 @@ class StreamPlotFrame(wx.Frame):
             ax.tick_params(axis='y', colors='white')
 
         self.canvas.draw()  # Initial draw to show grid and background
+        self.crosshair = BlitCrosshair(self.canvas, [self.ax_rgb, self.ax_light])
        
         self.span_rgb = SpanSelector(
             self.ax_rgb, self.on_rgb_range_select, 'horizontal',
@@ -234,39 +243,140 @@ class StreamPlotFrame(wx.Frame):
         self.zoom_out_btn = wx.Button(self, label="Zoom In")
         
         self.zoom_fit_btn = wx.Button(self, label="Zoom Fit")
+        self.live_btn = wx.Button(self, label="Live")
         
         self.save_btn = wx.Button(self, label="Save File") 
+        self.export_btn = wx.Button(self, label="Export Figure")
+        self.hist_btn = wx.Button(self, label="Histogram")
+        self.chroma_btn = wx.Button(self, label="Chromaticity")
+        self.flicker_btn = wx.Button(self, label="Flicker")
+        self.trigger_btn = wx.Button(self, label="Trigger")
         self.reset_btn = wx.Button(self, label="Reset")
         self.reset_btn.Bind(wx.EVT_BUTTON, self.on_reset)
         self.start_btn.Bind(wx.EVT_BUTTON, self.on_start)
         self.stop_btn.Bind(wx.EVT_BUTTON, self.on_stop)
         self.zoom_fit_btn.Bind(wx.EVT_BUTTON, self.on_zoom_fit)
+        self.live_btn.Bind(wx.EVT_BUTTON, self.on_live)
         self.zoom_in_btn.Bind(wx.EVT_BUTTON, lambda evt: self.adjust_zoom(0.5))
         self.zoom_out_btn.Bind(wx.EVT_BUTTON, lambda evt: self.adjust_zoom(2.0))
         self.slider.Bind(wx.EVT_SLIDER, self.on_slider_scroll)
         self.save_btn.Bind(wx.EVT_BUTTON, self.on_save_csv)
+        self.export_btn.Bind(wx.EVT_BUTTON, self.on_export_figure)
+        self.hist_btn.Bind(wx.EVT_BUTTON, self.on_histogram)
+        self.chroma_btn.Bind(wx.EVT_BUTTON, self.on_chromaticity)
+        self.flicker_btn.Bind(wx.EVT_BUTTON, self.on_flicker)
+        self.trigger_btn.Bind(wx.EVT_BUTTON, self.on_trigger)
 
         self.info_text = wx.StaticText(self, label=" RGB/Light data")
         self.info_text.SetForegroundColour(wx.Colour("white"))
+        self.stats_text = wx.StaticText(self, label="")
+        self.stats_text.SetForegroundColour(wx.Colour("white"))
+        self.hud_text = wx.StaticText(self, label="")
+        self.hud_text.SetForegroundColour(wx.Colour("yellow"))
+        self.hud_text.Hide()
 
         control_sizer = wx.BoxSizer(wx.HORIZONTAL)
-        for item in [self.start_btn, self.stop_btn, self.zoom_in_btn, self.zoom_out_btn,self.zoom_fit_btn,
-                     self.light_cb, self.red_cb, self.green_cb, self.blue_cb, self.reset_btn, self.save_btn]:
+        for item in [self.start_btn, self.stop_btn, self.zoom_in_btn, self.zoom_out_btn,self.zoom_fit_btn, self.live_btn,
+                     self.light_cb, self.red_cb, self.green_cb, self.blue_cb, self.reset_btn, self.save_btn,
+                     self.export_btn, self.hist_btn, self.chroma_btn, self.flicker_btn,
+                     self.trigger_btn]:
             control_sizer.Add(item, 0, wx.ALL, 5)
             # control_sizer.Add(self.zoom_fit_btn, 0, wx.ALL, 5)
 
 
         main_sizer = wx.BoxSizer(wx.VERTICAL)
         main_sizer.Add(self.info_text, 0, wx.ALIGN_CENTER | wx.TOP, 5)
+        main_sizer.Add(self.stats_text, 0, wx.ALIGN_CENTER | wx.TOP, 2)
+        main_sizer.Add(self.hud_text, 0, wx.ALIGN_CENTER | wx.TOP, 2)
         main_sizer.Add(self.canvas, 1, wx.EXPAND)
+        main_sizer.Add(self.native_panel, 1, wx.EXPAND)
         main_sizer.Add(self.slider, 0, wx.EXPAND | wx.ALL, 5)
+        nav_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        nav_sizer.Add(self.make_playback_row(), 0)
+        nav_sizer.Add(self.make_navigation_row(), 0, wx.LEFT, 20)
+        main_sizer.Add(nav_sizer, 0, wx.CENTER)
         main_sizer.Add(control_sizer, 0, wx.CENTER)
         self.axis_collapse = self.make_axis_collapse_panel()
         main_sizer.Add(self.axis_collapse, 0, wx.EXPAND | wx.ALL, 5)
         self.SetSizer(main_sizer)
         self.timer = wx.Timer(self)
-        self.Bind(wx.EVT_TIMER, self.update_plot, self.timer)
+        self.Bind(wx.EVT_TIMER, self.on_refresh_timer, self.timer)
+        self.redraw_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.on_redraw_timer, self.redraw_timer)
+        self.perf_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.on_perf_timer, self.perf_timer)
         self.canvas.mpl_connect("motion_notify_event", self.on_hover_motion)
+        self.canvas.mpl_connect("draw_event", self.on_canvas_draw)
+        self.canvas.mpl_connect("scroll_event", self.on_canvas_scroll)
+        self.Bind(wx.EVT_CLOSE, self.on_close)
+        bind_visibility(self, self.request_redraw)
+
+    def on_close(self, event):
+        """
+        Stop this window's view and detach it from the stream hub.
+
+        Args:
+            event:
+                wx.CloseEvent.
+
+        Returns:
+            None
+        """
+        self.timer.Stop()
+        self.redraw_timer.Stop()
+        self.perf_timer.Stop()
+        self.perf.stop_log()
+        if self.raster:
+            self.raster.stop()
+        self.keep_running = False
+        self.hub.unsubscribe(self)
+        event.Skip()
+
+    def _view_window(self, t):
+        """
+        Resolve the right edge and width of the visible time window.
+
+        Args:
+            t (numpy.ndarray):
+                Non-empty sample time column.
+
+        Returns:
+            tuple:
+                (current_time, plot_window) in seconds. Samples are
+                drawn at x = current_time - t for 0 <= x <= plot_window.
+        """
+        if self.zoom_fit_mode:
+            return t[-1], max(t[-1] - t[0], 1.0)
+        if self.keep_running:
+            anchor = t[-1]
+        elif self.playback_time is not None:
+            anchor = self.playback_time
+        else:
+            anchor = t[min(self.slider.GetValue(), len(t) - 1)]
+        current_time = min(max(anchor - self.pan_offset, t[0]), t[-1])
+        return current_time, 60 / self.zoom_scale
+
+    def drawn_window(self, t):
+        """
+        Right edge and width of the window actually on screen.
+
+        Zoom Fit only lasts for the frame it draws, so afterwards
+        _view_window() no longer describes the plot; the window
+        recorded by update_plot() does. Plot X positions must be
+        mapped back to sample times through this window.
+
+        Args:
+            t (numpy.ndarray):
+                Non-empty sample time column, used before the
+                first frame is drawn.
+
+        Returns:
+            tuple:
+                (current_time, plot_window) in seconds.
+        """
+        if self.last_view is not None:
+            return self.last_view
+        return self._view_window(t)
 
     def on_rgb_hover(self, sel):
         """
@@ -291,10 +401,10 @@ class StreamPlotFrame(wx.Frame):
         """
         x = sel.target[0]
         try:
-            index = min(range(len(self.time_data_rgb)), key=lambda i: abs(self.time_data_rgb[i] - x))
-            r = self.r_data[index]
-            g = self.g_data[index]
-            b = self.b_data[index]
+            row = self.store.nearest(x)
+            r = row["r"]
+            g = row["g"]
+            b = row["b"]
             self.info_text.SetLabel(f"RGB → R: {r}, G: {g}, B: {b}")
         except Exception:
             self.info_text.SetLabel("RGB: No data")
@@ -320,8 +430,7 @@ class StreamPlotFrame(wx.Frame):
         """
         x = sel.target[0]
         try:
-            index = min(range(len(self.time_data_light)), key=lambda i: abs(self.time_data_light[i] - x))
-            light = self.light_data[index]
+            light = self.store.nearest(x)["light"]
             self.info_text.SetLabel(f"Light → {light}")
         except Exception:
             self.info_text.SetLabel("Light: No data")
@@ -375,6 +484,268 @@ class StreamPlotFrame(wx.Frame):
         row_sizer.Add(set_btn, 0, wx.ALIGN_CENTER_VERTICAL)
         return row_sizer
     
+    def make_resample_row(self, parent):
+        """
+        Create the uniform-grid resampling controls.
+
+        A blank or zero rate shows and exports the raw samples.
+        Any positive rate resamples both the live plot window and
+        exported files onto a fixed sample period.
+
+        Args:
+            parent (wx.Window):
+                Parent container for layout placement.
+
+        Returns:
+            wx.BoxSizer:
+                Configured horizontal sizer.
+        """
+        row_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        row_sizer.Add(wx.StaticText(parent, label="Resample (Hz):"), 0,
+                    wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 5)
+        self.resample_rate_ctrl = wx.TextCtrl(parent, style=wx.TE_PROCESS_ENTER)
+        self.resample_rate_ctrl.Bind(wx.EVT_CHAR, self.on_char_numeric_only)
+        self.resample_rate_ctrl.Bind(wx.EVT_TEXT_ENTER, self.on_resample_change)
+        row_sizer.Add(self.resample_rate_ctrl, 0, wx.RIGHT, 10)
+
+        row_sizer.Add(wx.StaticText(parent, label="Mode:"), 0,
+                    wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 5)
+        self.resample_modes = list(RESAMPLE_MODES)
+        self.resample_mode_choice = wx.Choice(parent, choices=list(RESAMPLE_MODES.values()))
+        self.resample_mode_choice.SetSelection(0)
+        self.resample_mode_choice.Bind(wx.EVT_CHOICE, self.on_resample_change)
+        row_sizer.Add(self.resample_mode_choice, 0, wx.ALIGN_CENTER_VERTICAL)
+        return row_sizer
+
+    def resample_settings(self):
+        """
+        Read the resampling rate and mode from the UI.
+
+        Returns:
+            tuple:
+                (rate, mode). rate is 0.0 when resampling is off.
+        """
+        try:
+            rate = max(0.0, float(self.resample_rate_ctrl.GetValue()))
+        except ValueError:
+            rate = 0.0
+        return rate, self.resample_modes[self.resample_mode_choice.GetSelection()]
+
+    def on_resample_change(self, event):
+        """
+        Redraw the plot after the resampling settings change.
+
+        Args:
+            event:
+                wx.CommandEvent from the rate or mode control.
+
+        Returns:
+            None
+        """
+        self.request_redraw()
+
+    def make_render_row(self, parent):
+        """
+        Create the render mode selector.
+
+        Args:
+            parent (wx.Window):
+                Parent container for layout placement.
+
+        Returns:
+            wx.BoxSizer:
+                Configured horizontal sizer.
+        """
+        row_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        row_sizer.Add(wx.StaticText(parent, label="Render:"), 0,
+                    wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 5)
+        self.render_modes = list(RENDER_MODES)
+        self.render_choice = wx.Choice(parent, choices=list(RENDER_MODES.values()))
+        self.render_choice.SetSelection(self.render_modes.index(self.render_mode))
+        self.render_choice.Bind(wx.EVT_CHOICE, self.on_render_mode)
+        row_sizer.Add(self.render_choice, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 10)
+        benchmark_btn = wx.Button(parent, label="Benchmark")
+        benchmark_btn.Bind(wx.EVT_BUTTON, self.on_benchmark)
+        row_sizer.Add(benchmark_btn, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 10)
+        self.hud_cb = wx.CheckBox(parent, label="Perf HUD")
+        self.hud_cb.Bind(wx.EVT_CHECKBOX, self.on_hud_toggle)
+        row_sizer.Add(self.hud_cb, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 10)
+        self.perf_log_cb = wx.CheckBox(parent, label="Log Perf CSV")
+        self.perf_log_cb.Bind(wx.EVT_CHECKBOX, self.on_perf_log_toggle)
+        row_sizer.Add(self.perf_log_cb, 0, wx.ALIGN_CENTER_VERTICAL)
+        return row_sizer
+
+    def on_hud_toggle(self, event):
+        """
+        Show or hide the performance HUD line.
+
+        Args:
+            event:
+                wx.CommandEvent from the HUD checkbox.
+
+        Returns:
+            None
+        """
+        show = self.hud_cb.GetValue()
+        self.hud_text.Show(show)
+        if show:
+            self.on_perf_timer(None)
+        self.Layout()
+        self.update_perf_timer()
+
+    def on_perf_log_toggle(self, event):
+        """
+        Start or stop logging performance summaries to CSV.
+
+        Args:
+            event:
+                wx.CommandEvent from the log checkbox.
+
+        Returns:
+            None
+        """
+        if not self.perf_log_cb.GetValue():
+            self.perf.stop_log()
+            self.update_perf_timer()
+            return
+        with wx.FileDialog(self, "Save Performance Log", wildcard="CSV files (*.csv)|*.csv",
+                           style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT) as dialog:
+            if dialog.ShowModal() == wx.ID_CANCEL:
+                self.perf_log_cb.SetValue(False)
+                return
+            path = dialog.GetPath()
+        try:
+            self.perf.start_log(path)
+        except OSError as exc:
+            self.perf_log_cb.SetValue(False)
+            wx.MessageBox(f"Could not open log file:\n{exc}", "Error", wx.OK | wx.ICON_ERROR)
+            return
+        self.update_perf_timer()
+
+    def update_perf_timer(self):
+        """
+        Run the performance timer only while the HUD or log needs it.
+
+        Returns:
+            None
+        """
+        if self.hud_cb.GetValue() or self.perf.log_writer is not None:
+            if not self.perf_timer.IsRunning():
+                self.perf_timer.Start(PERF_HUD_INTERVAL_MS)
+        else:
+            self.perf_timer.Stop()
+
+    def on_perf_timer(self, event):
+        """
+        Sample the performance counters into the HUD and log.
+
+        Args:
+            event:
+                wx.TimerEvent from perf_timer, or None.
+
+        Returns:
+            None
+        """
+        stats = self.perf.sample()
+        if self.hud_text.IsShown():
+            self.hud_text.SetLabel(format_perf(stats))
+            self.Layout()
+
+    def on_render_mode(self, event):
+        """
+        Switch between the matplotlib and native renderers.
+
+        The refresh timer is restarted at the new mode's interval
+        when streaming, and the plot is redrawn from scratch.
+
+        Args:
+            event:
+                wx.CommandEvent from the render choice.
+
+        Returns:
+            None
+        """
+        self.set_render_mode(self.render_modes[self.render_choice.GetSelection()])
+
+    def set_render_mode(self, mode, redraw=True):
+        """
+        Select the render mode used by update_plot().
+
+        The native mode swaps the matplotlib canvas for the
+        wx.GraphicsContext panel in the same layout slot.
+
+        Args:
+            mode (str):
+                One of RENDER_MODES.
+            redraw (bool):
+                Schedule a redraw in the new mode.
+
+        Returns:
+            None
+        """
+        native = mode == RENDER_NATIVE
+        self.crosshair.hide()
+        if native != self.native_panel.IsShown():
+            self.canvas.Show(not native)
+            self.native_panel.Show(native)
+            self.Layout()
+        self.render_mode = mode
+        self.raster_token += 1
+        if mode == RENDER_THREADED and self.raster is None:
+            self.raster = RasterRenderer(lambda *args: wx.CallAfter(self.on_raster_ready, *args),
+                                         PLOT_SUBPLOTS)
+        self.blit_lines = None
+        self.blit_background = None
+        self.blit_key = None
+        self.frame_governor.set_min_interval(RENDER_INTERVAL_MS[mode])
+        if self.keep_running or self.playing:
+            self.timer.Start(self.frame_governor.interval_ms)
+        if redraw:
+            self.request_redraw()
+
+    def on_benchmark(self, event):
+        """
+        Time each synchronous renderer on the current view.
+
+        Draws RENDER_BENCHMARK_FRAMES frames in the classic, blit
+        and native modes and reports mean and 95th percentile
+        frame times. The first frame of each mode builds axes and
+        caches and is not counted. The threaded mode is left out:
+        its frames finish asynchronously and its worker runs the
+        classic renderer.
+
+        Args:
+            event:
+                wx.ButtonEvent from the Benchmark button.
+
+        Returns:
+            None
+        """
+        if not len(self.store):
+            wx.MessageBox("No data to benchmark!", "Warning", wx.OK | wx.ICON_WARNING)
+            return
+        original = self.render_mode
+        zoom_fit = self.zoom_fit_mode
+        lines = []
+        with wx.BusyCursor():
+            for mode in (RENDER_CLASSIC, RENDER_BLIT, RENDER_NATIVE):
+                self.set_render_mode(mode, redraw=False)
+                times = []
+                for _ in range(RENDER_BENCHMARK_FRAMES + 1):
+                    self.zoom_fit_mode = zoom_fit
+                    started = time.perf_counter()
+                    self.update_plot(None)
+                    (self.native_panel if mode == RENDER_NATIVE else self.canvas).Update()
+                    times.append((time.perf_counter() - started) * 1000.0)
+                times = np.array(times[1:])
+                lines.append(f"{RENDER_MODES[mode]}: mean {times.mean():.1f} ms, "
+                             f"p95 {np.percentile(times, 95):.1f} ms "
+                             f"(~{1000.0 / times.mean():.0f} fps)")
+        self.zoom_fit_mode = zoom_fit
+        self.set_render_mode(original)
+        wx.MessageBox(f"{len(self.store)} samples, {RENDER_BENCHMARK_FRAMES} frames per mode\n\n"
+                      + "\n".join(lines), "Render Benchmark", wx.OK | wx.ICON_INFORMATION)
+
     def on_hover_motion(self, event):
         """
         Handle mouse hover motion over RGB and Light plots.
@@ -383,6 +754,13 @@ class StreamPlotFrame(wx.Frame):
         axes and dynamically displays the nearest data values
         corresponding to the cursor’s X-axis position.
 
+        The nearest sample is found with a binary search on the
+        sorted time column (StreamStore.nearest), so the cost
+        does not grow with the capture length. A crosshair
+        snapped to that sample is blitted over the last frame.
+        It is hidden while a mouse button is down so it does not
+        fight the span selectors.
+
         Args:
             event:
                 Matplotlib motion_notify_event containing:
@@ -392,74 +770,59 @@ class StreamPlotFrame(wx.Frame):
         Returns:
             None
         """
-        if event.inaxes == self.ax_rgb:
-            try:
-                with self.data_lock:
-                    if not self.time_data_rgb:
-                        return
-
-                    # Reconstruct x_vals and filter exactly like in plot
-                    if self.zoom_fit_mode:
-                        x_vals = [t - self.time_data_rgb[0] for t in self.time_data_rgb]
-                        x_vals = [x_vals[-1] - x for x in x_vals]
-                        duration = max(x_vals)
-                    else:
-                        current_time = self.time_data_rgb[-1] if self.keep_running else self.time_data_rgb[min(self.slider.GetValue(), len(self.time_data_rgb)-1)]
-                        x_vals = [current_time - t for t in self.time_data_rgb]
-                        duration = 60 / self.zoom_scale
-
-                    # Filter points within visible X range
-                    filtered_indices = [i for i, x in enumerate(x_vals) if 0 <= x <= duration]
-                    x_vals_filtered = [x_vals[i] for i in filtered_indices]
-                    r_vals = [self.r_data[i] for i in filtered_indices]
-                    g_vals = [self.g_data[i] for i in filtered_indices]
-                    b_vals = [self.b_data[i] for i in filtered_indices]
-
-                    # Remove zero-only RGB points (like in plot)
-                    non_zero_indices = [i for i in range(len(r_vals)) if r_vals[i] > 0 or g_vals[i] > 0 or b_vals[i] > 0]
-                    if not non_zero_indices:
-                        return
-                    x_vals_filtered = [x_vals_filtered[i] for i in non_zero_indices]
-                    r_vals = [r_vals[i] for i in non_zero_indices]
-                    g_vals = [g_vals[i] for i in non_zero_indices]
-                    b_vals = [b_vals[i] for i in non_zero_indices]
-
-                    x = event.xdata
-                    if x is None or not x_vals_filtered:
-                        return
-
-                    index = min(range(len(x_vals_filtered)), key=lambda i: abs(x_vals_filtered[i] - x))
-                    r = r_vals[index]
-                    g = g_vals[index]
-                    b = b_vals[index]
-                self.info_text.SetLabel(f"RGB → R: {r}, G: {g}, B: {b}")
-            except Exception:
-                self.info_text.SetLabel("RGB: No data")
-
+        if event.button is not None:
+            self.crosshair.hide()
+        elif event.inaxes == self.ax_rgb:
+            self.show_hover("rgb", event.xdata, event.ydata)
         elif event.inaxes == self.ax_light:
-            try:
-                with self.data_lock:
-                    if not self.time_data_light:
-                        return
-
-                    if self.zoom_fit_mode:
-                        x_vals = [t - self.time_data_light[0] for t in self.time_data_light]
-                        x_vals = [x_vals[-1] - x for x in x_vals]
-                    else:
-                        current_time = self.time_data_light[-1] if self.keep_running else self.time_data_light[min(self.slider.GetValue(), len(self.time_data_light)-1)]
-                        x_vals = [current_time - t for t in self.time_data_light]
-
-                    x = event.xdata
-                    if x is None or not x_vals:
-                        return
-
-                    index = min(range(len(x_vals)), key=lambda i: abs(x_vals[i] - x))
-                    light = self.light_data[index]
-                self.info_text.SetLabel(f"Light → {light}")
-            except Exception:
-                self.info_text.SetLabel("Light: No data")
+            self.show_hover("light", event.xdata, event.ydata)
         else:
+            self.show_hover(None, None)
+
+    def show_hover(self, panel, x, y=None):
+        """
+        Show the sample nearest a hovered plot position.
+
+        Shared by the matplotlib canvas and the native panel. The
+        readout gives the sample's time, R, G, B and lux; on the
+        matplotlib canvas the crosshair is moved to the sample.
+
+        Args:
+            panel (str | None):
+                "rgb", "light", or None when outside the plots.
+            x (float | None):
+                Seconds before the right edge of the view.
+            y (float | None):
+                Hovered data Y, for the horizontal crosshair line.
+
+        Returns:
+            None
+        """
+        if panel is None:
             self.info_text.SetLabel("Hover over plot to see RGB/Light data")
+            self.crosshair.hide()
+            return
+        snap = self.store.snapshot()
+        t = snap["t"]
+        if not len(t) or x is None:
+            return
+
+        # Plot x is seconds before the right edge of the drawn view
+        view_time, duration = self.drawn_window(t)
+        try:
+            row = self.store.nearest(view_time - x, require_rgb=panel == "rgb",
+                                     t_lo=view_time - duration, t_hi=view_time)
+        except Exception:
+            row = None
+        if row is None:
+            self.info_text.SetLabel("RGB: No data" if panel == "rgb" else "Light: No data")
+            self.crosshair.hide()
+            return
+        self.info_text.SetLabel(f"t {row['t']:.2f} s → R: {row['r']}, G: {row['g']}, "
+                                f"B: {row['b']}, Lux: {row['light']}")
+        if self.render_mode != RENDER_NATIVE:
+            ax = self.ax_rgb if panel == "rgb" else self.ax_light
+            self.crosshair.show(ax, view_time - row["t"], y)
 
     def make_axis_collapse_panel(self):
         """
@@ -483,7 +846,7 @@ class StreamPlotFrame(wx.Frame):
         """
         # Create the collapsible pane
         collapse = wx.CollapsiblePane(self,
-                                    label="Set Axis Limit >",
+                                    label="Set Axis Limit / Resample >",
                                     style=wx.CP_DEFAULT_STYLE)
         # collapse.SetBackgroundColour(wx.BLACK)
         pane = collapse.GetPane()
@@ -497,6 +860,8 @@ class StreamPlotFrame(wx.Frame):
         sizer = wx.BoxSizer(wx.VERTICAL)
         sizer.Add(self.make_axis_row(pane, "RGB"), 0, wx.ALL | wx.EXPAND, 5)
         sizer.Add(self.make_axis_row(pane, "Light"), 0, wx.ALL | wx.EXPAND, 5)
+        sizer.Add(self.make_resample_row(pane), 0, wx.ALL | wx.EXPAND, 5)
+        sizer.Add(self.make_render_row(pane), 0, wx.ALL | wx.EXPAND, 5)
         pane.SetSizer(sizer)
         return collapse
     def on_pane_changed(self, event):
@@ -636,7 +1001,8 @@ class StreamPlotFrame(wx.Frame):
             • Converts values to float.
             • Updates stored axis limit configuration.
             • Applies limits to target Matplotlib axis.
-            • Triggers plot redraw.
+            • Triggers plot redraw, including the native panel
+              while capture is stopped.
 
         Args:
             event:
@@ -669,7 +1035,11 @@ class StreamPlotFrame(wx.Frame):
             if limits["ymin"] is not None and limits["ymax"] is not None:
                 self.light_ylim = [limits["ymin"], limits["ymax"]]
                 self.ax_light.set_ylim(self.light_ylim)
-        self.canvas.draw()
+        # The native panel reads the limits from the render options,
+        # so it only picks them up on its next redraw
+        if self.render_mode != RENDER_NATIVE:
+            self.canvas.draw()
+        self.request_redraw()
 
     def on_start(self, event):
         """
@@ -680,16 +1050,16 @@ class StreamPlotFrame(wx.Frame):
         real-time plot updates.
 
         Functional Behavior:
-            • Sends "stream 3" command to device.
-            • Enables streaming state flag.
-            • Launches background serial read thread.
+            • Marks this window live on the device's stream hub.
+            • Hub sends "stream 3" and launches the shared serial
+              read thread if no other window is streaming yet.
             • Starts periodic UI update timer.
 
         Execution Flow:
-            1. Obtain active serial handle from device.
-            2. Send streaming command.
-            3. Spawn daemon thread for read_serial().
-            4. Start wx.Timer for plot refresh (500 ms interval).
+            1. Check that a device is connected.
+            2. Register as an active hub subscriber.
+            3. Start wx.Timer for plot refresh at the frame
+               governor's current interval.
 
         Args:
             event:
@@ -698,14 +1068,19 @@ class StreamPlotFrame(wx.Frame):
         Returns:
             None
         """
-        self.ser = self.device.ser
-        self.ser.write(b"stream 3\r\n")
+        if self.device is None:
+            wx.MessageBox(
+                "No device is connected. Please connect a Model2450 device first.",
+                "Device Not Connected",
+                wx.OK | wx.ICON_WARNING
+            )
+            return
 
+        self.stop_playback()
+        self.hub.start(self)
         if not self.keep_running:
             self.keep_running = True
-            # Don't reset start_time to preserve continuity
-            threading.Thread(target=self.read_serial, daemon=True).start()
-            self.timer.Start(500)
+            self.timer.Start(self.frame_governor.interval_ms)
     
     def on_reset(self, event):
         """
@@ -715,9 +1090,13 @@ class StreamPlotFrame(wx.Frame):
         associated timestamp arrays. Resets the streaming
         reference time and redraws the plot canvas.
 
+        The samples are shared through the device's stream hub,
+        so every Stream Plot window on the device is reset.
+
         Functional Behavior:
-            • Acquire thread lock for safe data clearing.
             • Clear RGB, Light, and time buffers.
+            • Clear channel histograms.
+            • Clear this window's bookmarks.
             • Reset start_time reference.
             • Trigger plot redraw.
 
@@ -729,16 +1108,90 @@ class StreamPlotFrame(wx.Frame):
             None
             
         """
-        with self.data_lock:
-            self.r_data.clear()
-            self.g_data.clear()
-            self.b_data.clear()
-            self.light_data.clear()
-            self.time_data_rgb.clear()
-            self.time_data_light.clear()
-        self.start_time = time.time()
+        self.stop_playback()
+        self.hub.reset()
+        self.bookmarks.clear()
+        self.bookmark_choice.Clear()
+        if self.blit_lines:
+            for line in self.blit_lines.values():
+                line.set_data([], [])
         self.canvas.draw()
     
+    def on_histogram(self, event):
+        """
+        Open the live histogram view for this stream.
+
+        Only one histogram window is kept per stream plot; a
+        second click raises the existing one.
+
+        Args:
+            event:
+                wx.ButtonEvent triggered by Histogram button.
+
+        Returns:
+            None
+        """
+        if self.hist_frame:
+            self.hist_frame.Raise()
+            return
+        self.hist_frame = HistogramFrame(self, self.histograms)
+        self.hist_frame.Show()
+
+    def on_chromaticity(self, event):
+        """
+        Open the live chromaticity view for this stream.
+
+        Like the histogram, one window is kept per stream plot.
+
+        Args:
+            event:
+                wx.ButtonEvent triggered by Chromaticity button.
+
+        Returns:
+            None
+        """
+        if self.chroma_frame:
+            self.chroma_frame.Raise()
+            return
+        self.chroma_frame = ChromaticityFrame(self, self.hub.chromaticity)
+        self.chroma_frame.Show()
+
+    def on_flicker(self, event):
+        """
+        Open the live flicker spectrum view for this stream.
+
+        Like the histogram, one window is kept per stream plot.
+
+        Args:
+            event:
+                wx.ButtonEvent triggered by Flicker button.
+
+        Returns:
+            None
+        """
+        if self.flicker_frame:
+            self.flicker_frame.Raise()
+            return
+        self.flicker_frame = FlickerFrame(self, self.store)
+        self.flicker_frame.Show()
+
+    def on_trigger(self, event):
+        """
+        Configure triggered acquisition for this device's stream.
+
+        The trigger engine is part of the shared stream hub, so
+        the setting applies to every window on the device.
+
+        Args:
+            event:
+                wx.ButtonEvent triggered by Trigger button.
+
+        Returns:
+            None
+        """
+        with TriggerDialog(self, self.hub.trigger) as dlg:
+            dlg.ShowModal()
+
     def on_stop(self, event):
         """
         Stop real-time streaming and freeze plot.
@@ -748,8 +1201,9 @@ class StreamPlotFrame(wx.Frame):
 
         Functional Behavior:
             • Disable streaming state flag.
-            • Send "stream 0" command to device.
-            • Stop wx.Timer updates.
+            • Release this window's hold on the stream hub;
+              "stream 0" is sent once no window is live.
+            • Stop wx.Timer updates and any playback.
             • Update slider to final data position.
 
         Args:
@@ -760,24 +1214,22 @@ class StreamPlotFrame(wx.Frame):
             None
         """
         self.keep_running = False
-        if self.ser:
-            self.ser.write(b"stream 0\r\n")
+        self.hub.stop(self)
+        self.stop_playback()
         self.timer.Stop()
-        with self.data_lock:
-            self.slider.SetMax(max(0, len(self.time_data_rgb) - 1))
-            self.slider.SetValue(self.slider.GetMax())
+        self.slider.SetMax(max(0, len(self.store) - 1))
+        self.slider.SetValue(self.slider.GetMax())
     
     def adjust_zoom(self, factor):
         """
         Adjust horizontal zoom level of the plot view.
 
         Modifies the zoom scale applied to the time axis
-        for both RGB and Light plots. Zooming is disabled
-        while real-time streaming is active to prevent
-        UI conflicts.
+        for both RGB and Light plots. Works while streaming:
+        only the view window changes, and the next refresh
+        tick draws it.
 
         Functional Behavior:
-            • Ignore zoom requests during streaming.
             • Multiply current zoom_scale by factor.
             • Enforce minimum zoom limit.
             • Refresh plot with updated zoom window.
@@ -791,49 +1243,120 @@ class StreamPlotFrame(wx.Frame):
         Returns:
             None
         """
-        if self.keep_running:
-            print("[Zoom] Ignored during streaming")
-            return  # Do not zoom while streaming
-
+        self.zoom_fit_mode = False
         self.zoom_scale *= factor
         self.zoom_scale = max(0.1, self.zoom_scale)  # only lower limit
         # print(f"[Zoom] Scale: {self.zoom_scale:.2f}, Window: {60 / self.zoom_scale:.2f}s")
-        self.update_plot(None)
+        self.request_redraw()
      
-    def on_zoom_fit(self, event):
+    def pan(self, seconds):
         """
-        Enable Zoom-Fit mode for the stream plots.
-
-        Adjusts the plot view to display the entire
-        available dataset (RGB and Light) within
-        the visible window. This provides a full
-        historical view instead of the rolling
-        time window used during streaming.
+        Move the view window back (positive) or forward in time.
 
-        Functional Behavior:
-            • Stops real-time streaming visualization.
-            • Activates zoom_fit_mode.
-            • Calculates maximum dataset length.
-            • Updates slider range to dataset size.
-            • Moves slider to latest data position.
-            • Refreshes plot display.
+        While streaming the view stays that far behind the newest
+        sample as data keeps arriving.
 
         Args:
-            event:
-                wxPython button click event object.
+            seconds (float):
+                Shift of the view's right edge.
 
         Returns:
             None
         """
-        self.keep_running = False
-        self.zoom_fit_mode = True
-        with self.data_lock:
-            # Use max length among RGB and Light to update slider
-            max_len = max(len(self.time_data_rgb), len(self.time_data_light))
-            if max_len > 0:
-                self.slider.SetMax(max_len - 1)
-                self.slider.SetValue(self.slider.GetMax())
-        self.update_plot(None)
+        self.zoom_fit_mode = False
+        self.pan_offset = self.pan_offset + seconds
+        if self.keep_running:
+            self.pan_offset = max(0.0, self.pan_offset)
+        self.request_redraw()
+
+    def on_wheel(self, step, ctrl):
+        """
+        Pan with the mouse wheel, or zoom with Ctrl + wheel.
+
+        Args:
+            step (float):
+                Wheel steps; positive is away from the user.
+            ctrl (bool):
+                Ctrl key held.
+
+        Returns:
+            None
+        """
+        if ctrl:
+            self.adjust_zoom(WHEEL_ZOOM_FACTOR ** step)
+        else:
+            self.pan(step * PAN_STEP * 60 / self.zoom_scale)
+
+    def on_canvas_scroll(self, event):
+        """
+        Forward matplotlib scroll events to on_wheel().
+
+        Args:
+            event:
+                Matplotlib scroll_event.
+
+        Returns:
+            None
+        """
+        self.on_wheel(event.step, event.key in ("control", "ctrl"))
+
+    def on_live(self, event):
+        """
+        Return the view to the newest samples at the current zoom.
+
+        Args:
+            event:
+                wx.ButtonEvent triggered by Live button.
+
+        Returns:
+            None
+        """
+        self.pan_offset = 0.0
+        self.zoom_fit_mode = False
+        self.stop_playback()
+        if not self.keep_running and len(self.store):
+            self.slider.SetMax(len(self.store) - 1)
+            self.slider.SetValue(self.slider.GetMax())
+        self.request_redraw()
+
+    def on_zoom_fit(self, event):
+        """
+        Enable Zoom-Fit mode for the stream plots.
+
+        Adjusts the plot view to display the entire
+        available dataset (RGB and Light) within
+        the visible window. This provides a full
+        historical view instead of the rolling
+        time window used during streaming.
+
+        Functional Behavior:
+            • Stops real-time streaming visualization.
+            • Releases this window's hold on the stream hub.
+            • Activates zoom_fit_mode.
+            • Calculates maximum dataset length.
+            • Updates slider range to dataset size.
+            • Moves slider to latest data position.
+            • Refreshes plot display.
+
+        Args:
+            event:
+                wxPython button click event object.
+
+        Returns:
+            None
+        """
+        if self.keep_running:
+            self.keep_running = False
+            self.hub.stop(self)
+            self.timer.Stop()
+        self.stop_playback()
+        self.zoom_fit_mode = True
+        self.pan_offset = 0.0
+        max_len = len(self.store)
+        if max_len > 0:
+            self.slider.SetMax(max_len - 1)
+            self.slider.SetValue(self.slider.GetMax())
+        self.request_redraw()
 
     def on_slider_scroll(self, event):
         """
@@ -851,6 +1374,9 @@ class StreamPlotFrame(wx.Frame):
             • Refreshes plot display accordingly.
             • Shows historical data relative to
             the selected slider position.
+            • During playback, seeks playback to the sample
+              under the slider.
+            • Shows the time of the slider position.
 
         Args:
             event:
@@ -859,8 +1385,333 @@ class StreamPlotFrame(wx.Frame):
         Returns:
             None
         """
-        self.update_plot(None)
+        t = self.store.snapshot()["t"]
+        if len(t):
+            position = float(t[min(self.slider.GetValue(), len(t) - 1)])
+            self.position_text.SetLabel(f"{position:.2f} s")
+            if self.playback_time is not None:
+                self.playback_time = position
+                self.playback_tick = time.perf_counter()
+                self.update_playback_label(t)
+        self.request_redraw()
+
+    def make_playback_row(self):
+        """
+        Create the playback controls shown under the slider.
+
+        Returns:
+            wx.BoxSizer:
+                Configured horizontal sizer.
+        """
+        row_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        self.play_btn = wx.Button(self, label="Play")
+        self.play_btn.Bind(wx.EVT_BUTTON, self.on_play)
+        row_sizer.Add(self.play_btn, 0, wx.ALL, 5)
+        row_sizer.Add(wx.StaticText(self, label="Speed:"), 0,
+                      wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 5)
+        self.speed_choice = wx.Choice(self, choices=[f"{speed:g}x" for speed in PLAYBACK_SPEEDS])
+        self.speed_choice.SetSelection(PLAYBACK_SPEEDS.index(1))
+        self.speed_choice.Bind(wx.EVT_CHOICE, self.on_playback_speed)
+        row_sizer.Add(self.speed_choice, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 10)
+        self.playback_text = wx.StaticText(self, label="")
+        self.playback_text.SetForegroundColour(wx.Colour("white"))
+        row_sizer.Add(self.playback_text, 0, wx.ALIGN_CENTER_VERTICAL)
+        return row_sizer
+
+    def on_play(self, event):
+        """
+        Start or pause playback of the recorded samples.
+
+        Functional Behavior:
+            • Stops live streaming first, if running.
+            • Plays from the slider position, or from the start
+              when the slider is at the end.
+            • The refresh timer advances the view's right edge by
+              the elapsed wall time times the speed, so frames go
+              through the same view pipeline and frame governor
+              as live mode.
+
+        Args:
+            event:
+                wx.ButtonEvent from the Play button.
+
+        Returns:
+            None
+        """
+        if self.playing:
+            self.pause_playback()
+            return
+        if self.keep_running:
+            self.on_stop(None)
+        t = self.store.snapshot()["t"]
+        if not len(t):
+            wx.MessageBox("No data to play back!", "Warning", wx.OK | wx.ICON_WARNING)
+            return
+        if self.playback_time is None or self.playback_time >= t[-1]:
+            index = self.slider.GetValue()
+            self.playback_time = float(t[0] if index >= len(t) - 1 else t[index])
+        self.zoom_fit_mode = False
+        self.pan_offset = 0.0
+        self.playing = True
+        self.playback_tick = time.perf_counter()
+        self.play_btn.SetLabel("Pause")
+        self.slider.SetMax(len(t) - 1)
+        self.timer.Start(self.frame_governor.interval_ms)
+        self.request_redraw()
+
+    def pause_playback(self):
+        """
+        Pause playback, keeping the view at the current position.
+
+        Returns:
+            None
+        """
+        if not self.playing:
+            return
+        self.playing = False
+        self.play_btn.SetLabel("Play")
+        if not self.keep_running:
+            self.timer.Stop()
+
+    def stop_playback(self):
+        """
+        Leave playback mode.
+
+        Returns:
+            None
+        """
+        self.pause_playback()
+        self.playback_time = None
+        self.playback_text.SetLabel("")
+
+    def on_playback_speed(self, event):
+        """
+        Change the playback speed.
+
+        Args:
+            event:
+                wx.CommandEvent from the speed choice.
+
+        Returns:
+            None
+        """
+        self.advance_playback()
+        self.playback_speed = PLAYBACK_SPEEDS[self.speed_choice.GetSelection()]
+
+    def advance_playback(self):
+        """
+        Move the playback position by the elapsed time.
+
+        The slider follows the position; its sample index is found
+        by binary search on the time column. Playback pauses at
+        the last sample.
+
+        Returns:
+            None
+        """
+        if not self.playing:
+            return
+        now = time.perf_counter()
+        t = self.store.snapshot()["t"]
+        if not len(t):
+            self.stop_playback()
+            return
+        self.playback_time += (now - self.playback_tick) * self.playback_speed
+        self.playback_tick = now
+        if self.playback_time >= t[-1]:
+            self.playback_time = float(t[-1])
+            self.pause_playback()
+        self.slider.SetValue(index_at(t, self.playback_time))
+        self.update_playback_label(t)
+        self.dirty = True
+
+    def update_playback_label(self, t):
+        """
+        Show the playback position.
+
+        Args:
+            t (numpy.ndarray):
+                Non-empty sample time column.
+
+        Returns:
+            None
+        """
+        self.playback_text.SetLabel(f"{self.playback_time - t[0]:.1f} s / "
+                                    f"{t[-1] - t[0]:.1f} s")
+
+    def make_navigation_row(self):
+        """
+        Create the jump-to-time and bookmark controls.
+
+        Times are capture times in seconds, as in the Time column
+        of saved files.
+
+        Returns:
+            wx.BoxSizer:
+                Configured horizontal sizer.
+        """
+        row_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        row_sizer.Add(wx.StaticText(self, label="Go to (s):"), 0,
+                      wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 5)
+        self.goto_ctrl = wx.TextCtrl(self, style=wx.TE_PROCESS_ENTER, size=(80, -1))
+        self.goto_ctrl.Bind(wx.EVT_CHAR, self.on_char_numeric_only)
+        self.goto_ctrl.Bind(wx.EVT_TEXT_ENTER, self.on_goto)
+        row_sizer.Add(self.goto_ctrl, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 5)
+        goto_btn = wx.Button(self, label="Go")
+        goto_btn.Bind(wx.EVT_BUTTON, self.on_goto)
+        row_sizer.Add(goto_btn, 0, wx.ALL, 5)
+        bookmark_btn = wx.Button(self, label="Bookmark")
+        bookmark_btn.Bind(wx.EVT_BUTTON, self.on_add_bookmark)
+        row_sizer.Add(bookmark_btn, 0, wx.ALL, 5)
+        self.bookmark_choice = wx.Choice(self, size=(110, -1))
+        self.bookmark_choice.Bind(wx.EVT_CHOICE, self.on_bookmark_choice)
+        row_sizer.Add(self.bookmark_choice, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 5)
+        prev_btn = wx.Button(self, label="<", size=(30, -1))
+        prev_btn.Bind(wx.EVT_BUTTON, lambda evt: self.step_bookmark(-1))
+        row_sizer.Add(prev_btn, 0, wx.ALL, 5)
+        next_btn = wx.Button(self, label=">", size=(30, -1))
+        next_btn.Bind(wx.EVT_BUTTON, lambda evt: self.step_bookmark(1))
+        row_sizer.Add(next_btn, 0, wx.ALL, 5)
+        self.position_text = wx.StaticText(self, label="")
+        self.position_text.SetForegroundColour(wx.Colour("white"))
+        row_sizer.Add(self.position_text, 0, wx.ALIGN_CENTER_VERTICAL)
+        return row_sizer
+
+    def view_centre(self, t):
+        """
+        Capture time at the centre of the view on screen.
+
+        Args:
+            t (numpy.ndarray):
+                Non-empty sample time column.
+
+        Returns:
+            float
+        """
+        current_time, plot_window = self.drawn_window(t)
+        return float(current_time - plot_window / 2)
+
+    def jump_to_time(self, target):
+        """
+        Centre the view on a capture time.
+
+        Functional Behavior:
+            • Stops live streaming first, if running.
+            • Finds the slider position by binary search on the
+              time column, so a jump costs O(log n) however long
+              the capture is.
+            • During playback, continues playing from there.
+
+        Args:
+            target (float):
+                Capture time in seconds; clamped to the stored
+                samples.
+
+        Returns:
+            None
+        """
+        t = self.store.snapshot()["t"]
+        if not len(t):
+            wx.MessageBox("No data to navigate!", "Warning", wx.OK | wx.ICON_WARNING)
+            return
+        if self.keep_running:
+            self.on_stop(None)
+        self.zoom_fit_mode = False
+        target = min(max(target, t[0]), t[-1])
+        right = min(target + 30 / self.zoom_scale, t[-1])
+        index = index_at(t, right)
+        self.slider.SetMax(len(t) - 1)
+        self.slider.SetValue(index)
+        # The slider anchors the view at a sample time; the pan
+        # offset covers the rest of the way to the exact time
+        self.pan_offset = float(t[index] - right)
+        if self.playback_time is not None:
+            self.pan_offset = 0.0
+            self.playback_time = float(right)
+            self.playback_tick = time.perf_counter()
+            self.update_playback_label(t)
+        self.position_text.SetLabel(f"{target:.2f} s")
+        self.request_redraw()
+
+    def on_goto(self, event):
+        """
+        Jump to the time typed in the Go to field.
+
+        Args:
+            event:
+                wx.CommandEvent from the Go button or Enter key.
+
+        Returns:
+            None
+        """
+        try:
+            target = float(self.goto_ctrl.GetValue())
+        except ValueError:
+            wx.MessageBox("Enter a time in seconds.", "Error", wx.OK | wx.ICON_ERROR)
+            return
+        self.jump_to_time(target)
+
+    def on_add_bookmark(self, event):
+        """
+        Bookmark the time at the centre of the current view.
+
+        Args:
+            event:
+                wx.ButtonEvent from the Bookmark button.
+
+        Returns:
+            None
+        """
+        t = self.store.snapshot()["t"]
+        if not len(t):
+            wx.MessageBox("No data to bookmark!", "Warning", wx.OK | wx.ICON_WARNING)
+            return
+        pos = self.bookmarks.add(self.view_centre(t))
+        self.bookmark_choice.Set(self.bookmarks.labels)
+        self.bookmark_choice.SetSelection(pos)
+
+    def on_bookmark_choice(self, event):
+        """
+        Jump to the selected bookmark.
+
+        Args:
+            event:
+                wx.CommandEvent from the bookmark choice.
+
+        Returns:
+            None
+        """
+        pos = self.bookmark_choice.GetSelection()
+        if pos != wx.NOT_FOUND:
+            self.jump_to_time(self.bookmarks.times[pos])
 
+    def step_bookmark(self, direction):
+        """
+        Jump to the nearest bookmark before or after the view centre.
+
+        Args:
+            direction (int):
+                -1 for the previous bookmark, 1 for the next.
+
+        Returns:
+            None
+        """
+        t = self.store.snapshot()["t"]
+        if not len(t) or not len(self.bookmarks):
+            return
+        centre = self.view_centre(t)
+        # Step from the selected bookmark while the view is still on
+        # it; a jump near the end of the capture cannot centre it
+        current = self.bookmark_choice.GetSelection()
+        if current != wx.NOT_FOUND:
+            marked = self.bookmarks.times[current]
+            if abs(marked - centre) <= self.drawn_window(t)[1] / 2:
+                centre = marked
+        pos = self.bookmarks.before(centre) if direction < 0 else self.bookmarks.after(centre)
+        if pos is None:
+            return
+        self.bookmark_choice.SetSelection(pos)
+        self.jump_to_time(self.bookmarks.times[pos])
 
     def on_checkbox_toggle(self, event):
         """
@@ -872,7 +1723,8 @@ class StreamPlotFrame(wx.Frame):
 
         Functional Behavior:
             • Detects checkbox state change.
-            • Refreshes plot only when streaming is stopped.
+            • Marks the plot dirty; the change is drawn on the
+              next refresh tick or coalesced interaction redraw.
             • Dynamically shows or hides selected channels.
 
         Args:
@@ -882,69 +1734,63 @@ class StreamPlotFrame(wx.Frame):
         Returns:
             None
         """
-        if not self.keep_running:
-            self.update_plot(None)
-    def read_serial(self):
+        self.request_redraw()
+
+    def request_redraw(self):
         """
-        Read and process streaming sensor data from the device serial port.
+        Schedule a redraw after a UI interaction.
 
-        This method runs in a background thread and continuously reads
-        packetized data from the connected Model2450 device. It decodes
-        incoming packets, extracts payload content, parses RGB and Light
-        sensor values, and appends them to internal data buffers for
-        real-time plotting.
+        Bursts of slider, checkbox and zoom events within
+        FRAME_COALESCE_MS are merged into one redraw. While
+        streaming or playing back, the refresh timer picks the
+        change up instead.
 
-        Args:
+        Returns:
             None
+        """
+        self.dirty = True
+        if not (self.keep_running or self.playing) and not self.redraw_timer.IsRunning():
+            self.redraw_timer.StartOnce(FRAME_COALESCE_MS)
+
+    def on_redraw_timer(self, event):
+        """
+        Perform a coalesced interaction redraw.
+
+        Args:
+            event:
+                wx.TimerEvent from redraw_timer.
 
         Returns:
             None
+        """
+        if self.dirty and is_window_visible(self):
+            self.update_plot(None)
 
+    def on_refresh_timer(self, event):
         """
-        buffer = b""
-        while self.keep_running:
-            packet = read_packet_from_serial(self.ser)
-            if not packet:
-                continue
-            try:
-                decoded = decode_packet(packet)
-            except Exception as e:
-                print(f"[Decode Error] {e}")
-                continue
-
-            payload = decoded["payload"]
-            buffer += payload
-            while b'\r\n' in buffer:
-                line, buffer = buffer.split(b'\r\n', 1)
-                full_line = line.decode("utf-8", errors="ignore").strip()
-                r = g = b = light = 0
-                if ':' in full_line:
-                    parts = full_line.split(":")
-                    if len(parts) == 3 and all(p.strip().isdigit() for p in parts):
-                        r, g, b = map(int, parts)
-                elif ',' in full_line:
-                    parts = full_line.split(',')
-                    if len(parts) == 4 and all(p.strip().isdigit() for p in parts):
-                        r, g, b, light = map(int, parts)
-                elif full_line.strip().isdigit():
-                    light = int(full_line.strip())
-                else:
-                    continue
-                ts = round(time.time() - self.start_time, 2)
-                with self.data_lock:
-                    self.r_data.append(r)
-                    self.g_data.append(g)
-                    self.b_data.append(b)
-                    self.light_data.append(light)
-                    self.time_data_rgb.append(ts)
-                    self.time_data_light.append(ts)
-
-                    maxlen = 1000000
-                    for buf in [self.r_data, self.g_data, self.b_data, self.light_data,
-                                self.time_data_rgb, self.time_data_light]:
-                        if len(buf) > maxlen:
-                            buf[:] = buf[-maxlen:]
-    
+        Periodic live refresh driven by the frame governor.
+
+        Redraws only when new samples arrived or the view changed,
+        and retunes the timer when the governor picks a new
+        interval. Nothing is drawn while the window is hidden or
+        minimized; the hub keeps ingesting, and the first tick
+        after the window reappears catches up in one redraw.
+
+        Args:
+            event:
+                wx.TimerEvent from the refresh timer.
+
+        Returns:
+            None
+        """
+        self.advance_playback()
+        if not self.dirty and self.store.version == self.drawn_version:
+            self.frame_governor.skip()
+            return
+        if not is_window_visible(self):
+            return
+        self.update_plot(None)
+
     def update_plot(self, event):
         """
         Render and refresh real-time RGB and Light intensity plots.
@@ -958,6 +1804,9 @@ class StreamPlotFrame(wx.Frame):
             • Upper Plot  → RGB Intensity
             • Lower Plot  → Light Intensity (Lux)
 
+        The visible data is prepared once by prepare_view() and
+        handed to the renderer for the current render mode. The
+        time taken is reported to the frame governor.
 
         Args:
             event:
@@ -967,163 +1816,449 @@ class StreamPlotFrame(wx.Frame):
             None
 
         """
-        with self.data_lock:
-            r_data = self.r_data[:]
-            g_data = self.g_data[:]
-            b_data = self.b_data[:]
-            time_data_rgb = self.time_data_rgb[:]
-            light_data = self.light_data[:]
-            time_data_light = self.time_data_light[:]
+        started = time.perf_counter()
+        version = self.store.version
+        snap = self.store.snapshot()
+        self.dirty = False
+        self.drawn_version = version
+        if not len(snap["t"]):
+            return
+        view = self.prepare_view(snap, version)
+        prepared = time.perf_counter()
+        self.last_view = (view["current_time"], view["plot_window"])
+        if self.render_mode == RENDER_NATIVE:
+            self.native_panel.set_view(view, self.render_options())
+        elif self.render_mode == RENDER_THREADED:
+            self.render_threaded(view)
+        elif self.render_mode == RENDER_BLIT:
+            self.render_blit(view)
+        else:
+            self.render_classic(view)
+
+        if not self.keep_running:
+            self.zoom_fit_mode = False
+
+        if self.render_mode == RENDER_THREADED:
+            # Timed when the worker finishes, in on_raster_ready()
+            self.prep_seconds = time.perf_counter() - started
+        else:
+            elapsed = time.perf_counter() - started
+            self.perf.record_frame(prepared - started, elapsed - (prepared - started))
+            self.record_frame(elapsed)
+
+    def record_frame(self, seconds):
+        """
+        Report a finished frame to the frame governor.
+
+        Args:
+            seconds (float):
+                Time spent preparing and drawing the frame.
+
+        Returns:
+            None
+        """
+        if self.frame_governor.record(seconds) and (self.keep_running or self.playing):
+            self.timer.Start(self.frame_governor.interval_ms)
+
+    def prepare_view(self, snap, version=None):
+        """
+        Select and transform the samples inside the visible window.
+
+        Prepared views are cached by store version, view position,
+        zoom, resampling and plot width, so scrolling a stopped
+        capture back and forth or toggling channels only hands
+        existing arrays to the renderer. The cache is dropped as
+        soon as the store changes.
+
+        Args:
+            snap (dict):
+                Column views from StreamStore.snapshot().
+            version (int | None):
+                Store version the snapshot was taken at; None
+                disables caching.
+
+        Returns:
+            dict:
+                "current_time", "plot_window", "x_rgb", "r", "g",
+                "b", "x_light", "light". X values are seconds before
+                the right edge of the view. Large windows are
+                drawn from the store's summary pyramid, or reduced
+                with M4 decimation to the plot's pixel width.
+        """
+        current_time, plot_window = self._view_window(snap["t"])
+        width = self.plot_pixel_width()
+        rate, mode = self.resample_settings()
+        if version is None:
+            return self.compute_view(snap, current_time, plot_window, width, rate, mode)
+
+        if version != self.view_cache_version:
+            self.view_cache.clear()
+            self.view_cache_version = version
+        key = (float(current_time), float(plot_window), width, rate, mode)
+        view = self.view_cache.get(key)
+        if view is None:
+            view = self.compute_view(snap, current_time, plot_window, width, rate, mode)
+            self.view_cache[key] = view
+            if len(self.view_cache) > VIEW_CACHE_SIZE:
+                self.view_cache.popitem(last=False)
+        else:
+            self.view_cache.move_to_end(key)
+        return view
+
+    def compute_view(self, snap, current_time, plot_window, width, rate, mode):
+        """
+        Build the visible data for one view position.
+
+        The window's sample range is found by binary search on the
+        time column, so only the visible slice is touched.
+
+        Args:
+            snap (dict):
+                Column views from StreamStore.snapshot().
+            current_time (float):
+                Time at the right edge of the view.
+            plot_window (float):
+                Visible window width in seconds.
+            width (int):
+                Plot width in pixels.
+            rate (float):
+                Resample rate, or 0 for raw samples.
+            mode (str):
+                Resample mode.
+
+        Returns:
+            dict:
+                See prepare_view().
+        """
+        t = snap["t"]
+        if rate:
+            # Resample only the visible window, on a grid anchored to
+            # whole periods so it does not shift between refreshes
+            t0 = np.floor((current_time - plot_window) * rate) / rate
+            lo = np.searchsorted(t, t0, side="left")
+            hi = np.searchsorted(t, current_time, side="right")
+            view = resample_columns({k: v[lo:hi] for k, v in snap.items()}, rate, mode,
+                                    t0, current_time)
+            x_rgb = x_light = current_time - view["t"]
+            r_vals, g_vals, b_vals = view["r"], view["g"], view["b"]
+            y_light = view["light"]
+        else:
+            summary = self.store.summary(current_time - plot_window, current_time, width)
+            if summary is not None:
+                return self.summary_view(summary, current_time, plot_window)
+            lo = np.searchsorted(t, current_time - plot_window, side="left")
+            hi = np.searchsorted(t, current_time, side="right")
+            r_data, g_data, b_data = snap["r"][lo:hi], snap["g"][lo:hi], snap["b"][lo:hi]
+            # Seconds before the right edge of the view
+            x_vals = current_time - t[lo:hi]
+            nonzero = (r_data > 0) | (g_data > 0) | (b_data > 0)
+            x_rgb = x_vals[nonzero]
+            r_vals, g_vals, b_vals = r_data[nonzero], g_data[nonzero], b_data[nonzero]
+            x_light = x_vals
+            y_light = snap["light"][lo:hi].astype(np.float32)
+            # Lines without a Light value are gaps; dark readings stay
+            y_light[~snap["has_light"][lo:hi]] = np.nan
+
+        # Keep at most a few samples per pixel column
+        keep = m4_indices(x_rgb, [r_vals, g_vals, b_vals], width, 0, plot_window)
+        if len(keep) < len(x_rgb):
+            x_rgb, r_vals, g_vals, b_vals = x_rgb[keep], r_vals[keep], g_vals[keep], b_vals[keep]
+        keep = m4_indices(x_light, [y_light], width, 0, plot_window)
+        if len(keep) < len(x_light):
+            x_light, y_light = x_light[keep], y_light[keep]
+
+        return {
+            "current_time": current_time,
+            "plot_window": plot_window,
+            "x_rgb": x_rgb,
+            "r": r_vals,
+            "g": g_vals,
+            "b": b_vals,
+            "x_light": x_light,
+            "light": y_light,
+        }
+
+    def summary_view(self, summary, current_time, plot_window):
+        """
+        Build plot data from summary pyramid blocks.
+
+        Each block contributes its minimum at its first sample time
+        and its maximum at its last, so peaks stay visible.
+
+        Args:
+            summary (dict):
+                Blocks from StreamStore.summary().
+            current_time (float):
+                Time at the right edge of the view.
+            plot_window (float):
+                Visible window width in seconds.
+
+        Returns:
+            dict:
+                Same layout as prepare_view().
+        """
+        x = (current_time - np.column_stack((summary["t0"], summary["t1"]))).ravel()
+        envelope = {ch: np.column_stack((summary[ch + "_min"], summary[ch + "_max"])).ravel()
+                    for ch in ("r", "g", "b", "light")}
+        has_rgb = ~np.isnan(envelope["r"])
+        return {
+            "current_time": current_time,
+            "plot_window": plot_window,
+            "x_rgb": x[has_rgb],
+            "r": envelope["r"][has_rgb],
+            "g": envelope["g"][has_rgb],
+            "b": envelope["b"][has_rgb],
+            "x_light": x,
+            "light": envelope["light"],
+        }
+
+    def plot_pixel_width(self):
+        """
+        Width of the plot area in device pixels.
+
+        Returns:
+            int
+        """
+        if self.render_mode == RENDER_NATIVE:
+            return self.native_panel.panel_rects()["rgb"][2]
+        width = int(self.ax_rgb.bbox.width)
+        if width <= 1:
+            width = self.canvas.GetSize().width
+        return width
+
+    def render_options(self):
+        """
+        Collect the UI state the axis renderers need.
+
+        Read on the GUI thread, so worker renderers never touch
+        wx controls.
+
+        Returns:
+            dict:
+                "visible", "rgb_ylim", "light_ylim", "zoom_fit".
+        """
+        return {
+            "visible": {
+                "r": self.red_cb.GetValue(),
+                "g": self.green_cb.GetValue(),
+                "b": self.blue_cb.GetValue(),
+                "light": self.light_cb.GetValue(),
+            },
+            "rgb_ylim": list(self.rgb_ylim),
+            "light_ylim": list(self.light_ylim),
+            "zoom_fit": self.zoom_fit_mode,
+        }
+
+    def render_classic(self, view):
+        """
+        Rebuild both axes and redraw the whole canvas.
+
+        Args:
+            view (dict):
+                Visible data from prepare_view().
+
+        Returns:
+            None
+        """
+        draw_stream_axes(self.ax_rgb, self.ax_light, view, self.render_options())
+        self.canvas.draw()
+
+    def render_threaded(self, view):
+        """
+        Hand the frame to the raster worker thread.
+
+        The window's own axes only get the new limits, so mouse
+        positions still map to the right times; the pixels come
+        from the worker in on_raster_ready().
+
+        Args:
+            view (dict):
+                Visible data from prepare_view().
+
+        Returns:
+            None
+        """
+        plot_window = view["plot_window"]
+        self.ax_rgb.set_xlim(plot_window, 0)
+        self.ax_light.set_xlim(plot_window, 0)
+        self.ax_rgb.set_ylim(self.rgb_ylim)
+        self.ax_light.set_ylim(self.light_ylim)
+        width, height = int(self.figure.bbox.width), int(self.figure.bbox.height)
+        self.raster.submit(view, self.render_options(), width, height,
+                           self.figure.dpi, self.raster_token)
+
+    def on_raster_ready(self, rgba, width, height, seconds, token):
+        """
+        Show a frame rasterized by the worker thread.
+
+        The pixels are copied into the canvas's Agg buffer as well
+        as its bitmap, so span selection blitting works on top of
+        them as usual.
+
+        Args:
+            rgba (numpy.ndarray):
+                height x width x 4 pixel buffer.
+            width, height (int):
+                Frame size in pixels.
+            seconds (float):
+                Worker render time.
+            token (int):
+                Render mode generation the frame was requested in.
 
-        if not time_data_rgb and not time_data_light:
+        Returns:
+            None
+        """
+        if not self or token != self.raster_token:
             return
+        buffer = np.asarray(self.canvas.get_renderer().buffer_rgba())
+        if buffer.shape != rgba.shape:
+            # Window was resized while rendering
+            self.request_redraw()
+            return
+        buffer[...] = rgba
+        self.crosshair.capture()
+        self.crosshair.draw()
+        bitmap = wx.Bitmap.FromBufferRGBA(width, height, buffer)
+        # As FigureCanvasWxAgg._create_bitmap() does, so HiDPI
+        # displays blit the physical-pixel buffer at the right size
+        bitmap.SetScaleFactor(self.canvas.GetDPIScaleFactor())
+        self.canvas.bitmap = bitmap
+        self.canvas.Refresh(eraseBackground=False)
+        self.perf.record_frame(self.prep_seconds, seconds)
+        self.record_frame(self.prep_seconds + seconds)
+
+    def setup_blit_axes(self, plot_window):
+        """
+        Style both axes once and create the persistent line artists.
+
+        The lines are animated, so a full canvas draw renders only
+        the static background (axes, grid, ticks and labels).
+        on_canvas_draw() then caches that background.
 
-        self.ax_rgb.clear()
-        self.ax_light.clear()
+        Args:
+            plot_window (float):
+                Visible window width in seconds.
 
+        Returns:
+            None
+        """
         for ax in [self.ax_rgb, self.ax_light]:
+            ax.clear()
             ax.set_facecolor('black')
             ax.tick_params(axis='x', colors='white')
             ax.tick_params(axis='y', colors='white')
+            ax.set_xlim(plot_window, 0)
+            ax.set_autoscale_on(False)
+            ax.xaxis.set_major_locator(MultipleLocator(10))
+            ax.xaxis.set_minor_locator(AutoMinorLocator(2))
+            ax.yaxis.set_minor_locator(AutoMinorLocator(2))
+            ax.grid(True, which='major', axis='both', color='gray', linestyle='--', linewidth=0.7)
+            ax.grid(True, which='minor', axis='both', color='gray', linestyle=':', linewidth=0.5)
+            ax.set_xlabel("Time (s)", color='white')
 
-        if self.zoom_fit_mode:
-            # print("Zoom fit clicked:")
-            # RGB Plot (Zoom Fit)
-            if time_data_rgb:
-                duration_rgb = time_data_rgb[-1] - time_data_rgb[0]
-                duration_rgb = max(duration_rgb, 1.0)
-                # print(f"RGB Duration: {duration_rgb}")
-                self.ax_rgb.set_xlim(duration_rgb, 0)
-                self.ax_rgb.xaxis.set_major_locator(MultipleLocator(10))
-                self.ax_rgb.xaxis.set_minor_locator(AutoMinorLocator(2))
+        self.ax_rgb.set_ylim(self.rgb_ylim)
+        self.ax_rgb.set_title("Color Intensity", color='white')
+        self.ax_rgb.set_ylabel("R : G : B", color='white')
 
-            else:
-                duration_rgb = 60
-                self.ax_rgb.set_xlim(duration_rgb, 0)
-                self.ax_rgb.set_xticks([duration_rgb, 0])
-                self.ax_rgb.set_xticklabels(["10", "0"])
-
-            if time_data_light:
-                duration_light = time_data_light[-1] - time_data_light[0]
-                # print(f"Light Duration: {duration_light}")
-                x_vals = [t - time_data_light[0] for t in time_data_light]
-                x_vals = [duration_light - x for x in x_vals]
-
-                self.ax_light.clear()
-                self.ax_light.plot(x_vals, light_data, color='yellow')
-
-                self.ax_light.set_xlim(duration_light, 0)
-                self.ax_light.set_xticks([duration_light, 0])
-                self.ax_light.set_xticklabels([f"{duration_light:.0f}", "0"])
-                self.ax_light.set_autoscale_on(False)
-                self.ax_light.set_ylim(bottom=0)
-
-                self.ax_light.set_ylabel("Lux")
-                self.ax_light.set_title("Light Intensity", color='white')
-                self.ax_light.set_facecolor("black")
+        self.ax_light.set_ylim(self.light_ylim)
+        self.ax_light.yaxis.set_major_formatter(ScalarFormatter(useMathText=False))
+        self.ax_light.ticklabel_format(style='plain', axis='y')
+        self.ax_light.yaxis.set_major_locator(MultipleLocator(500000))
+        self.ax_light.set_title("Light Intensity", color='white')
+        self.ax_light.set_ylabel("Lux", color='white')
 
-            else:
-                duration_light = 60
-                self.ax_light.set_xlim(duration_light, 0)
-                self.ax_light.set_xticks([duration_light, 0])
-                self.ax_light.set_xticklabels(["10", "0"])
-        else:
-            plot_window = 60 / self.zoom_scale
-            current_time = time_data_rgb[-1] if (time_data_rgb and self.keep_running) else time_data_rgb[min(self.slider.GetValue(), len(time_data_rgb)-1)] if time_data_rgb else 0
-            self.ax_rgb.set_xlim(plot_window, 0)
-            self.ax_rgb.set_xticks([plot_window, 0])
-            self.ax_rgb.set_xticklabels([str(int(plot_window)), "0"])
-
-            current_time_l = time_data_light[-1] if (time_data_light and self.keep_running) else time_data_light[min(self.slider.GetValue(), len(time_data_light)-1)] if time_data_light else 0
-            self.ax_light.set_xlim(plot_window, 0)
-            self.ax_light.set_xticks([plot_window, 0])
-            self.ax_light.set_xticklabels([str(int(plot_window)), "0"])
-
-        if self.red_cb.GetValue() or self.green_cb.GetValue() or self.blue_cb.GetValue():
-            if time_data_rgb:
-                if self.zoom_fit_mode:
-                    x_vals = [t - time_data_rgb[0] for t in time_data_rgb]
-                    x_vals = [x_vals[-1] - x for x in x_vals]
-                    duration = max(x_vals)
-                else:
-                    current_time = time_data_rgb[-1] if self.keep_running else time_data_rgb[min(self.slider.GetValue(), len(time_data_rgb)-1)]
-                    x_vals = [current_time - t for t in time_data_rgb]
-                    duration = plot_window
-
-                filtered_indices = [i for i, x in enumerate(x_vals) if 0 <= x <= duration]
-                x_vals_filtered = [x_vals[i] for i in filtered_indices]
-                r_vals = [r_data[i] for i in filtered_indices]
-                g_vals = [g_data[i] for i in filtered_indices]
-                b_vals = [b_data[i] for i in filtered_indices]
-
-                non_zero_indices = [i for i in range(len(r_vals)) if r_vals[i] > 0 or g_vals[i] > 0 or b_vals[i] > 0]
-                x_vals_filtered = [x_vals_filtered[i] for i in non_zero_indices]
-                r_vals = [r_vals[i] for i in non_zero_indices]
-                g_vals = [g_vals[i] for i in non_zero_indices]
-                b_vals = [b_vals[i] for i in non_zero_indices]
-                
-                # self.ax_rgb.plot(time_slice_rgb, b_slice, color='blue', label='Blue', linewidth=1.5, alpha=0.8)
-                if self.red_cb.GetValue() and r_vals:
-                    self.ax_rgb.plot(x_vals_filtered, r_vals, color='red', linewidth=1.2)
-                if self.green_cb.GetValue() and g_vals:
-                    self.ax_rgb.plot(x_vals_filtered, g_vals, color='green', linewidth=1.2)
-                if self.blue_cb.GetValue() and b_vals:
-                    self.ax_rgb.plot(x_vals_filtered, b_vals, color= 'blue', linewidth=1.2)
+        self.blit_lines = {
+            "r": self.ax_rgb.plot([], [], color='red', linewidth=1.2, animated=True)[0],
+            "g": self.ax_rgb.plot([], [], color='green', linewidth=1.2, animated=True)[0],
+            "b": self.ax_rgb.plot([], [], color='blue', linewidth=1.2, animated=True)[0],
+            "light": self.ax_light.plot([], [], color='yellow', linewidth=0.5, animated=True)[0],
+        }
 
-                self.ax_rgb.set_ylim(self.rgb_ylim)
-                self.ax_rgb.set_title("Color Intensity", color='white')
-                self.ax_rgb.set_ylabel("R : G : B", color='white')
-                self.ax_rgb.set_xlabel("Time (s)", color='white')
-
-                # Add locators to force both vertical and horizontal grid lines
-                self.ax_rgb.xaxis.set_major_locator(MultipleLocator(10))      # vertical lines
-                self.ax_rgb.xaxis.set_minor_locator(AutoMinorLocator(2))      # vertical minor
-                self.ax_rgb.yaxis.set_minor_locator(AutoMinorLocator(2))      # horizontal minor
-
-                # Grid lines: both major and minor
-                self.ax_rgb.grid(True, which='major', axis='both', color='gray', linestyle='--', linewidth=0.7)
-                self.ax_rgb.grid(True, which='minor', axis='both', color='gray', linestyle=':', linewidth=0.5)
-
-        if self.light_cb.GetValue() and time_data_light:
-            if self.zoom_fit_mode:
-                duration_light = time_data_light[-1] - time_data_light[0]
-                duration_light = max(duration_light, 1.0)
-                x_vals_all = [t - time_data_light[0] for t in time_data_light]
-                x_vals_all = [duration_light - x for x in x_vals_all]
-                plot_duration = duration_light
-            else:
-                current_time = time_data_light[-1] if self.keep_running else time_data_light[min(self.slider.GetValue(), len(time_data_light)-1)]
-                x_vals_all = [current_time - t for t in time_data_light]
-                plot_duration = plot_window
-            
-            y_vals_all = np.array(light_data, dtype=np.float32)
-            y_vals_all[y_vals_all == 0] = np.nan  # Convert 0 to NaN
+    def render_blit(self, view):
+        """
+        Update the persistent lines and blit them over the cached background.
 
-            display_indices = [i for i, x in enumerate(x_vals_all) if 0 <= x <= plot_duration]
+        The axes are only rebuilt, with one full canvas draw, when
+        the window width or the Y limits change. Otherwise each
+        refresh restores the background, draws the four lines and
+        blits the figure.
 
-            x_vals = np.array([x_vals_all[i] for i in display_indices])
-            y_vals = np.array([y_vals_all[i] for i in display_indices])
+        Args:
+            view (dict):
+                Visible data from prepare_view().
 
+        Returns:
+            None
+        """
+        plot_window = view["plot_window"]
+        key = (plot_window, tuple(self.rgb_ylim), tuple(self.light_ylim))
+        rebuild = self.blit_lines is None or key != self.blit_key
+        if rebuild:
+            self.setup_blit_axes(plot_window)
+            self.blit_key = key
+
+        visible = {
+            "r": self.red_cb.GetValue(),
+            "g": self.green_cb.GetValue(),
+            "b": self.blue_cb.GetValue(),
+            "light": self.light_cb.GetValue(),
+        }
+        for name, line in self.blit_lines.items():
+            x = view["x_light"] if name == "light" else view["x_rgb"]
+            line.set_data(x, view[name])
+            line.set_visible(visible[name])
+
+        if rebuild or self.blit_background is None:
+            # Full draw; on_canvas_draw() caches the background and
+            # draws the lines on top
+            self.canvas.draw()
+            return
+        self.canvas.restore_region(self.blit_background)
+        self.draw_blit_lines()
+        self.crosshair.capture()
+        self.crosshair.draw()
+        self.canvas.blit(self.figure.bbox)
 
-            if len(x_vals) > 0:
-                self.ax_light.plot(x_vals, y_vals, color='yellow', linewidth=0.5)
-                self.ax_light.set_ylim(self.light_ylim)
-                self.ax_light.yaxis.set_major_formatter(ScalarFormatter(useMathText=False))
-                self.ax_light.ticklabel_format(style='plain', axis='y')
-                self.ax_light.xaxis.set_major_locator(MultipleLocator(10))
-                self.ax_light.xaxis.set_minor_locator(AutoMinorLocator(2))
-                self.ax_light.yaxis.set_major_locator(MultipleLocator(500000))
-                self.ax_light.yaxis.set_minor_locator(AutoMinorLocator(2))
-                self.ax_light.grid(True, which='major', axis='both', color='gray', linestyle='--', linewidth=0.7)
-                self.ax_light.grid(True, which='minor', axis='both', color='gray', linestyle=':', linewidth=0.5)
+    def draw_blit_lines(self):
+        """
+        Draw the persistent line artists onto the canvas renderer.
 
-        self.ax_light.set_title("Light Intensity", color='white')
-        self.ax_light.set_ylabel("Lux", color='white')
-        self.ax_light.set_xlabel("Time (s)", color='white')
-        self.canvas.draw()
+        Returns:
+            None
+        """
+        for name, line in self.blit_lines.items():
+            ax = self.ax_light if name == "light" else self.ax_rgb
+            ax.draw_artist(line)
 
-        if not self.keep_running:
-            self.zoom_fit_mode = False
+    def on_canvas_draw(self, event):
+        """
+        Cache the static background after every full canvas draw.
+
+        Full draws happen on axis rebuilds, window resizes and
+        range selections. The animated lines are drawn back on
+        top so the canvas never shows an empty plot. The finished
+        frame is then kept as the crosshair background and the
+        crosshair is drawn over it.
+
+        Args:
+            event:
+                Matplotlib draw_event.
+
+        Returns:
+            None
+        """
+        if self.render_mode == RENDER_NATIVE:
+            return
+        if self.render_mode == RENDER_THREADED:
+            # A full draw shows the window's own (empty) axes;
+            # replace it with a fresh raster
+            self.request_redraw()
+            return
+        if self.render_mode == RENDER_BLIT and self.blit_lines is not None:
+            self.blit_background = self.canvas.copy_from_bbox(self.figure.bbox)
+            self.draw_blit_lines()
+        self.crosshair.capture()
+        self.crosshair.draw()
 
     def filter_rgb_nonzero(x_vals, r_data, g_data, b_data, indices):
         """
@@ -1176,8 +2311,8 @@ class StreamPlotFrame(wx.Frame):
 
         Functional Behavior:
             • Receives the selected X-axis range.
-            • Updates the RGB plot view limits.
-            • Redraws the canvas to reflect the zoomed region.
+            • Makes it the view window (also while streaming).
+            • Shows statistics for the selected time range.
 
         Args:
             xmin (float):
@@ -1189,9 +2324,8 @@ class StreamPlotFrame(wx.Frame):
         Returns:
             None
         """
-        # pass
-        self.ax_rgb.set_xlim(xmin, xmax)
-        self.canvas.draw()
+        self.show_range_stats(xmin, xmax)
+        self.zoom_to_range(xmin, xmax)
 
     def on_light_range_select(self, xmin, xmax):
         """
@@ -1202,8 +2336,8 @@ class StreamPlotFrame(wx.Frame):
 
         Functional Behavior:
             • Receives the selected X-axis range.
-            • Updates the Light plot view limits.
-            • Redraws the canvas to reflect the zoomed region.
+            • Makes it the view window (also while streaming).
+            • Shows statistics for the selected time range.
 
         Args:
             xmin (float):
@@ -1215,10 +2349,147 @@ class StreamPlotFrame(wx.Frame):
         Returns:
             None
         """
-        # pass
-        self.ax_light.set_xlim(xmin, xmax)
-        self.canvas.draw()
+        self.show_range_stats(xmin, xmax)
+        self.zoom_to_range(xmin, xmax)
+
+    def zoom_to_range(self, xmin, xmax):
+        """
+        Make a selected range the new view window.
+
+        Only pan_offset and zoom_scale change, so this works the
+        same while streaming: the selected span keeps its offset
+        from the newest sample as data arrives.
+
+        Args:
+            xmin, xmax (float):
+                Selected range in seconds before the right edge of
+                the last drawn view.
+
+        Returns:
+            None
+        """
+        if self.last_view is None or xmax - xmin <= 0:
+            return
+        self.zoom_fit_mode = False
+        self.pan_offset += xmin
+        self.zoom_scale = 60 / (xmax - xmin)
+        self.request_redraw()
+
+    def show_range_stats(self, xmin, xmax):
+        """
+        Show per-channel statistics for a selected plot range.
+
+        The statistics come from StreamStore.range_stats(), which
+        answers in O(log n) from the summary pyramid however many
+        samples the range covers.
+
+        Args:
+            xmin, xmax (float):
+                Selected range in seconds before the right edge of
+                the last drawn view.
+
+        Returns:
+            None
+        """
+        if self.last_view is None or xmax <= xmin:
+            self.stats_text.SetLabel("")
+            return
+        current_time, _ = self.last_view
+        stats = self.store.range_stats(current_time - xmax, current_time - xmin)
+        if stats is None:
+            self.stats_text.SetLabel("Selection: no samples")
+            return
+        parts = []
+        for ch, name in (("r", "R"), ("g", "G"), ("b", "B"), ("light", "Light")):
+            st = stats[ch]
+            if st["count"]:
+                parts.append(f"{name}: n={st['count']} mean={st['mean']:.1f} "
+                             f"min={st['min']:.0f} max={st['max']:.0f} sd={st['std']:.1f}")
+            else:
+                parts.append(f"{name}: n=0")
+        self.stats_text.SetLabel(
+            f"Selection {stats['duration']:.3f} s | " + " | ".join(parts[:3]) + "\n"
+            + parts[3] + f" | ∫ {stats['light_integral']:.4g} lux·s")
+        self.Layout()
     
+    def on_export_figure(self, event):
+        """
+        Export the current view or a time range as an image.
+
+        Functional Behavior:
+            • Asks for the range (current view, whole capture or
+              From/To seconds) and the DPI.
+            • Asks for a PNG, SVG or PDF file name.
+            • Selects and decimates the range to the export
+              resolution and renders it into a separate Figure on
+              a FigureExportJob worker thread; the window keeps
+              updating meanwhile.
+            • Reports the result in the stats line when done.
+
+        Args:
+            event:
+                wxPython button click event object.
+
+        Returns:
+            None
+        """
+        snap = self.store.snapshot()
+        t = snap["t"]
+        if not len(t):
+            wx.MessageBox("No data to export!", "Warning", wx.OK | wx.ICON_WARNING)
+            return
+        current_time, plot_window = self.drawn_window(t)
+        view_range = (max(t[0], current_time - plot_window), current_time)
+        with ExportDialog(self, view_range, (t[0], t[-1])) as dlg:
+            if dlg.ShowModal() != wx.ID_OK:
+                return
+            t0, t1, dpi = dlg.get_settings()
+
+        formats = list(EXPORT_FORMATS)
+        with wx.FileDialog(self, "Export Figure", wildcard="|".join(EXPORT_FORMATS.values()),
+                           style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT) as fileDialog:
+            if fileDialog.ShowModal() == wx.ID_CANCEL:
+                return
+            path = fileDialog.GetPath()
+            ext = formats[fileDialog.GetFilterIndex()]
+        if os.path.splitext(path)[1].lower().lstrip(".") not in EXPORT_FORMATS:
+            path = f"{path}.{ext}"
+
+        width = export_pixel_width(dpi)
+        rate, mode = self.resample_settings()
+        options = self.render_options()
+        options["zoom_fit"] = False
+        job = FigureExportJob(
+            lambda: self.compute_view(snap, t1, t1 - t0, width, rate, mode),
+            options, path, dpi,
+            lambda *args: wx.CallAfter(self.on_export_done, *args),
+            PLOT_SUBPLOTS)
+        self.stats_text.SetLabel(f"Exporting {os.path.basename(path)}...")
+        job.start()
+
+    def on_export_done(self, path, error, seconds):
+        """
+        Report a finished figure export.
+
+        Args:
+            path (str):
+                Output file path.
+            error (Exception | None):
+                Failure, or None on success.
+            seconds (float):
+                Time the export took.
+
+        Returns:
+            None
+        """
+        if not self:
+            return
+        if error is not None:
+            self.stats_text.SetLabel("")
+            wx.MessageBox(f"Could not export figure:\n{error}", "Error", wx.OK | wx.ICON_ERROR)
+            return
+        self.stats_text.SetLabel(f"Exported {os.path.basename(path)} in {seconds:.1f} s")
+
     def on_save_csv(self, event):
         """
         Save streamed sensor data to a file.
@@ -1233,8 +2504,15 @@ class StreamPlotFrame(wx.Frame):
             • Supports:
                 - CSV (*.csv)
                 - Excel (*.xlsx)
-            • Writes Light and RGB values to the file.
+            • Writes Time, Light and RGB values to the file; the
+              Time column lets saved sessions be reloaded in the
+              session comparison view.
             • Replaces zero-only RGB values with 'null'.
+            • When a resample rate is set, writes Time, Light and
+              RGB on the uniform grid instead, with 'null' for
+              grid points that have no data.
+            • Writes channel histograms to a "Histogram" sheet
+              (XLSX) or a companion *_histogram.csv file (CSV).
             • Displays success or error status to the user.
 
         Args:
@@ -1244,16 +2522,29 @@ class StreamPlotFrame(wx.Frame):
         Returns:
             None
         """
-        with self.data_lock:
-            r_data = self.r_data[:]
-            g_data = self.g_data[:]
-            b_data = self.b_data[:]
-            light_data = self.light_data[:]
+        snap = self.store.snapshot()
+        t_data = snap["t"].tolist()
+        r_data = snap["r"].tolist()
+        g_data = snap["g"].tolist()
+        b_data = snap["b"].tolist()
+        light_data = snap["light"].tolist()
+        hist_rows = self.histograms.export_rows()
 
         if not (r_data or g_data or b_data or light_data):
             wx.MessageBox("No data to save!", "Warning", wx.OK | wx.ICON_WARNING)
             return
 
+        resampled_rows = None
+        rate, mode = self.resample_settings()
+        if rate:
+            try:
+                view = self.store.resampled(rate, mode)
+            except ValueError as e:
+                wx.MessageBox(f"Cannot resample data:\n{e}", "Error", wx.OK | wx.ICON_ERROR)
+                return
+            table = np.column_stack([view["t"], view["light"], view["r"], view["g"], view["b"]])
+            resampled_rows = [[v if v == v else 'null' for v in row] for row in table.tolist()]
+
         with wx.FileDialog(
             self,
             "Save Data",
@@ -1272,31 +2563,52 @@ class StreamPlotFrame(wx.Frame):
                         path += ".csv"
                     with open(path, 'w', newline='') as csvfile:
                         writer = csv.writer(csvfile)
-                        writer.writerow(['Light', 'R', 'G', 'B'])
-                        for light, r, g, b in zip(light_data, r_data, g_data, b_data):
-                            if r == 0 and g == 0 and b == 0 and light == 0:
-                                writer.writerow([light, 'null', 'null', 'null'])
-                            else:
-                                writer.writerow([light, r, g, b])
+                        if resampled_rows is not None:
+                            writer.writerow(RESAMPLED_EXPORT_HEADERS)
+                            writer.writerows(resampled_rows)
+                        else:
+                            writer.writerow(RAW_EXPORT_HEADERS)
+                            for t, light, r, g, b in zip(t_data, light_data, r_data, g_data, b_data):
+                                if r == 0 and g == 0 and b == 0 and light == 0:
+                                    writer.writerow([t, light, 'null', 'null', 'null'])
+                                else:
+                                    writer.writerow([t, light, r, g, b])
+                    hist_path = os.path.splitext(path)[0] + "_histogram.csv"
+                    with open(hist_path, 'w', newline='') as csvfile:
+                        writer = csv.writer(csvfile)
+                        writer.writerow(HIST_EXPORT_HEADERS)
+                        writer.writerows(hist_rows)
                 else:
                     if not path.endswith(".xlsx"):
                         path += ".xlsx"
                     workbook = xlsxwriter.Workbook(path)
                     worksheet = workbook.add_worksheet("Sensor Data")
-                    headers = ['Light', 'R', 'G', 'B']
+                    headers = RESAMPLED_EXPORT_HEADERS if resampled_rows is not None else RAW_EXPORT_HEADERS
                     for col, header in enumerate(headers):
                         worksheet.write(0, col, header)
-                    for row, (light, r, g, b) in enumerate(zip(light_data, r_data, g_data, b_data), start=1):
-                        if r == 0 and g == 0 and b == 0:
-                            worksheet.write(row, 0, light)
-                            worksheet.write(row, 1, 'null')
-                            worksheet.write(row, 2, 'null')
-                            worksheet.write(row, 3, 'null')
-                        else:
-                            worksheet.write(row, 0, light)
-                            worksheet.write(row, 1, r)
-                            worksheet.write(row, 2, g)
-                            worksheet.write(row, 3, b)
+                    if resampled_rows is not None:
+                        for row, values in enumerate(resampled_rows, start=1):
+                            for col, value in enumerate(values):
+                                worksheet.write(row, col, value)
+                    else:
+                        for row, (t, light, r, g, b) in enumerate(zip(t_data, light_data, r_data, g_data, b_data), start=1):
+                            worksheet.write(row, 0, t)
+                            if r == 0 and g == 0 and b == 0:
+                                worksheet.write(row, 1, light)
+                                worksheet.write(row, 2, 'null')
+                                worksheet.write(row, 3, 'null')
+                                worksheet.write(row, 4, 'null')
+                            else:
+                                worksheet.write(row, 1, light)
+                                worksheet.write(row, 2, r)
+                                worksheet.write(row, 3, g)
+                                worksheet.write(row, 4, b)
+                    hist_sheet = workbook.add_worksheet("Histogram")
+                    for col, header in enumerate(HIST_EXPORT_HEADERS):
+                        hist_sheet.write(0, col, header)
+                    for row, values in enumerate(hist_rows, start=1):
+                        for col, value in enumerate(values):
+                            hist_sheet.write(row, col, value)
                     workbook.close()
 
                 wx.MessageBox(f"Data saved to {os.path.basename(path)}", "Success", wx.OK | wx.ICON_INFORMATION)
@@ -0,0 +1,506 @@
+##############################################################################
+#
+# Module: streamstore.py
+#
+# Description:
+#     Column store for streamed RGB and Light samples. Keeps the
+#     timestamp and channel data in contiguous NumPy arrays so the
+#     plot, export and memory accounting code can work on whole
+#     columns instead of Python lists.
+#
+# Author:
+#     Vinay N, MCCI Corporation October 2026
+#
+# Revision history:
+#     V2.2.0 Mon Oct 2026 19:10:2026   Vinay N
+#       Module created
+#
+##############################################################################
+# Built-in imports
+import os
+import csv
+import queue
+import threading
+
+# Third-party imports
+import numpy as np
+
+# Local application imports
+from memgovernor import POLICY_DECIMATE, POLICY_SPILL
+from resample import resample_columns, RESAMPLE_LINEAR
+from pyramid import SummaryPyramid, sample_rows
+
+#======================================================================
+# COMPONENTS
+#======================================================================
+
+STREAM_MAXLEN = 1000000
+STREAM_MIN_CAPACITY = 4096
+STREAM_SHRINK_HEADROOM = 1.5
+
+STREAM_COLUMNS = (
+    ("t", np.float64),
+    ("r", np.int32),
+    ("g", np.int32),
+    ("b", np.int32),
+    ("light", np.int32),
+    # A Light reading of 0 is a real (dark) sample; this flag tells
+    # it apart from lines that carried no Light value
+    ("has_light", np.bool_),
+)
+STREAM_SPILL_HEADERS = ['Time', 'Light', 'R', 'G', 'B']
+
+# Samples checked on each side of a lookup for a valid RGB reading
+STREAM_NEAREST_SCAN = 64
+# Samples searched backwards for the previous Light reading when
+# integrating from the middle of the capture
+STREAM_LIGHT_LOOKBACK = 256
+
+
+class SpillWriter:
+    """
+    Write spilled samples to CSV files on a worker thread.
+
+    Writes and deletions go through one queue, so they happen in
+    the order they were requested: a file discarded on reset is
+    never recreated by a write that was still pending. The first
+    write to a file after it was discarded (or since the writer
+    was created) starts it afresh, so old runs never leak in.
+    """
+    def __init__(self):
+        self.queue = queue.Queue()
+        self.written = set()
+        self.thread = None
+        self.lock = threading.Lock()
+
+    def _put(self, item):
+        """
+        Queue one job, starting the worker on first use.
+
+        Returns:
+            None
+        """
+        with self.lock:
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, daemon=True)
+                self.thread.start()
+        self.queue.put(item)
+
+    def write(self, rows, path):
+        """
+        Append rows to a spill file.
+
+        Args:
+            rows (dict):
+                "t", "light", "r", "g", "b" arrays. They must not
+                be modified after the call.
+            path (str):
+                Destination CSV file.
+
+        Returns:
+            None
+        """
+        self._put((path, rows))
+
+    def discard(self, path):
+        """
+        Delete a spill file once earlier writes have finished.
+
+        Args:
+            path (str):
+                Spill file to remove.
+
+        Returns:
+            None
+        """
+        self._put((path, None))
+
+    def wait(self):
+        """
+        Block until every queued job has finished.
+
+        Returns:
+            None
+        """
+        self.queue.join()
+
+    def _run(self):
+        """
+        Worker loop: perform queued writes and deletions.
+
+        Returns:
+            None
+        """
+        while True:
+            path, rows = self.queue.get()
+            try:
+                if rows is None:
+                    self.written.discard(path)
+                    if os.path.exists(path):
+                        os.remove(path)
+                else:
+                    self._write(rows, path)
+            except OSError as exc:
+                print(f"[Spill] {path}: {exc}")
+            finally:
+                self.queue.task_done()
+
+    def _write(self, rows, path):
+        """
+        Write one block of rows.
+
+        Returns:
+            None
+        """
+        fresh = path not in self.written
+        with open(path, 'w' if fresh else 'a', newline='') as csvfile:
+            writer = csv.writer(csvfile)
+            if fresh:
+                writer.writerow(STREAM_SPILL_HEADERS)
+            writer.writerows(zip(rows["t"].tolist(), rows["light"].tolist(),
+                                 rows["r"].tolist(), rows["g"].tolist(),
+                                 rows["b"].tolist()))
+        self.written.add(path)
+
+
+class StreamStore:
+    """
+    Append-only column store with bounded retention.
+
+    Samples live in preallocated arrays between a start and an end
+    offset. Appends write past the end, and retention moves the
+    start forward. When the arrays run out of room the retained
+    samples are copied into freshly allocated arrays instead of
+    being shifted in place. Views handed out by snapshot() therefore
+    stay valid and unchanged without copying, even while the reader
+    thread keeps appending.
+
+    A SummaryPyramid of min/max/mean blocks is maintained alongside
+    the samples so wide windows can be drawn without touching every
+    sample.
+
+    Args:
+        maxlen (int):
+            Maximum number of samples retained. Older samples
+            are dropped as new ones arrive.
+    """
+    def __init__(self, maxlen=STREAM_MAXLEN):
+        self.lock = threading.Lock()
+        self.maxlen = maxlen
+        self.row_bytes = sum(np.dtype(dtype).itemsize for _, dtype in STREAM_COLUMNS)
+        self._alloc(STREAM_MIN_CAPACITY)
+        self.pyramid = SummaryPyramid()
+        self.total = 0
+        self.dropped = 0
+        self.version = 0
+        self.spill = SpillWriter()
+        self.spill_path = None
+
+    def _alloc(self, capacity, keep=None):
+        """
+        Allocate new column arrays, optionally copying samples in.
+
+        Args:
+            capacity (int):
+                Number of rows to allocate.
+            keep (dict | None):
+                Column name -> array of rows to place at the start.
+
+        Returns:
+            None
+        """
+        cols = {}
+        count = 0
+        for name, dtype in STREAM_COLUMNS:
+            cols[name] = np.empty(capacity, dtype=dtype)
+            if keep is not None:
+                count = len(keep[name])
+                cols[name][:count] = keep[name]
+        self._cols = cols
+        self._capacity = capacity
+        self._start = 0
+        self._end = count
+
+    def _views(self):
+        """
+        Slice the retained rows out of every column.
+
+        Returns:
+            dict:
+                Column name -> array view.
+        """
+        return {name: col[self._start:self._end] for name, col in self._cols.items()}
+
+    def __len__(self):
+        return self._end - self._start
+
+    def append(self, t, r, g, b, light, has_light=None):
+        """
+        Append one batch of samples.
+
+        Args:
+            t, r, g, b, light (array-like):
+                Equal-length columns for the new samples.
+            has_light (array-like | None):
+                Which samples carry a Light reading; defaults to
+                the nonzero Light values.
+
+        Returns:
+            None
+        """
+        if has_light is None:
+            has_light = np.asarray(light) != 0
+        batch = {"t": t, "r": r, "g": g, "b": b, "light": light, "has_light": has_light}
+        n = len(t)
+        if n == 0:
+            return
+        with self.lock:
+            if self._end + n > self._capacity:
+                capacity = max(STREAM_MIN_CAPACITY, 2 * (len(self) + n))
+                capacity = min(capacity, 2 * self.maxlen + n)
+                self._alloc(capacity, keep=self._views())
+            for name, col in self._cols.items():
+                col[self._end:self._end + n] = batch[name]
+            self.pyramid.append(self.total, {name: col[self._end:self._end + n]
+                                             for name, col in self._cols.items()})
+            self._end += n
+            self.total += n
+            excess = len(self) - self.maxlen
+            if excess > 0:
+                self._start += excess
+                self.dropped += excess
+                self.pyramid.trim(self.total - len(self))
+            self.version += 1
+
+    def snapshot(self):
+        """
+        Return zero-copy views of the retained samples.
+
+        Returns:
+            dict:
+                Column name ("t", "r", "g", "b", "light",
+                "has_light") -> array.
+        """
+        with self.lock:
+            return self._views()
+
+    def nearest(self, time, require_rgb=False, t_lo=None, t_hi=None):
+        """
+        Find the sample closest to a time with a binary search.
+
+        Only a snapshot is taken under the lock; the search itself
+        runs on the views, so the reader thread is never held up.
+
+        Args:
+            time (float):
+                Target time in seconds.
+            require_rgb (bool):
+                Skip samples whose R, G and B are all zero. At most
+                STREAM_NEAREST_SCAN neighbours on each side are
+                checked.
+            t_lo, t_hi (float | None):
+                Optional time range the sample must lie in.
+
+        Returns:
+            dict | None:
+                Column name -> value of the nearest sample.
+        """
+        cols = self.snapshot()
+        t = cols["t"]
+        lo = 0 if t_lo is None else int(np.searchsorted(t, t_lo, side="left"))
+        hi = len(t) if t_hi is None else int(np.searchsorted(t, t_hi, side="right"))
+        if lo >= hi:
+            return None
+        i = int(np.clip(np.searchsorted(t, time), lo, hi - 1))
+        if i > lo and time - t[i - 1] <= t[i] - time:
+            i -= 1
+        if require_rgb:
+            best = None
+            for step in range(STREAM_NEAREST_SCAN + 1):
+                for j in (i - step, i + step):
+                    if lo <= j < hi and (cols["r"][j] or cols["g"][j] or cols["b"][j]):
+                        if best is None or abs(t[j] - time) < abs(t[best] - time):
+                            best = j
+                if best is not None:
+                    break
+            if best is None:
+                return None
+            i = best
+        return {name: col[i] for name, col in cols.items()}
+
+    def summary(self, t_lo, t_hi, width):
+        """
+        Min/max/mean summaries of the samples in [t_lo, t_hi].
+
+        Args:
+            t_lo, t_hi (float):
+                Time range in seconds.
+            width (int):
+                Target number of blocks, normally the plot width
+                in pixels.
+
+        Returns:
+            dict | None:
+                See SummaryPyramid.query(). None when the range is
+                short enough to draw from the raw samples.
+        """
+        with self.lock:
+            t = self._cols["t"][self._start:self._end]
+            lo = int(np.searchsorted(t, t_lo, side="left"))
+            hi = int(np.searchsorted(t, t_hi, side="right"))
+            base = self.total - len(self)
+            return self.pyramid.query(base + lo, base + hi, width)
+
+    def range_stats(self, t_lo, t_hi):
+        """
+        Count, mean, min, max, standard deviation and Light integral
+        for the samples in [t_lo, t_hi].
+
+        Served from the summary pyramid: the window is found by
+        binary search and covered by O(log n) precomputed blocks
+        plus fewer than two blocks of raw samples at the edges.
+
+        Args:
+            t_lo, t_hi (float):
+                Time range in seconds.
+
+        Returns:
+            dict | None:
+                See pyramid.block_stats(), plus "t0", "t1" (the
+                range) and "duration" in seconds. None if no
+                sample lies in the range.
+        """
+        with self.lock:
+            views = self._views()
+            t = views["t"]
+            lo = int(np.searchsorted(t, t_lo, side="left"))
+            hi = int(np.searchsorted(t, t_hi, side="right"))
+            base = self.total - len(self)
+
+            def fetch(a, b):
+                a, b = a - base, b - base
+                back = max(0, a - STREAM_LIGHT_LOOKBACK)
+                prev = np.flatnonzero(views["has_light"][back:a])
+                prev_t = t[back + prev[-1]] if len(prev) else None
+                return sample_rows({name: col[a:b] for name, col in views.items()}, prev_t)
+
+            stats = self.pyramid.range_stats(base + lo, base + hi, fetch)
+        if stats is None:
+            return None
+        stats["t0"], stats["t1"] = float(t[lo]), float(t[hi - 1])
+        stats["duration"] = stats["t1"] - stats["t0"]
+        return stats
+
+    def resampled(self, rate, mode=RESAMPLE_LINEAR, t0=None, t1=None):
+        """
+        Resample the retained samples onto a uniform time grid.
+
+        Args:
+            rate (float):
+                Output samples per second.
+            mode (str):
+                One of resample.RESAMPLE_MODES.
+            t0, t1 (float | None):
+                Grid range; defaults to the retained time span.
+
+        Returns:
+            dict:
+                "t" grid plus float64 channel arrays.
+        """
+        return resample_columns(self.snapshot(), rate, mode, t0, t1)
+
+    def reset(self):
+        """
+        Discard all samples, spilled ones included, and release the
+        column memory.
+
+        Returns:
+            None
+        """
+        with self.lock:
+            self._alloc(STREAM_MIN_CAPACITY)
+            self.pyramid.reset()
+            self.total = 0
+            self.dropped = 0
+            self.version += 1
+        self.discard_spill()
+
+    def discard_spill(self):
+        """
+        Delete the spill file, if any samples were spilled.
+
+        Returns:
+            None
+        """
+        if self.spill_path:
+            self.spill.discard(self.spill_path)
+            self.spill_path = None
+
+    def nbytes(self):
+        """
+        Bytes currently allocated for the column arrays.
+
+        Returns:
+            int
+        """
+        return self._capacity * self.row_bytes
+
+    def release(self, nbytes, policy, spill_path=None):
+        """
+        Free roughly nbytes of sample memory.
+
+        Called by the memory governor when the application is
+        over its budget. Spilled rows are handed to the
+        SpillWriter after the lock is released, so neither the GUI
+        nor the reader thread waits for the file to be written.
+
+        Args:
+            nbytes (int):
+                Bytes the governor wants released.
+            policy (str):
+                POLICY_DROP_OLDEST, POLICY_DECIMATE or POLICY_SPILL.
+            spill_path (str | None):
+                CSV file that spilled samples are appended to.
+
+        Returns:
+            int:
+                Bytes actually released.
+        """
+        spilled = None
+        with self.lock:
+            before = self.nbytes()
+            count = len(self)
+            if count == 0:
+                return 0
+            # Rows that fit the requested size once reallocated with
+            # STREAM_SHRINK_HEADROOM spare capacity
+            fit = int(max(0, before - nbytes) // self.row_bytes / STREAM_SHRINK_HEADROOM)
+            rows = max(0, count - fit)
+            if rows == 0:
+                return 0
+            if policy == POLICY_DECIMATE:
+                step = max(2, -(-count // max(fit, 1)))
+                keep = {name: col[::step] for name, col in self._views().items()}
+                self.dropped += count - len(keep["t"])
+            else:
+                if policy == POLICY_SPILL and spill_path:
+                    # _alloc() below replaces the arrays, so these
+                    # slices of the old ones are never written again
+                    views = self._views()
+                    spilled = {name: views[name][:rows] for name in ("t", "light", "r", "g", "b")}
+                    self.spill_path = spill_path
+                self._start += rows
+                self.dropped += rows
+                keep = self._views()
+            retained = len(keep["t"])
+            self._alloc(max(STREAM_MIN_CAPACITY, int(retained * STREAM_SHRINK_HEADROOM)), keep=keep)
+            if policy == POLICY_DECIMATE:
+                # Sample positions changed; summaries must be rebuilt
+                self.pyramid.rebuild(self.total - retained, self._views())
+            else:
+                self.pyramid.trim(self.total - retained)
+            self.version += 1
+            released = max(0, before - self.nbytes())
+        if spilled is not None:
+            self.spill.write(spilled, spill_path)
+        return released
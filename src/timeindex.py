@@ -0,0 +1,139 @@
+##############################################################################
+#
+# Module: timeindex.py
+#
+# Description:
+#     Time-based navigation for long captures: binary-search lookup of
+#     sample positions by time and a sorted bookmark list.
+#
+# Author:
+#     Vinay N, MCCI Corporation October 2026
+#
+# Revision history:
+#     V2.2.0 Mon Oct 2026 19:10:2026   Vinay N
+#       Module created
+#
+##############################################################################
+# Built-in imports
+import bisect
+
+# Third-party imports
+import numpy as np
+
+#======================================================================
+# COMPONENTS
+#======================================================================
+
+# Bookmarks closer than this to an existing one are treated as the
+# same bookmark
+BOOKMARK_TOLERANCE = 1e-6
+
+
+def index_at(t, time):
+    """
+    Find the last sample at or before a time.
+
+    Args:
+        t (numpy.ndarray):
+            Non-empty, non-decreasing sample time column.
+        time (float):
+            Time to look up.
+
+    Returns:
+        int:
+            Sample index, clamped to the column, found by binary
+            search in O(log n).
+    """
+    index = int(np.searchsorted(t, time, side="right")) - 1
+    return min(max(index, 0), len(t) - 1)
+
+
+class TimeBookmarks:
+    """
+    Named capture times kept in time order.
+
+    Times and labels are parallel lists sorted by time, so the
+    bookmark before or after any time is found with bisect and
+    never by scanning the list.
+    """
+    def __init__(self):
+        self.times = []
+        self.labels = []
+
+    def __len__(self):
+        return len(self.times)
+
+    def add(self, time, label=None):
+        """
+        Insert a bookmark, keeping the lists sorted.
+
+        Args:
+            time (float):
+                Capture time in seconds.
+            label (str | None):
+                Display name; defaults to the time.
+
+        Returns:
+            int:
+                Position of the bookmark. An existing bookmark at
+                the same time is returned instead of a duplicate.
+        """
+        pos = bisect.bisect_left(self.times, time)
+        for near in (pos - 1, pos):
+            if 0 <= near < len(self.times) and abs(self.times[near] - time) <= BOOKMARK_TOLERANCE:
+                return near
+        self.times.insert(pos, time)
+        self.labels.insert(pos, label or f"{time:.2f} s")
+        return pos
+
+    def remove(self, pos):
+        """
+        Delete the bookmark at a position.
+
+        Args:
+            pos (int):
+                Index into the sorted bookmarks.
+
+        Returns:
+            None
+        """
+        del self.times[pos]
+        del self.labels[pos]
+
+    def clear(self):
+        """
+        Delete all bookmarks.
+
+        Returns:
+            None
+        """
+        self.times.clear()
+        self.labels.clear()
+
+    def before(self, time):
+        """
+        Position of the last bookmark earlier than a time.
+
+        Args:
+            time (float):
+                Reference time.
+
+        Returns:
+            int | None
+        """
+        pos = bisect.bisect_left(self.times, time - BOOKMARK_TOLERANCE) - 1
+        return pos if pos >= 0 else None
+
+    def after(self, time):
+        """
+        Position of the first bookmark later than a time.
+
+        Args:
+            time (float):
+                Reference time.
+
+        Returns:
+            int | None
+        """
+        pos = bisect.bisect_right(self.times, time + BOOKMARK_TOLERANCE)
+        return pos if pos < len(self.times) else None
@@ -0,0 +1,419 @@
+##############################################################################
+#
+# Module: trigger.py
+#
+# Description:
+#     Triggered acquisition for the stream hub. Evaluates level, edge
+#     and delta triggers over each parsed batch and keeps only the
+#     samples around trigger events, using a bounded pre-trigger ring
+#     for the seconds before each event.
+#
+# Author:
+#     Vinay N, MCCI Corporation October 2026
+#
+# Revision history:
+#     V2.2.0 Mon Oct 2026 19:10:2026   Vinay N
+#       Module created
+#
+##############################################################################
+# Built-in imports
+import threading
+from collections import deque
+
+# Third-party imports
+import wx
+import numpy as np
+
+# Local application imports
+from uiGlobal import *
+
+#======================================================================
+# COMPONENTS
+#======================================================================
+
+TRIGGER_LEVEL = "level"
+TRIGGER_EDGE = "edge"
+TRIGGER_DELTA = "delta"
+TRIGGER_KINDS = (TRIGGER_LEVEL, TRIGGER_EDGE, TRIGGER_DELTA)
+
+TRIGGER_RISING = "rising"
+TRIGGER_FALLING = "falling"
+TRIGGER_EITHER = "either"
+TRIGGER_DIRECTIONS = (TRIGGER_RISING, TRIGGER_FALLING, TRIGGER_EITHER)
+
+# "rgb" fires when any of the three color channels meets the condition
+TRIGGER_CHANNELS = ("light", "r", "g", "b", "rgb")
+TRIGGER_CHANNEL_LABELS = ("Light", "Red", "Green", "Blue", "Any RGB")
+
+PRETRIGGER_MAXLEN = 200000
+TRIGGER_EVENT_MAXLEN = 1000
+
+
+class Trigger:
+    """
+    One trigger condition on a stream channel.
+
+    Kinds:
+        • level → value is above (rising) / below (falling) threshold
+        • edge  → value crosses threshold between two samples
+        • delta → value changes by at least threshold between
+                  two consecutive samples
+
+    Args:
+        kind (str):
+            TRIGGER_LEVEL, TRIGGER_EDGE or TRIGGER_DELTA.
+        channel (str):
+            One of TRIGGER_CHANNELS.
+        threshold (float):
+            Level for level/edge triggers, step size for delta.
+        direction (str):
+            TRIGGER_RISING, TRIGGER_FALLING or TRIGGER_EITHER.
+    """
+    def __init__(self, kind, channel, threshold, direction=TRIGGER_RISING):
+        if kind not in TRIGGER_KINDS:
+            raise ValueError(f"Unknown trigger kind: {kind}")
+        if channel not in TRIGGER_CHANNELS:
+            raise ValueError(f"Unknown trigger channel: {channel}")
+        self.kind = kind
+        self.channel = channel
+        self.threshold = float(threshold)
+        self.direction = direction
+
+    def describe(self):
+        """
+        Short human readable description.
+
+        Returns:
+            str
+        """
+        label = TRIGGER_CHANNEL_LABELS[TRIGGER_CHANNELS.index(self.channel)]
+        return f"{label} {self.kind} {self.direction} {self.threshold:g}"
+
+    def evaluate(self, values, prev):
+        """
+        Find the samples of one channel that fire this trigger.
+
+        Args:
+            values (numpy.ndarray):
+                Valid samples of the channel in this batch.
+            prev (float | None):
+                Last valid sample from the previous batch.
+
+        Returns:
+            numpy.ndarray:
+                Boolean mask over values.
+        """
+        v = values.astype(np.float64)
+        if self.kind == TRIGGER_LEVEL:
+            if self.direction == TRIGGER_RISING:
+                return v > self.threshold
+            if self.direction == TRIGGER_FALLING:
+                return v < self.threshold
+            return v != self.threshold
+
+        before = np.empty_like(v)
+        before[1:] = v[:-1]
+        before[:1] = v[:1] if prev is None else prev
+        rising = falling = np.zeros(v.shape, dtype=bool)
+        if self.kind == TRIGGER_EDGE:
+            if self.direction != TRIGGER_FALLING:
+                rising = (before <= self.threshold) & (v > self.threshold)
+            if self.direction != TRIGGER_RISING:
+                falling = (before >= self.threshold) & (v < self.threshold)
+        else:
+            step = v - before
+            if self.direction != TRIGGER_FALLING:
+                rising = step >= self.threshold
+            if self.direction != TRIGGER_RISING:
+                falling = -step >= self.threshold
+        return rising | falling
+
+
+class PreTriggerRing:
+    """
+    Fixed-size ring of recent samples that were not retained.
+
+    Args:
+        capacity (int):
+            Maximum number of rows held.
+    """
+    COLUMNS = ("t", "r", "g", "b", "light", "has_light")
+    # Columns that are not int32 sample values
+    DTYPES = {"t": np.float64, "has_light": np.bool_}
+
+    def __init__(self, capacity=PRETRIGGER_MAXLEN):
+        self.capacity = capacity
+        self.cols = {name: np.empty(capacity, dtype=self.DTYPES.get(name, np.int32))
+                     for name in self.COLUMNS}
+        self.write = 0
+        self.count = 0
+
+    def append(self, rows):
+        """
+        Add rows, overwriting the oldest ones when full.
+
+        Args:
+            rows (dict):
+                Column name -> array, equal lengths.
+
+        Returns:
+            None
+        """
+        n = len(rows["t"])
+        if n == 0:
+            return
+        if n > self.capacity:
+            rows = {name: col[-self.capacity:] for name, col in rows.items()}
+            n = self.capacity
+        idx = (self.write + np.arange(n)) % self.capacity
+        for name in self.COLUMNS:
+            self.cols[name][idx] = rows[name]
+        self.write = (self.write + n) % self.capacity
+        self.count = min(self.capacity, self.count + n)
+
+    def since(self, t0):
+        """
+        Return rows with t >= t0 in time order.
+
+        Args:
+            t0 (float):
+                Earliest timestamp to return.
+
+        Returns:
+            dict:
+                Column name -> array.
+        """
+        order = (self.write - self.count + np.arange(self.count)) % self.capacity
+        t = self.cols["t"][order]
+        first = np.searchsorted(t, t0, side="left")
+        order = order[first:]
+        return {name: self.cols[name][order] for name in self.COLUMNS}
+
+    def clear(self):
+        """
+        Drop all rows.
+
+        Returns:
+            None
+        """
+        self.write = 0
+        self.count = 0
+
+
+class TriggerEngine:
+    """
+    Decide which samples of each batch are retained.
+
+    When armed, every batch is evaluated against all triggers with
+    vectorized comparisons. Samples within pre_seconds before or
+    post_seconds after any firing sample are kept; everything else
+    goes into the pre-trigger ring. When a trigger fires, the ring
+    supplies the samples that arrived before the event.
+
+    Args:
+        pre_seconds (float):
+            Seconds retained before each trigger.
+        post_seconds (float):
+            Seconds retained after each trigger.
+    """
+    def __init__(self, pre_seconds=5.0, post_seconds=5.0):
+        self.lock = threading.Lock()
+        self.triggers = []
+        self.armed = False
+        self.pre_seconds = pre_seconds
+        self.post_seconds = post_seconds
+        self.ring = PreTriggerRing()
+        self.events = deque(maxlen=TRIGGER_EVENT_MAXLEN)
+        self.fired = 0
+        self._record_until = -np.inf
+        self._last = {}
+
+    def configure(self, triggers, pre_seconds, post_seconds, armed):
+        """
+        Replace the trigger set and retention window.
+
+        Args:
+            triggers (list[Trigger]):
+                Conditions to evaluate.
+            pre_seconds (float):
+                Seconds retained before each trigger.
+            post_seconds (float):
+                Seconds retained after each trigger.
+            armed (bool):
+                Retain only windows around triggers when True;
+                retain everything when False.
+
+        Returns:
+            None
+        """
+        with self.lock:
+            self.triggers = list(triggers)
+            self.pre_seconds = float(pre_seconds)
+            self.post_seconds = float(post_seconds)
+            self.armed = bool(armed) and bool(self.triggers)
+            self.ring.clear()
+            self._record_until = -np.inf
+            self._last = {}
+
+    def reset(self):
+        """
+        Forget trigger history, keeping the configuration.
+
+        Returns:
+            None
+        """
+        with self.lock:
+            self.ring.clear()
+            self.events.clear()
+            self.fired = 0
+            self._record_until = -np.inf
+            self._last = {}
+
+    def _fire_times(self, batch):
+        """
+        Timestamps of all samples that fire any trigger.
+
+        Args:
+            batch (dict):
+                Batch columns plus "has_rgb"/"has_light" masks.
+
+        Returns:
+            numpy.ndarray:
+                Sorted firing times.
+        """
+        t = batch["t"]
+        fired = np.zeros(len(t), dtype=bool)
+        for trig in self.triggers:
+            channels = ("r", "g", "b") if trig.channel == "rgb" else (trig.channel,)
+            for ch in channels:
+                valid = batch["has_light"] if ch == "light" else batch["has_rgb"]
+                idx = np.flatnonzero(valid)
+                if not len(idx):
+                    continue
+                key = (id(trig), ch)
+                hits = trig.evaluate(batch[ch][idx], self._last.get(key))
+                self._last[key] = float(batch[ch][idx[-1]])
+                if hits.any():
+                    fired[idx[hits]] = True
+                    first = idx[np.argmax(hits)]
+                    self.events.append((float(t[first]), trig.describe()))
+        self.fired += int(np.count_nonzero(fired))
+        return t[fired]
+
+    def process(self, batch):
+        """
+        Split one batch into pre-trigger rows and retained rows.
+
+        Args:
+            batch (dict):
+                "t", "r", "g", "b", "light" columns plus boolean
+                "has_rgb" and "has_light" masks.
+
+        Returns:
+            tuple:
+                (pre_rows, keep) where pre_rows is a dict of columns
+                flushed from the ring (or None) that precede the
+                batch, and keep is a boolean mask of batch rows to
+                retain.
+        """
+        with self.lock:
+            t = batch["t"]
+            fires = self._fire_times(batch)
+            keep = t <= self._record_until
+            pre_rows = None
+            if len(fires):
+                # A sample is kept when some trigger fired within
+                # [t - post_seconds, t + pre_seconds] of it
+                lo = np.searchsorted(fires, t - self.post_seconds, side="left")
+                hi = np.searchsorted(fires, t + self.pre_seconds, side="right")
+                keep |= hi > lo
+                if self.ring.count:
+                    pre_rows = self.ring.since(fires[0] - self.pre_seconds)
+                    self.ring.clear()
+                self._record_until = max(self._record_until, fires[-1] + self.post_seconds)
+            if not keep.all():
+                self.ring.append({name: batch[name][~keep] for name in PreTriggerRing.COLUMNS})
+            return pre_rows, keep
+
+
+class TriggerDialog(wx.Dialog):
+    """
+    Configure triggered acquisition for a stream hub.
+
+    One row per trigger kind; each row can be enabled with its own
+    channel, direction and threshold.
+
+    Args:
+        parent (wx.Window):
+            Parent window reference.
+        engine (TriggerEngine):
+            Engine to configure.
+    """
+    def __init__(self, parent, engine):
+        super(TriggerDialog, self).__init__(parent, title="Trigger Setup")
+        self.engine = engine
+        self.rows = {}
+
+        current = {trig.kind: trig for trig in engine.triggers}
+        grid = wx.FlexGridSizer(cols=5, hgap=8, vgap=6)
+        for label in ("", "Channel", "Direction", "Threshold", ""):
+            grid.Add(wx.StaticText(self, label=label))
+        for kind in TRIGGER_KINDS:
+            trig = current.get(kind)
+            enable = wx.CheckBox(self, label=kind.capitalize())
+            enable.SetValue(trig is not None)
+            channel = wx.Choice(self, choices=list(TRIGGER_CHANNEL_LABELS))
+            channel.SetSelection(TRIGGER_CHANNELS.index(trig.channel) if trig else 0)
+            direction = wx.Choice(self, choices=[d.capitalize() for d in TRIGGER_DIRECTIONS])
+            direction.SetSelection(TRIGGER_DIRECTIONS.index(trig.direction) if trig else 0)
+            threshold = wx.TextCtrl(self, value=f"{trig.threshold:g}" if trig else "0")
+            grid.AddMany([(enable, 0, wx.ALIGN_CENTER_VERTICAL), channel, direction, threshold, (0, 0)])
+            self.rows[kind] = (enable, channel, direction, threshold)
+
+        window = wx.BoxSizer(wx.HORIZONTAL)
+        window.Add(wx.StaticText(self, label="Pre-trigger (s):"), 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 5)
+        self.pre_ctrl = wx.TextCtrl(self, value=f"{engine.pre_seconds:g}", size=(60, -1))
+        window.Add(self.pre_ctrl, 0, wx.RIGHT, 15)
+        window.Add(wx.StaticText(self, label="Post-trigger (s):"), 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 5)
+        self.post_ctrl = wx.TextCtrl(self, value=f"{engine.post_seconds:g}", size=(60, -1))
+        window.Add(self.post_ctrl, 0)
+
+        self.armed_cb = wx.CheckBox(self, label="Keep only samples around triggers")
+        self.armed_cb.SetValue(engine.armed)
+        status = wx.StaticText(self, label=f"Trigger samples fired so far: {engine.fired}")
+
+        sizer = wx.BoxSizer(wx.VERTICAL)
+        sizer.Add(grid, 0, wx.ALL, 10)
+        sizer.Add(window, 0, wx.LEFT | wx.RIGHT | wx.BOTTOM, 10)
+        sizer.Add(self.armed_cb, 0, wx.LEFT | wx.RIGHT | wx.BOTTOM, 10)
+        sizer.Add(status, 0, wx.LEFT | wx.RIGHT | wx.BOTTOM, 10)
+        sizer.Add(self.CreateStdDialogButtonSizer(wx.OK | wx.CANCEL), 0, wx.EXPAND | wx.ALL, 10)
+        self.SetSizerAndFit(sizer)
+        self.Bind(wx.EVT_BUTTON, self.on_ok, id=wx.ID_OK)
+
+    def on_ok(self, event):
+        """
+        Validate the inputs and apply them to the engine.
+
+        Args:
+            event:
+                wx.CommandEvent from the OK button.
+
+        Returns:
+            None
+        """
+        try:
+            triggers = []
+            for kind, (enable, channel, direction, threshold) in self.rows.items():
+                if enable.GetValue():
+                    triggers.append(Trigger(kind,
+                                            TRIGGER_CHANNELS[channel.GetSelection()],
+                                            float(threshold.GetValue()),
+                                            TRIGGER_DIRECTIONS[direction.GetSelection()]))
+            pre = float(self.pre_ctrl.GetValue())
+            post = float(self.post_ctrl.GetValue())
+        except ValueError as exc:
+            wx.MessageBox(f"Invalid trigger setting:\n{exc}", "Error", wx.OK | wx.ICON_ERROR)
+            return
+        self.engine.configure(triggers, max(0.0, pre), max(0.0, post), self.armed_cb.GetValue())
+        event.Skip()
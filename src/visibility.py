@@ -0,0 +1,73 @@
+##############################################################################
+#
+# Module: visibility.py
+#
+# Description:
+#     Helpers for pausing plot rendering while a window cannot be
+#     seen, and catching up once it is shown or restored again.
+#
+# Author:
+#     Vinay N, MCCI Corporation October 2026
+#
+# Revision history:
+#     V2.2.0 Mon Oct 2026 19:10:2026   Vinay N
+#       Module created
+#
+##############################################################################
+# Third-party imports
+import wx
+
+#======================================================================
+# COMPONENTS
+#======================================================================
+
+
+def is_window_visible(window):
+    """
+    Check whether a window can currently be seen.
+
+    A window counts as hidden when it or any parent is hidden, or
+    its top-level frame is minimized. wx offers no portable way to
+    detect a window covered by other windows, so those still count
+    as visible.
+
+    Args:
+        window (wx.Window):
+            Window to check.
+
+    Returns:
+        bool
+    """
+    if not window:
+        return False
+    top = wx.GetTopLevelParent(window)
+    if top and top.IsIconized():
+        return False
+    return window.IsShownOnScreen()
+
+
+def bind_visibility(window, on_visible):
+    """
+    Call on_visible when a window's frame is shown or restored.
+
+    Binds EVT_SHOW and EVT_ICONIZE on the top-level parent. The
+    callback runs after the event has been handled, once the
+    window really is visible.
+
+    Args:
+        window (wx.Window):
+            Window whose top-level frame is watched.
+        on_visible (callable):
+            on_visible() with no arguments.
+
+    Returns:
+        None
+    """
+    top = wx.GetTopLevelParent(window)
+
+    def handler(event):
+        event.Skip()
+        wx.CallAfter(lambda: is_window_visible(window) and on_visible())
+
+    top.Bind(wx.EVT_SHOW, handler)
+    top.Bind(wx.EVT_ICONIZE, handler)